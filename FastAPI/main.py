@@ -3,12 +3,15 @@ Face Recognition Attendance System - Main Application
 Modular Monolith Architecture
 """
 import asyncio
+import os
+import anyio
 import uvicorn
 import logging
 import time
 import json
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from typing import Callable
@@ -24,12 +27,19 @@ logger = logging.getLogger("api")
 # Import service routers
 from services.auth_service.api.routes import router as auth_router
 from services.schedule_service.api.routes import router as schedule_router
+from services.schedule_service.services import ScheduleValidationError
 from services.attendance_service.api.routes import router as attendance_router
 from services.ai_service.api.routes import router as ai_router
 from services.notification_service.api.routes import router as notification_router
 from services.notification_service.api.websocket import websocket_router as notification_ws_router
 from services.stats_service.api.routes import router as stats_router
 
+from shared.database.connection import get_pool_limits
+
+# Worker threads beyond the database pool's capacity, for sync routes that
+# do not hold a connection (health checks, AI inference)
+THREADPOOL_HEADROOM = 10
+
 # Import background tasks
 from services.attendance_service.tasks.session_tasks import session_cleanup_loop
 
@@ -127,7 +137,23 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
     Handles startup and shutdown events.
     """
-    # Startup: Start background tasks
+    # Startup: sync route handlers and their DB sessions run on AnyIO's
+    # worker threads (40 by default). A thread beyond the engine pool's
+    # capacity would only block on pool_timeout while holding a token, so
+    # size the limiter from the pool, plus headroom for routes that never
+    # touch the database
+    pool_size, max_overflow = get_pool_limits()
+    db_capacity = pool_size + max_overflow
+    threadpool_size = int(os.getenv("THREADPOOL_SIZE", db_capacity + THREADPOOL_HEADROOM))
+    if threadpool_size > db_capacity + THREADPOOL_HEADROOM:
+        logger.warning(
+            "THREADPOOL_SIZE=%d exceeds the database pool (%d connections); "
+            "excess requests will time out waiting for a connection instead of queueing",
+            threadpool_size, db_capacity
+        )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threadpool_size
+    
+    # Start background tasks
     cleanup_task = asyncio.create_task(session_cleanup_loop(interval_seconds=60))
     
     yield
@@ -155,7 +181,9 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes responses several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
@@ -172,11 +200,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Add request logging middleware
 app.add_middleware(RequestLoggingMiddleware)
 
+
+# The schedule service rejects bad input (unknown IDs, duplicates,
+# conflicts) with ScheduleValidationError; translate it to 400 here instead
+# of in every route. Other exceptions, ValueError included, stay 500s.
+@app.exception_handler(ScheduleValidationError)
+async def schedule_validation_error_handler(request: Request, exc: ScheduleValidationError):
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+
 # Include Service Routers
 app.include_router(
     auth_router,
@@ -239,4 +277,11 @@ def health_check():
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        ws_ping_interval=20.0,  # Protocol-level keep-alive for notification WebSockets
+        ws_ping_timeout=20.0,
+    )
\ No newline at end of file
@@ -1,10 +1,11 @@
 """
 Attendance Session model for tracking class attendance periods.
 """
-from sqlalchemy import Column, String, ForeignKey, DateTime, Integer, Boolean
+from sqlalchemy import Column, String, ForeignKey, DateTime, Integer, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
+from typing import Optional
 import uuid
 
 from shared.database.base import Base, TimestampMixin
@@ -47,6 +48,17 @@ class AttendanceSession(Base, TimestampMixin):
     started_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     ended_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
+    __table_args__ = (
+        # Partial index over the few active sessions: class state lookups
+        # and the schedule ETag marker never touch finished sessions
+        Index(
+            "ix_attendance_sessions_active",
+            "class_id", "start_time",
+            postgresql_where=text("state = 'active'"),
+            sqlite_where=text("state = 'active'"),
+        ),
+    )
+    
     # Relationships
     records = relationship("AttendanceRecord", back_populates="session", cascade="all, delete-orphan")
 
@@ -61,22 +73,31 @@ class AttendanceSession(Base, TimestampMixin):
         """Check if attendance can be marked in this session."""
         return self.state == "active"
 
-    def get_duration_minutes(self) -> int:
-        """Get session duration in minutes."""
-        end = self.end_time or datetime.now(timezone.utc)
+    def get_duration_minutes(self, now: Optional[datetime] = None) -> int:
+        """
+        Get session duration in minutes.
+        
+        Args:
+            now: Reference time; pass one value when evaluating several
+                checks together so they agree. Defaults to the current time.
+        """
+        end = self.end_time or now or datetime.now(timezone.utc)
         delta = end - self.start_time
         return int(delta.total_seconds() / 60)
 
     @property
     def is_auto_recognition_active(self) -> bool:
         """Check if automatic face recognition is still active."""
+        return self.auto_recognition_active_at()
+
+    def auto_recognition_active_at(self, now: Optional[datetime] = None) -> bool:
+        """Check if automatic face recognition is active at the given time."""
         if self.state != "active":
             return False
-        elapsed = self.get_duration_minutes()
-        return elapsed <= self.auto_recognition_window_minutes
+        return self.get_duration_minutes(now) <= self.auto_recognition_window_minutes
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if session has exceeded max duration."""
         if self.state != "active":
             return False
-        return self.get_duration_minutes() >= self.max_duration_minutes
+        return self.get_duration_minutes(now) >= self.max_duration_minutes
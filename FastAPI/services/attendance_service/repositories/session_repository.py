@@ -1,11 +1,11 @@
 """
 Session Repository for attendance session data access.
 """
-from typing import Optional, List
+from typing import Optional, List, Set
 from uuid import UUID
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
 
 from ..models.attendance_session import AttendanceSession
 
@@ -38,6 +38,29 @@ class SessionRepository:
             )
         ).first()
     
+    def find_active_class_ids(self, class_ids: List[UUID]) -> Set[UUID]:
+        """Find which of the given classes have an active session, in one query."""
+        if not class_ids:
+            return set()
+        rows = self.db.query(AttendanceSession.class_id).filter(
+            and_(
+                AttendanceSession.class_id.in_(class_ids),
+                AttendanceSession.state == "active"
+            )
+        ).distinct().all()
+        return {row[0] for row in rows}
+    
+    def active_fingerprint(self) -> tuple:
+        """
+        Change marker for the set of active sessions: (count, max(start_time)).
+        
+        Starting a session raises max(start_time); ending one drops the count.
+        """
+        stmt = select(func.count(), func.max(AttendanceSession.start_time)).where(
+            AttendanceSession.state == "active"
+        )
+        return tuple(self.db.execute(stmt).one())
+    
     def find_by_class(self, class_id: UUID, skip: int = 0, limit: int = 100) -> List[AttendanceSession]:
         """Find all sessions for a class."""
         return self.db.query(AttendanceSession).filter(
@@ -233,15 +233,17 @@ class AttendanceService:
         if not context.can_mark_attendance():
             raise ValueError(f"Cannot mark attendance - session is {session.state}")
         
+        # One clock read: the lateness check and marked_at must agree
+        now = datetime.now(timezone.utc)
+        
         # Check if late
         if status == "present" and session.late_threshold_minutes:
-            elapsed = (datetime.now(timezone.utc) - session.start_time).total_seconds() / 60
+            elapsed = (now - session.start_time).total_seconds() / 60
             if elapsed > session.late_threshold_minutes:
                 status = "late"
         
         # Find or create record
         record = self.attendance_repo.find_by_session_and_student(session_id, student_id)
-        now = datetime.now(timezone.utc)
         
         if record:
             record.status = status
@@ -358,10 +360,11 @@ class AttendanceService:
             raise ValueError("Session not found")
         
         # Check if auto-recognition is still active
-        if not session.is_auto_recognition_active:
+        now = datetime.now(timezone.utc)
+        if not session.auto_recognition_active_at(now):
             raise ValueError(
                 f"Auto-recognition window has expired. "
-                f"Session started {session.get_duration_minutes()} minutes ago, "
+                f"Session started {session.get_duration_minutes(now)} minutes ago, "
                 f"window is {session.auto_recognition_window_minutes} minutes. "
                 f"Please use manual attendance marking."
             )
@@ -422,10 +425,13 @@ class AttendanceService:
         if not session:
             raise ValueError("Session not found")
         
-        elapsed = session.get_duration_minutes()
+        # Evaluate every field at the same instant, so a request landing on
+        # the window boundary cannot report is_active with 0 remaining
+        now = datetime.now(timezone.utc)
+        elapsed = session.get_duration_minutes(now)
         window = session.auto_recognition_window_minutes
         remaining = max(0, window - elapsed)
-        is_active = session.is_auto_recognition_active
+        is_active = session.auto_recognition_active_at(now)
         
         return {
             "is_active": is_active,
@@ -1,12 +1,58 @@
 """
 User Repository implementing Repository pattern.
 """
-from typing import Optional, List
+import threading
+from typing import Any, Dict, Optional, List
 from uuid import UUID
+from cachetools import TTLCache
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from shared.models.user import User
+from shared.models.enums import UserRole
+
+# In-process memo of (id, full_name, email) rows for find_contacts. Entries
+# are dropped once this process commits an edit or delete of the user;
+# changes made by another worker show up once the entry expires.
+_contacts = TTLCache(maxsize=4096, ttl=60)
+_contacts_lock = threading.Lock()
+
+# Fields served by find_contacts; editing any other field keeps the memo
+CONTACT_FIELDS = ("full_name", "email")
+
+# Session.info keys collecting the users whose contact rows must be dropped,
+# and whether a mentor's contact changed, once the transaction commits
+_PENDING_CONTACTS = "user_contact_invalidations"
+_PENDING_MENTOR_CHANGE = "user_mentor_contact_changed"
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_committed_contacts(session: Session) -> None:
+    """
+    Drop memoized contacts after the edit is committed.
+    
+    Repositories only flush; dropping the entry earlier would let a
+    concurrent find_contacts re-memoize the old committed row. The cached
+    course listings embed mentor names and emails, so a mentor's change
+    invalidates them too.
+    """
+    user_ids = session.info.pop(_PENDING_CONTACTS, None)
+    mentor_changed = session.info.pop(_PENDING_MENTOR_CHANGE, False)
+    if user_ids:
+        with _contacts_lock:
+            for user_id in user_ids:
+                _contacts.pop(user_id, None)
+    if mentor_changed:
+        from services.schedule_service.cache import get_schedule_cache
+        get_schedule_cache().invalidate_listings()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_contacts(session: Session) -> None:
+    """Rolled-back edits changed nothing, so there is nothing to drop."""
+    session.info.pop(_PENDING_CONTACTS, None)
+    session.info.pop(_PENDING_MENTOR_CHANGE, None)
 
 
 class UserRepository:
@@ -18,6 +64,12 @@ class UserRepository:
     def __init__(self, db: Session):
         self.db = db
     
+    def _drop_contact_after_commit(self, user: User) -> None:
+        """Schedule the user's memoized contact row to be dropped on commit."""
+        self.db.info.setdefault(_PENDING_CONTACTS, set()).add(user.id)
+        if user.role == UserRole.MENTOR.value:
+            self.db.info[_PENDING_MENTOR_CHANGE] = True
+    
     def create(self, user: User) -> User:
         """
         Create a new user.
@@ -44,6 +96,44 @@ class UserRepository:
         """Find user by ID."""
         return self.db.query(User).filter(User.id == user_id).first()
     
+    def find_role(self, user_id: UUID) -> Optional[str]:
+        """Get just a user's role (None if the user doesn't exist), without loading the row."""
+        return self.db.query(User.role).filter(User.id == user_id).scalar()
+    
+    def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        """Find all users with the given IDs in one query (order not preserved)."""
+        if not user_ids:
+            return []
+        return self.db.query(User).filter(User.id.in_(user_ids)).all()
+    
+    def find_contacts(self, user_ids: List[UUID]) -> Dict[UUID, Any]:
+        """
+        Get (id, full_name, email) rows for several users.
+        
+        Rows are memoized in-process for a short time, so repeated lookups
+        (e.g. course mentors on every courses request) are dict hits; only
+        the IDs not yet cached are fetched, in one query.
+        
+        Args:
+            user_ids: IDs of the users
+            
+        Returns:
+            Dict mapping each found user ID to its row
+        """
+        with _contacts_lock:
+            contacts = {uid: _contacts[uid] for uid in user_ids if uid in _contacts}
+        missing = [uid for uid in user_ids if uid not in contacts]
+        if missing:
+            rows = (
+                self.db.query(User.id, User.full_name, User.email)
+                .filter(User.id.in_(missing))
+                .all()
+            )
+            with _contacts_lock:
+                for row in rows:
+                    contacts[row.id] = _contacts[row.id] = row
+        return contacts
+    
     def find_by_email(self, email: str) -> Optional[User]:
         """
         Find user by email address.
@@ -83,6 +173,9 @@ class UserRepository:
         if not user:
             return None
         
+        if any(kwargs.get(field) is not None for field in CONTACT_FIELDS):
+            self._drop_contact_after_commit(user)
+        
         for key, value in kwargs.items():
             if hasattr(user, key) and value is not None:
                 setattr(user, key, value)
@@ -105,6 +198,7 @@ class UserRepository:
         if not user:
             return False
         
+        self._drop_contact_after_commit(user)
         self.db.delete(user)
         self.db.flush()
         return True
@@ -11,6 +11,7 @@ Design Patterns Used:
 - Repository Pattern: NotificationRepository abstracts data access
 - Observer Pattern: NotificationSubject + WebSocketObserver for real-time delivery
 - Singleton Pattern: NotificationSubject is a singleton
+- Cache-Aside Pattern: NotificationCache holds counts and first-page listings
 
 Usage:
     from services.notification_service.services import NotificationService
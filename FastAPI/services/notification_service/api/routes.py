@@ -2,11 +2,13 @@
 FastAPI routes for notification service.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from shared.database.connection import get_db_session
+from shared.pagination import CREATED_CURSOR, encode_cursor, decode_cursor_param
 from ..services.notification_service import NotificationService
 from ..schemas.request import NotificationCreate, BroadcastNotification
 from ..schemas.response import NotificationResponse, NotificationListResponse
@@ -18,7 +20,7 @@ router = APIRouter()
 
 @router.get("/", response_model=List[NotificationResponse])
 def get_notifications(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db_session)
 ):
@@ -42,7 +44,7 @@ def get_notification_types(db: Session = Depends(get_db_session)):
 @router.get("/user/{user_id}", response_model=NotificationListResponse)
 def get_user_notifications(
     user_id: UUID,
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db_session)
 ):
@@ -50,33 +52,51 @@ def get_user_notifications(
     Get all notifications for a specific user.
     
     - **user_id**: UUID of the user
-    - **skip**: Number of records to skip (pagination)
+    - **cursor**: `next_cursor` from the previous page (omit for the first page)
     - **limit**: Maximum number of records to return
+    
+    `total` and `unread_count` are only returned with the first page;
+    follow-up pages rely on `has_more` and skip the COUNT query.
     """
     service = NotificationService(db)
-    notifications = service.get_user_notifications(user_id, skip=skip, limit=limit)
-    counts = service.get_notification_counts(user_id)
-    
-    return NotificationListResponse(
-        notifications=[NotificationResponse.model_validate(n) for n in notifications],
-        total=counts["total"],
-        unread_count=counts["unread"],
-        skip=skip,
-        limit=limit
+    page_cursor = decode_cursor_param(cursor, CREATED_CURSOR)
+    notifications, next_cursor = service.get_user_notifications(
+        user_id, cursor=page_cursor, limit=limit
     )
+    counts = service.get_notification_counts(user_id) if page_cursor is None else {}
+    
+    # Rows map 1:1 onto NotificationResponse; orjson encodes them directly
+    # instead of validating a model per row
+    return ORJSONResponse({
+        "notifications": [n.to_dict() for n in notifications],
+        "total": counts.get("total"),
+        "unread_count": counts.get("unread"),
+        "has_more": next_cursor is not None,
+        "next_cursor": encode_cursor(next_cursor),
+        "limit": limit,
+    })
 
 
 @router.get("/user/{user_id}/unread", response_model=List[NotificationResponse])
 def get_unread_notifications(
     user_id: UUID,
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db_session)
 ):
-    """Get unread notifications for a user."""
+    """
+    Get unread notifications for a user.
+    
+    The cursor for the next page, if any, is returned in the X-Next-Cursor header.
+    """
     service = NotificationService(db)
-    notifications = service.get_unread_notifications(user_id, skip=skip, limit=limit)
-    return [NotificationResponse.model_validate(n) for n in notifications]
+    notifications, next_cursor = service.get_unread_notifications(
+        user_id, cursor=decode_cursor_param(cursor, CREATED_CURSOR), limit=limit
+    )
+    headers = {}
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = encode_cursor(next_cursor)
+    return ORJSONResponse([n.to_dict() for n in notifications], headers=headers)
 
 
 @router.get("/user/{user_id}/count")
@@ -157,7 +177,8 @@ async def broadcast_notification(
     Broadcast a notification to multiple users.
     
     Creates notifications for all specified users and delivers via WebSocket
-    to those who are connected.
+    to those who are connected. Transient types (class_started, class_ended)
+    are only delivered and the response list is empty.
     """
     try:
         service = NotificationService(db)
@@ -166,7 +187,10 @@ async def broadcast_notification(
             user_ids=broadcast_data.user_ids,
             data=broadcast_data.data
         )
-        return [NotificationResponse.model_validate(n) for n in notifications]
+        return ORJSONResponse(
+            [n.to_dict() for n in notifications],
+            status_code=status.HTTP_201_CREATED
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
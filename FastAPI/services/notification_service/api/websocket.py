@@ -1,12 +1,12 @@
 """
 WebSocket endpoint for real-time notifications.
 """
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 import logging
 import json
 
-from shared.database.connection import get_db_session, DatabaseConnection
+from shared.database.connection import session_scope
+from shared.serialization import MSGPACK_AVAILABLE, msgpack_loads
 from ..observer.subject import notification_subject
 from ..observer.websocket_observer import WebSocketObserver
 from ..services.notification_service import NotificationService
@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 
 websocket_router = APIRouter()
 
+# Subprotocol clients request to receive msgpack binary frames instead of JSON
+MSGPACK_SUBPROTOCOL = "msgpack"
+
 
 @websocket_router.websocket("/ws/{user_id}")
 async def websocket_endpoint(websocket: WebSocket, user_id: str):
@@ -29,9 +32,10 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
         
     Protocol:
         - Client connects with user_id in URL
-        - Server sends notifications as JSON messages
-        - Client can send "ping" messages to keep connection alive
-        - Server responds with "pong" to ping messages
+        - Server sends notifications as JSON messages, or as msgpack binary
+          frames when the client requests the "msgpack" subprotocol
+        - Keep-alive uses WebSocket protocol PING/PONG control frames,
+          answered by the ASGI server (see ws_ping_interval in main.py)
         
     Message format (server -> client):
         {
@@ -46,88 +50,71 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
                 "created_at": "iso8601"
             }
         }
+        
+        Transient types (e.g. class_started) carry "transient": true in the
+        payload; they are live toasts and are not stored server-side.
+        
+        Notifications that pile up while a previous send is still being
+        written are delivered together as
+        {"type": "notification_batch", "payload": [{...}, {...}]}
     """
-    await websocket.accept()
+    # Negotiate wire format; plain JSON stays the default
+    binary = MSGPACK_AVAILABLE and MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if binary else None)
     logger.info(f"WebSocket connection accepted for user {user_id}")
     
     # Create observer for this connection
-    observer = WebSocketObserver(websocket, user_id)
+    observer = WebSocketObserver(websocket, user_id, binary=binary)
     
     # Attach observer to subject
     notification_subject.attach(observer)
     
     try:
         # Send welcome message
-        await websocket.send_json({
-            "type": "connected",
-            "payload": {
-                "message": "Connected to notification service",
-                "user_id": user_id
-            }
+        await observer.send_message("connected", {
+            "message": "Connected to notification service",
+            "user_id": user_id
         })
         
         # Send unread count on connect
-        db_connection = DatabaseConnection()
-        session = db_connection.create_session()
-        try:
-            service = NotificationService(session)
-            counts = service.get_notification_counts(user_id)
-            await websocket.send_json({
-                "type": "unread_count",
-                "payload": counts
-            })
-        finally:
-            session.close()
+        with session_scope() as session:
+            counts = NotificationService(session).get_notification_counts(user_id)
+        await observer.send_message("unread_count", counts)
         
         # Keep connection alive and handle incoming messages
         while True:
             try:
                 # Wait for messages from client
-                data = await websocket.receive_text()
-                message = json.loads(data)
+                if binary:
+                    message = msgpack_loads(await websocket.receive_bytes())
+                else:
+                    message = json.loads(await websocket.receive_text())
                 
                 # Handle different message types
-                if message.get("type") == "ping":
-                    await websocket.send_json({
-                        "type": "pong",
-                        "payload": {}
-                    })
-                
-                elif message.get("type") == "mark_read":
+                if message.get("type") == "mark_read":
                     # Client wants to mark notification as read
                     notification_id = message.get("payload", {}).get("notification_id")
                     if notification_id:
-                        session = db_connection.create_session()
-                        try:
-                            service = NotificationService(session)
-                            service.mark_as_read(notification_id)
-                            session.commit()
-                            await websocket.send_json({
-                                "type": "marked_read",
-                                "payload": {"notification_id": notification_id}
-                            })
-                        finally:
-                            session.close()
+                        with session_scope() as session:
+                            NotificationService(session).mark_as_read(notification_id)
+                        await observer.send_message(
+                            "marked_read",
+                            {"notification_id": notification_id}
+                        )
                 
                 elif message.get("type") == "get_unread_count":
                     # Client requests unread count
-                    session = db_connection.create_session()
-                    try:
-                        service = NotificationService(session)
-                        counts = service.get_notification_counts(user_id)
-                        await websocket.send_json({
-                            "type": "unread_count",
-                            "payload": counts
-                        })
-                    finally:
-                        session.close()
+                    with session_scope() as session:
+                        counts = NotificationService(session).get_notification_counts(user_id)
+                    await observer.send_message("unread_count", counts)
                 
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON received from user {user_id}")
-                await websocket.send_json({
-                    "type": "error",
-                    "payload": {"message": "Invalid JSON format"}
-                })
+            except ValueError:
+                # json.JSONDecodeError and msgpack decode errors are ValueErrors
+                logger.warning(f"Invalid message received from user {user_id}")
+                await observer.send_message(
+                    "error",
+                    {"message": "Invalid message format"}
+                )
                 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for user {user_id}")
@@ -0,0 +1,6 @@
+"""
+Notification service cache layer.
+"""
+from .notification_cache import NotificationCache
+
+__all__ = ['NotificationCache']
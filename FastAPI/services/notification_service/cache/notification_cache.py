@@ -0,0 +1,139 @@
+"""
+Notification cache implementing Cache-Aside pattern.
+"""
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from shared.cache.cache_manager import CacheManager
+from shared.serialization import json_dumps_str, json_loads
+from ..models.notification import Notification
+from ..repositories.notification_repository import Cursor
+
+# Listings are only cached for the first page at the default page size,
+# which is what the notification badge and dropdown poll
+FIRST_PAGE_LIMIT = 50
+
+Page = Tuple[List[Notification], Optional[Cursor]]
+
+
+class NotificationCache:
+    """
+    Cache manager for notification counts and first-page listings.
+    
+    Entries are short-lived and explicitly invalidated on every write
+    for the affected user.
+    """
+    
+    def __init__(self):
+        self.cache = CacheManager.get_instance()
+        self.ttl = 30  # seconds
+    
+    def _make_key(self, prefix: str, user_id: UUID) -> str:
+        """Generate cache key."""
+        return f"notif:{prefix}:{user_id}"
+    
+    def get_counts(self, user_id: UUID) -> Optional[dict]:
+        """
+        Get cached notification counts for a user.
+        
+        Args:
+            user_id: UUID of the user
+            
+        Returns:
+            Dict with total and unread counts, or None
+        """
+        cached = self.cache.get(self._make_key("counts", user_id))
+        if cached:
+            return json_loads(cached)
+        return None
+    
+    def set_counts(self, user_id: UUID, counts: dict) -> None:
+        """
+        Cache notification counts for a user.
+        
+        Args:
+            user_id: UUID of the user
+            counts: Dict with total and unread counts
+        """
+        self.cache.set(self._make_key("counts", user_id), json_dumps_str(counts), ttl=self.ttl)
+    
+    def get_first_page(self, user_id: UUID, unread_only: bool) -> Optional[Page]:
+        """
+        Get the cached first page of notifications for a user.
+        
+        Args:
+            user_id: UUID of the user
+            unread_only: Whether this is the unread listing
+            
+        Returns:
+            Tuple of (notifications, next_cursor), or None
+        """
+        cached = self.cache.get(self._list_key(user_id, unread_only))
+        if not cached:
+            return None
+        page = json_loads(cached)
+        notifications = [self._to_notification(item) for item in page["notifications"]]
+        next_cursor = page["next_cursor"]
+        if next_cursor is not None:
+            next_cursor = (datetime.fromisoformat(next_cursor[0]), UUID(next_cursor[1]))
+        return notifications, next_cursor
+    
+    def set_first_page(self, user_id: UUID, unread_only: bool, page: Page) -> None:
+        """
+        Cache the first page of notifications for a user.
+        
+        Args:
+            user_id: UUID of the user
+            unread_only: Whether this is the unread listing
+            page: Tuple of (notifications, next_cursor)
+        """
+        notifications, next_cursor = page
+        value = json_dumps_str({
+            "notifications": [notification.to_dict() for notification in notifications],
+            "next_cursor": next_cursor,
+        })
+        self.cache.set(self._list_key(user_id, unread_only), value, ttl=self.ttl)
+    
+    def invalidate_users(self, user_ids: Iterable[UUID]) -> None:
+        """
+        Invalidate all cached notification data for the given users.
+        
+        Args:
+            user_ids: UUIDs of the affected users
+        """
+        keys = []
+        for user_id in set(user_ids):
+            keys.append(self._make_key("counts", user_id))
+            keys.append(self._list_key(user_id, False))
+            keys.append(self._list_key(user_id, True))
+        if keys:
+            self.cache.delete(*keys)
+    
+    def invalidate_user(self, user_id: UUID) -> None:
+        """
+        Invalidate all cached notification data for a user.
+        
+        Args:
+            user_id: UUID of the user
+        """
+        self.invalidate_users([user_id])
+    
+    def _list_key(self, user_id: UUID, unread_only: bool) -> str:
+        """Generate first-page listing key."""
+        kind = "unread" if unread_only else "all"
+        return f"{self._make_key('list', user_id)}:{kind}:0:{FIRST_PAGE_LIMIT}"
+    
+    @staticmethod
+    def _to_notification(item: dict) -> Notification:
+        """Rebuild a detached Notification from its cached dict."""
+        return Notification(
+            id=UUID(item["id"]),
+            user_id=UUID(item["user_id"]),
+            type=item["type"],
+            title=item["title"],
+            message=item["message"],
+            data=item["data"],
+            is_read=item["is_read"],
+            created_at=datetime.fromisoformat(item["created_at"]),
+        )
@@ -30,6 +30,10 @@ class NotificationFactory:
     ENROLLMENT_REMOVED = "enrollment_removed"
     SYSTEM_ANNOUNCEMENT = "system_announcement"
     
+    # Live UI toasts that are only useful while the user is online; they are
+    # delivered over WebSocket and never stored
+    TRANSIENT_TYPES = frozenset({CLASS_STARTED, CLASS_ENDED})
+    
     @classmethod
     def create_notification(
         cls,
@@ -251,6 +255,19 @@ class NotificationFactory:
             data=data
         )
     
+    @classmethod
+    def is_persistent(cls, notification_type: str) -> bool:
+        """
+        Check whether notifications of a type are stored in the database.
+        
+        Args:
+            notification_type: Type of notification
+            
+        Returns:
+            False for transient (WebSocket-only) types
+        """
+        return notification_type not in cls.TRANSIENT_TYPES
+    
     @classmethod
     def get_supported_types(cls) -> list:
         """Get list of supported notification types."""
@@ -3,8 +3,8 @@ Notification SQLAlchemy model.
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
 from shared.database.base import Base
@@ -31,25 +31,41 @@ class Notification(Base):
     type = Column(String(50), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
-    data = Column(JSON, nullable=True)
+    data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     is_read = Column(Boolean, default=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     # Relationship to user (optional, depends on User model availability)
     # user = relationship("User", back_populates="notifications")
 
+    # Composite indexes backing keyset pagination on (created_at, id) desc;
+    # unread listings/counts use a much smaller partial index
+    __table_args__ = (
+        Index("ix_notifications_user_created_id", user_id, created_at.desc(), id.desc()),
+        Index(
+            "idx_notifications_unread",
+            user_id, created_at.desc(), id.desc(),
+            postgresql_where=(is_read == False)
+        ),
+    )
+
     def __repr__(self):
         return f"<Notification(id={self.id}, type={self.type}, user_id={self.user_id})>"
 
     def to_dict(self):
-        """Convert notification to dictionary."""
+        """
+        Convert notification to dictionary.
+        
+        UUID and datetime values are returned as-is; serialize the result
+        with shared.serialization (orjson) which encodes them natively.
+        """
         return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
+            "id": self.id,
+            "user_id": self.user_id,
             "type": self.type,
             "title": self.title,
             "message": self.message,
             "data": self.data,
             "is_read": self.is_read,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at
         }
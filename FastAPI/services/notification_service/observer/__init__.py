@@ -1,11 +1,12 @@
 """Notification observer module."""
 from .observer import INotificationObserver
 from .subject import NotificationSubject, notification_subject
-from .websocket_observer import WebSocketObserver
+from .websocket_observer import WebSocketObserver, PreparedNotification
 
 __all__ = [
     "INotificationObserver",
     "NotificationSubject",
     "notification_subject",
-    "WebSocketObserver"
+    "WebSocketObserver",
+    "PreparedNotification"
 ]
@@ -14,6 +14,8 @@ class INotificationObserver(ABC):
     when the NotificationSubject broadcasts them.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     async def update(self, notification: Any) -> bool:
         """
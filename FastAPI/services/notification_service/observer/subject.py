@@ -2,8 +2,9 @@
 Notification Subject implementing Observer pattern.
 Manages observers and broadcasts notifications.
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from uuid import UUID
+import itertools
 import logging
 import asyncio
 
@@ -11,6 +12,9 @@ from .observer import INotificationObserver
 
 logger = logging.getLogger(__name__)
 
+# Observers are sharded by the first byte of the user ID (UUID hex prefix)
+SHARD_COUNT = 256
+
 
 class NotificationSubject:
     """
@@ -19,6 +23,9 @@ class NotificationSubject:
     Implements the Subject part of the Observer pattern.
     Maintains a list of observers and notifies them when
     notifications need to be delivered.
+    
+    Observers are kept in SHARD_COUNT small dicts keyed by user ID prefix,
+    so walking connected users never materializes one list of every key.
     """
     
     _instance: Optional['NotificationSubject'] = None
@@ -35,11 +42,21 @@ class NotificationSubject:
         if self._initialized:
             return
         
-        # Map of user_id -> list of observers
-        self._observers: Dict[str, List[INotificationObserver]] = {}
+        # Shards of user_id -> list of observers
+        self._shards: List[Dict[str, List[INotificationObserver]]] = [
+            {} for _ in range(SHARD_COUNT)
+        ]
         self._initialized = True
         logger.info("NotificationSubject initialized")
     
+    def _shard(self, user_id: str) -> Dict[str, List[INotificationObserver]]:
+        """Get the shard holding observers for a user."""
+        try:
+            index = int(user_id[:2], 16)
+        except ValueError:
+            index = hash(user_id) % SHARD_COUNT
+        return self._shards[index]
+    
     def attach(self, observer: INotificationObserver) -> None:
         """
         Attach an observer to receive notifications.
@@ -48,14 +65,12 @@ class NotificationSubject:
             observer: The observer to attach
         """
         user_id = observer.get_user_id()
-        
-        if user_id not in self._observers:
-            self._observers[user_id] = []
+        observers = self._shard(user_id).setdefault(user_id, [])
         
         # Avoid duplicate observers
-        if observer not in self._observers[user_id]:
-            self._observers[user_id].append(observer)
-            logger.info(f"Observer attached for user {user_id}. Total observers: {len(self._observers[user_id])}")
+        if observer not in observers:
+            observers.append(observer)
+            logger.info("Observer attached for user %s. Total observers: %d", user_id, len(observers))
     
     def detach(self, observer: INotificationObserver) -> None:
         """
@@ -65,15 +80,16 @@ class NotificationSubject:
             observer: The observer to detach
         """
         user_id = observer.get_user_id()
+        shard = self._shard(user_id)
         
-        if user_id in self._observers:
+        if user_id in shard:
             try:
-                self._observers[user_id].remove(observer)
-                logger.info(f"Observer detached for user {user_id}")
+                shard[user_id].remove(observer)
+                logger.info("Observer detached for user %s", user_id)
                 
                 # Clean up empty lists
-                if not self._observers[user_id]:
-                    del self._observers[user_id]
+                if not shard[user_id]:
+                    del shard[user_id]
             except ValueError:
                 pass  # Observer not in list
     
@@ -88,20 +104,21 @@ class NotificationSubject:
         Returns:
             Number of observers successfully notified
         """
-        if user_id not in self._observers:
-            logger.debug(f"No observers for user {user_id}")
+        shard = self._shard(user_id)
+        if user_id not in shard:
+            logger.debug("No observers for user %s", user_id)
             return 0
         
         # Clean up inactive observers first
         self._cleanup_inactive_observers(user_id)
         
-        if user_id not in self._observers:
+        if user_id not in shard:
             return 0
         
         success_count = 0
         failed_observers = []
         
-        for observer in self._observers[user_id]:
+        for observer in shard[user_id]:
             try:
                 if observer.is_active():
                     result = await observer.update(notification)
@@ -110,14 +127,15 @@ class NotificationSubject:
                 else:
                     failed_observers.append(observer)
             except Exception as e:
-                logger.error(f"Error notifying observer for user {user_id}: {e}")
+                logger.error("Error notifying observer for user %s: %s", user_id, e)
                 failed_observers.append(observer)
         
         # Remove failed observers
         for observer in failed_observers:
             self.detach(observer)
         
-        logger.info(f"Notified {success_count} observers for user {user_id}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Notified %d observers for user %s", success_count, user_id)
         return success_count
     
     async def notify_many(self, user_ids: List[str], notification: dict) -> Dict[str, int]:
@@ -139,7 +157,7 @@ class NotificationSubject:
         
         for user_id, count in zip(user_ids, counts):
             if isinstance(count, Exception):
-                logger.error(f"Error notifying user {user_id}: {count}")
+                logger.error("Error notifying user %s: %s", user_id, count)
                 results[user_id] = 0
             else:
                 results[user_id] = count
@@ -157,25 +175,30 @@ class NotificationSubject:
             Total number of successful deliveries
         """
         total = 0
-        for user_id in list(self._observers.keys()):
-            count = await self.notify(user_id, notification)
-            total += count
+        for shard in self._shards:
+            if not shard:
+                continue
+            # Snapshot one shard at a time; notify() may detach observers
+            for user_id in list(shard):
+                count = await self.notify(user_id, notification)
+                total += count
         return total
     
     def _cleanup_inactive_observers(self, user_id: str) -> None:
         """Remove inactive observers for a user."""
-        if user_id not in self._observers:
+        shard = self._shard(user_id)
+        if user_id not in shard:
             return
         
         active_observers = [
-            obs for obs in self._observers[user_id] 
+            obs for obs in shard[user_id] 
             if obs.is_active()
         ]
         
         if active_observers:
-            self._observers[user_id] = active_observers
+            shard[user_id] = active_observers
         else:
-            del self._observers[user_id]
+            del shard[user_id]
     
     def get_observer_count(self, user_id: Optional[str] = None) -> int:
         """
@@ -188,8 +211,17 @@ class NotificationSubject:
             Number of observers
         """
         if user_id:
-            return len(self._observers.get(user_id, []))
-        return sum(len(obs) for obs in self._observers.values())
+            return len(self._shard(user_id).get(user_id, []))
+        return sum(len(obs) for shard in self._shards for obs in shard.values())
+    
+    def iter_connected_users(self) -> Iterator[str]:
+        """
+        Iterate over user IDs with active observers without copying them.
+        
+        Returns:
+            Iterator of user IDs
+        """
+        return itertools.chain.from_iterable(self._shards)
     
     def get_connected_users(self) -> List[str]:
         """
@@ -198,7 +230,16 @@ class NotificationSubject:
         Returns:
             List of user IDs
         """
-        return list(self._observers.keys())
+        return list(self.iter_connected_users())
+    
+    def get_connected_users_count(self) -> int:
+        """
+        Get the number of users with active observers.
+        
+        Returns:
+            Number of connected users
+        """
+        return sum(len(shard) for shard in self._shards)
     
     def is_user_connected(self, user_id: str) -> bool:
         """
@@ -210,7 +251,7 @@ class NotificationSubject:
         Returns:
             True if user has active observers
         """
-        return user_id in self._observers and len(self._observers[user_id]) > 0
+        return len(self._shard(user_id).get(user_id, ())) > 0
 
 
 # Global instance for easy access
@@ -1,15 +1,35 @@
 """
 WebSocket Observer for real-time notification delivery.
 """
-import json
+import asyncio
 import logging
-from typing import Any
+from typing import Any, List, Optional, Tuple
 from fastapi import WebSocket
 
+from shared.serialization import json_dumps_str, msgpack_dumps
 from .observer import INotificationObserver
 
 logger = logging.getLogger(__name__)
 
+# Messages a connection may fall behind by before it is dropped as too slow
+SEND_QUEUE_SIZE = 100
+
+
+class PreparedNotification(dict):
+    """
+    Notification payload that carries its pre-encoded JSON text frame.
+    
+    Built by broadcasts that encode the shared part of the message once;
+    JSON observers send the frame as-is instead of re-serializing it.
+    Behaves as a plain dict everywhere else (batches, msgpack).
+    """
+    
+    __slots__ = ("frame",)
+    
+    def __init__(self, payload: dict, frame: str):
+        super().__init__(payload)
+        self.frame = frame
+
 
 class WebSocketObserver(INotificationObserver):
     """
@@ -17,49 +37,130 @@ class WebSocketObserver(INotificationObserver):
     
     Delivers notifications to clients via WebSocket connection.
     Implements the Observer interface for the notification system.
+    
+    Publishers never wait on the socket: messages go onto a bounded
+    per-connection queue drained by a dedicated writer task, so one slow
+    client cannot stall a broadcast. Notifications that queue up while a
+    send is in flight are written as one "notification_batch" frame.
     """
     
-    def __init__(self, websocket: WebSocket, user_id: str):
+    # One observer per open socket; slots keep per-connection overhead small
+    __slots__ = ("_websocket", "_user_id", "_active", "_binary", "_queue", "_writer")
+    
+    def __init__(self, websocket: WebSocket, user_id: str, binary: bool = False):
         """
         Initialize WebSocket observer.
         
         Args:
             websocket: The WebSocket connection
             user_id: The user ID this observer belongs to
+            binary: Send msgpack binary frames instead of JSON text frames
         """
         self._websocket = websocket
         self._user_id = user_id
         self._active = True
+        self._binary = binary
+        # Items are (is_notification, payload-or-message)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._writer: Optional[asyncio.Task] = None
     
     async def update(self, notification: Any) -> bool:
         """
-        Send notification to the WebSocket client.
+        Queue a notification for delivery to the WebSocket client.
         
         Args:
             notification: The notification data to send
             
         Returns:
-            True if sent successfully, False otherwise
+            True if queued, False if the connection is inactive or too far behind
         """
+        return self._enqueue((True, notification))
+    
+    def _enqueue(self, item: Tuple[bool, Any]) -> bool:
+        """Put an item on the send queue, starting the writer task on first use."""
         if not self._active:
             return False
         
         try:
-            # Format the message
-            message = {
-                "type": "notification",
-                "payload": notification
-            }
-            
-            # Send as JSON
-            await self._websocket.send_json(message)
-            logger.debug(f"Notification sent to user {self._user_id}")
-            return True
-            
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Send queue full for user %s; dropping slow connection", self._user_id
+            )
+            self.deactivate()
+            return False
+        
+        if self._writer is None:
+            self._writer = asyncio.get_running_loop().create_task(self._write_loop())
+        return True
+    
+    async def _write_loop(self) -> None:
+        """Drain the send queue, coalescing queued notifications into batches."""
+        items: List[Tuple[bool, Any]] = []
+        try:
+            while True:
+                items = [await self._queue.get()]
+                while not self._queue.empty():
+                    items.append(self._queue.get_nowait())
+                
+                # Keep order; consecutive notifications share one frame
+                batch: List[Any] = []
+                for is_notification, item in items:
+                    if is_notification:
+                        batch.append(item)
+                        continue
+                    await self._send_batch(batch)
+                    batch = []
+                    await self._send(item)
+                await self._send_batch(batch)
+                
+                logger.debug("Sent %d message(s) to user %s", len(items), self._user_id)
+                self._mark_done(len(items))
+                items = []
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to send notification to user {self._user_id}: {e}")
+            logger.error("Failed to send notification to user %s: %s", self._user_id, e)
             self._active = False
-            return False
+        finally:
+            # Account for in-flight and abandoned items so drain() never hangs
+            self._mark_done(len(items))
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self._mark_done(1)
+    
+    def _mark_done(self, count: int) -> None:
+        """Mark queue items as processed."""
+        for _ in range(count):
+            self._queue.task_done()
+    
+    async def drain(self) -> None:
+        """Wait until every queued message has been written (or dropped)."""
+        if self._writer is not None and not self._writer.done():
+            await self._queue.join()
+    
+    async def _send_batch(self, batch: List[Any]) -> None:
+        """Send queued notifications as one frame (single or batch)."""
+        if len(batch) == 1:
+            await self._send_notification(batch[0])
+        elif batch:
+            await self._send({"type": "notification_batch", "payload": batch})
+    
+    async def _send_notification(self, notification: Any) -> None:
+        """Send a single "notification" frame, reusing a pre-encoded one if present."""
+        frame = getattr(notification, "frame", None)
+        if frame is not None and not self._binary:
+            await self._websocket.send_text(frame)
+        else:
+            await self._send({"type": "notification", "payload": notification})
+    
+    async def _send(self, message: dict) -> None:
+        """Encode a message in the negotiated wire format and send it."""
+        if self._binary:
+            await self._websocket.send_bytes(msgpack_dumps(message))
+        else:
+            # JSON text frame (orjson handles UUID/datetime payloads)
+            await self._websocket.send_text(json_dumps_str(message))
     
     def get_user_id(self) -> str:
         """Get the user ID for this observer."""
@@ -69,35 +170,31 @@ class WebSocketObserver(INotificationObserver):
         """Check if the WebSocket connection is still active."""
         return self._active
     
+    def is_binary(self) -> bool:
+        """Check if this connection uses msgpack binary frames."""
+        return self._binary
+    
     def deactivate(self) -> None:
-        """Mark this observer as inactive."""
+        """Mark this observer as inactive and stop its writer task."""
         self._active = False
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
     
     async def send_message(self, message_type: str, data: Any) -> bool:
         """
-        Send a custom message to the WebSocket client.
+        Queue a custom message for the WebSocket client.
+        
+        Messages share the notification queue, so they are written in
+        order with notifications by the same writer task.
         
         Args:
             message_type: Type of message
             data: Message data
             
         Returns:
-            True if sent successfully
+            True if queued
         """
-        if not self._active:
-            return False
-        
-        try:
-            message = {
-                "type": message_type,
-                "payload": data
-            }
-            await self._websocket.send_json(message)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send message to user {self._user_id}: {e}")
-            self._active = False
-            return False
+        return self._enqueue((False, {"type": message_type, "payload": data}))
     
     async def send_ping(self) -> bool:
         """
@@ -1,14 +1,35 @@
 """
 Notification repository for data access.
 """
-from typing import List, Optional
+import csv
+import io
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import case, delete, desc, func, insert, lambda_stmt, select, tuple_, update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from shared.serialization import json_dumps_str
 from ..models.notification import Notification
 
 
+# Keyset cursor: (created_at, id) of the last row on the previous page
+Cursor = Tuple[datetime, UUID]
+
+# Batches of at least this many rows are streamed with COPY instead of INSERT
+COPY_THRESHOLD = 500
+
+_COPY_SQL = (
+    "COPY notifications (id, user_id, type, title, message, data, is_read, created_at) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+# Read queries are built with lambda_stmt: the statement for each query
+# shape is constructed and compiled once, later calls only rebind params.
+
+
 class NotificationRepository:
     """
     Repository for managing Notification entities.
@@ -29,9 +50,10 @@ class NotificationRepository:
         Returns:
             Created notification
         """
+        # Flush assigns the client-side defaults (id, created_at); nothing is
+        # generated server-side, so no refresh SELECT is needed
         self.db.add(notification)
         self.db.flush()
-        self.db.refresh(notification)
         return notification
     
     def create_many(self, notifications: List[Notification]) -> List[Notification]:
@@ -44,12 +66,87 @@ class NotificationRepository:
         Returns:
             List of created notifications
         """
-        self.db.add_all(notifications)
-        self.db.flush()
+        if not notifications:
+            return []
+        
+        dialect = self.db.get_bind().dialect
+        if len(notifications) >= COPY_THRESHOLD and dialect.driver == "psycopg2":
+            return self._copy_many(notifications)
+        
+        if not dialect.insert_executemany_returning:
+            # Column defaults are generated client-side, so a flush fully
+            # populates the objects without a refresh per row
+            self.db.add_all(notifications)
+            self.db.flush()
+            return notifications
+        
+        # Single multi-row INSERT ... RETURNING instead of N refresh SELECTs;
+        # rows come back in input order
+        values = [
+            {
+                "user_id": notification.user_id,
+                "type": notification.type,
+                "title": notification.title,
+                "message": notification.message,
+                "data": notification.data,
+            }
+            for notification in notifications
+        ]
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = self.db.scalars(stmt, values)
+        return list(result.all())
+    
+    def _copy_many(self, notifications: List[Notification]) -> List[Notification]:
+        """
+        Stream a large batch into PostgreSQL with COPY FROM STDIN.
+        
+        COPY skips per-row statement parsing, which wins for multi-thousand
+        row broadcasts. Ids and timestamps are assigned client-side, so the
+        returned objects are complete without reading anything back.
+        
+        Args:
+            notifications: List of notification entities
+            
+        Returns:
+            The same notifications with id, is_read and created_at populated
+        """
+        buffer = io.StringIO()
+        # Quote every field: data is always JSON text ("null" for None, as
+        # the JSON column type stores it), so no column is ever SQL NULL
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        created_at = datetime.utcnow()
+        # Broadcast rows share one data dict: encode each distinct object once
+        encoded_data = {}
         for notification in notifications:
-            self.db.refresh(notification)
+            notification.id = notification.id or uuid.uuid4()
+            notification.is_read = bool(notification.is_read)
+            notification.created_at = notification.created_at or created_at
+            writer.writerow((
+                notification.id,
+                notification.user_id,
+                notification.type,
+                notification.title,
+                notification.message,
+                self._encode_once(encoded_data, notification.data),
+                "t" if notification.is_read else "f",
+                notification.created_at.isoformat(),
+            ))
+        buffer.seek(0)
+        
+        # Runs on the session's connection, inside its transaction
+        raw_connection = self.db.connection().connection
+        with raw_connection.cursor() as cursor:
+            cursor.copy_expert(_COPY_SQL, buffer)
         return notifications
     
+    @staticmethod
+    def _encode_once(encoded: dict, data: Optional[dict]) -> str:
+        """Encode a data payload, reusing the result for the same object."""
+        key = id(data)
+        if key not in encoded:
+            encoded[key] = json_dumps_str(data)
+        return encoded[key]
+    
     def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
         """
         Find notification by ID.
@@ -60,59 +157,97 @@ class NotificationRepository:
         Returns:
             Notification if found, None otherwise
         """
-        return self.db.query(self.model).filter(self.model.id == notification_id).first()
+        stmt = lambda_stmt(
+            lambda: select(Notification).where(Notification.id == notification_id)
+        )
+        return self.db.scalars(stmt).first()
+    
+    def _paginate(
+        self,
+        stmt: StatementLambdaElement,
+        cursor: Optional[Cursor],
+        limit: int
+    ) -> Tuple[List[Notification], Optional[Cursor]]:
+        """
+        Apply keyset (seek) pagination ordered by (created_at, id) desc.
+        
+        Seeks past the cursor with a row-value comparison instead of OFFSET,
+        so every page costs O(limit) on the (user_id, created_at, id) index.
+        Relationship lazy loads are disabled with raiseload('*') so a listing
+        can never silently turn into N+1 queries.
+        
+        Args:
+            stmt: Filtered notification select
+            cursor: (created_at, id) of the last row already seen, or None
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (notifications, next_cursor); next_cursor is None on the last page
+        """
+        stmt += lambda s: s.options(raiseload("*"))
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            stmt += lambda s: s.where(
+                tuple_(Notification.created_at, Notification.id)
+                < tuple_(cursor_created_at, cursor_id)
+            )
+        fetch = limit + 1
+        stmt += lambda s: s.order_by(
+            desc(Notification.created_at), desc(Notification.id)
+        ).limit(fetch)
+        
+        rows = self.db.scalars(stmt).all()
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, (last.created_at, last.id)
     
     def find_by_user(
         self, 
         user_id: UUID, 
-        skip: int = 0, 
+        cursor: Optional[Cursor] = None, 
         limit: int = 50
-    ) -> List[Notification]:
+    ) -> Tuple[List[Notification], Optional[Cursor]]:
         """
         Get all notifications for a user.
         
         Args:
             user_id: UUID of the user
-            skip: Number of records to skip
+            cursor: (created_at, id) of the last row already seen
             limit: Maximum number of records to return
             
         Returns:
-            List of notifications ordered by created_at desc
+            Tuple of (notifications ordered by created_at desc, next_cursor)
         """
-        return (
-            self.db.query(self.model)
-            .filter(self.model.user_id == user_id)
-            .order_by(desc(self.model.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
+        stmt = lambda_stmt(
+            lambda: select(Notification).where(Notification.user_id == user_id)
         )
+        return self._paginate(stmt, cursor, limit)
     
     def find_unread_by_user(
         self, 
         user_id: UUID, 
-        skip: int = 0, 
+        cursor: Optional[Cursor] = None, 
         limit: int = 50
-    ) -> List[Notification]:
+    ) -> Tuple[List[Notification], Optional[Cursor]]:
         """
         Get unread notifications for a user.
         
         Args:
             user_id: UUID of the user
-            skip: Number of records to skip
+            cursor: (created_at, id) of the last row already seen
             limit: Maximum number of records to return
             
         Returns:
-            List of unread notifications
+            Tuple of (unread notifications, next_cursor)
         """
-        return (
-            self.db.query(self.model)
-            .filter(self.model.user_id == user_id, self.model.is_read == False)
-            .order_by(desc(self.model.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
+        stmt = lambda_stmt(
+            lambda: select(Notification).where(
+                Notification.user_id == user_id, Notification.is_read == False
+            )
         )
+        return self._paginate(stmt, cursor, limit)
     
     def count_by_user(self, user_id: UUID) -> int:
         """
@@ -124,7 +259,12 @@ class NotificationRepository:
         Returns:
             Total count
         """
-        return self.db.query(self.model).filter(self.model.user_id == user_id).count()
+        stmt = lambda_stmt(
+            lambda: select(func.count())
+            .select_from(Notification)
+            .where(Notification.user_id == user_id)
+        )
+        return self.db.scalar(stmt)
     
     def count_unread_by_user(self, user_id: UUID) -> int:
         """
@@ -136,11 +276,33 @@ class NotificationRepository:
         Returns:
             Unread count
         """
-        return (
-            self.db.query(self.model)
-            .filter(self.model.user_id == user_id, self.model.is_read == False)
-            .count()
+        stmt = lambda_stmt(
+            lambda: select(func.count())
+            .select_from(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read == False)
         )
+        return self.db.scalar(stmt)
+    
+    def get_counts(self, user_id: UUID) -> Tuple[int, int]:
+        """
+        Count total and unread notifications for a user in one query.
+        
+        Args:
+            user_id: UUID of the user
+            
+        Returns:
+            Tuple of (total, unread)
+        """
+        stmt = lambda_stmt(
+            lambda: select(
+                func.count().label("total"),
+                func.count(case((Notification.is_read == False, 1))).label("unread")
+            )
+            .select_from(Notification)
+            .where(Notification.user_id == user_id)
+        )
+        total, unread = self.db.execute(stmt).one()
+        return total, unread
     
     def mark_as_read(self, notification_id: UUID) -> Optional[Notification]:
         """
@@ -152,17 +314,26 @@ class NotificationRepository:
         Returns:
             Updated notification if found
         """
-        notification = self.find_by_id(notification_id)
-        if notification:
-            notification.is_read = True
-            self.db.flush()
-            self.db.refresh(notification)
+        stmt = (
+            update(self.model)
+            .where(self.model.id == notification_id, self.model.is_read == False)
+            .values(is_read=True)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        notification = self.db.scalars(stmt).one_or_none()
+        if notification is None:
+            # Already read (no write needed) or missing
+            notification = self.find_by_id(notification_id)
         return notification
     
     def mark_all_as_read(self, user_id: UUID) -> int:
         """
         Mark all notifications as read for a user.
         
+        Notification objects already loaded in this session are not
+        synchronized and keep their old is_read value; reload them if needed.
+        
         Args:
             user_id: UUID of the user
             
@@ -172,12 +343,12 @@ class NotificationRepository:
         result = (
             self.db.query(self.model)
             .filter(self.model.user_id == user_id, self.model.is_read == False)
-            .update({"is_read": True})
+            .update({"is_read": True}, synchronize_session=False)
         )
         self.db.flush()
         return result
     
-    def delete(self, notification_id: UUID) -> bool:
+    def delete(self, notification_id: UUID) -> Optional[UUID]:
         """
         Delete a notification.
         
@@ -185,26 +356,34 @@ class NotificationRepository:
             notification_id: UUID of the notification
             
         Returns:
-            True if deleted, False if not found
+            ID of the owning user if deleted, None if not found
         """
-        notification = self.find_by_id(notification_id)
-        if notification:
-            self.db.delete(notification)
-            self.db.flush()
-            return True
-        return False
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == notification_id)
+            .returning(self.model.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
     
     def delete_all_by_user(self, user_id: UUID) -> int:
         """
         Delete all notifications for a user.
         
+        Notification objects already loaded in this session are not
+        synchronized; do not use them after this call.
+        
         Args:
             user_id: UUID of the user
             
         Returns:
             Number of notifications deleted
         """
-        result = self.db.query(self.model).filter(self.model.user_id == user_id).delete()
+        result = (
+            self.db.query(self.model)
+            .filter(self.model.user_id == user_id)
+            .delete(synchronize_session=False)
+        )
         self.db.flush()
         return result
     
@@ -212,29 +391,25 @@ class NotificationRepository:
         self, 
         user_id: UUID, 
         notification_type: str,
-        skip: int = 0,
+        cursor: Optional[Cursor] = None,
         limit: int = 50
-    ) -> List[Notification]:
+    ) -> Tuple[List[Notification], Optional[Cursor]]:
         """
         Get notifications of a specific type for a user.
         
         Args:
             user_id: UUID of the user
             notification_type: Type of notification
-            skip: Number of records to skip
+            cursor: (created_at, id) of the last row already seen
             limit: Maximum number of records to return
             
         Returns:
-            List of notifications
+            Tuple of (notifications, next_cursor)
         """
-        return (
-            self.db.query(self.model)
-            .filter(
-                self.model.user_id == user_id,
-                self.model.type == notification_type
+        stmt = lambda_stmt(
+            lambda: select(Notification).where(
+                Notification.user_id == user_id,
+                Notification.type == notification_type
             )
-            .order_by(desc(self.model.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
+        return self._paginate(stmt, cursor, limit)
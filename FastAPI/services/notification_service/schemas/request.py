@@ -40,7 +40,9 @@ class NotificationUpdate(BaseModel):
 
 class BroadcastNotification(BaseModel):
     """Schema for broadcasting notification to multiple users."""
-    user_ids: List[UUID] = Field(..., description="List of user IDs to notify")
+    user_ids: List[UUID] = Field(
+        ..., description="List of user IDs to notify", min_length=1, max_length=10_000
+    )
     type: str = Field(..., description="Notification type", max_length=50)
     title: str = Field(..., description="Notification title", max_length=255)
     message: str = Field(..., description="Notification message")
@@ -4,7 +4,7 @@ Notification response schemas.
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NotificationResponse(BaseModel):
@@ -18,9 +18,11 @@ class NotificationResponse(BaseModel):
     is_read: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    # Frozen: built once per row and never mutated
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440099",
                 "user_id": "550e8400-e29b-41d4-a716-446655440001",
@@ -32,26 +34,37 @@ class NotificationResponse(BaseModel):
                 "created_at": "2024-12-10T10:30:00"
             }
         }
+    )
 
 
 class NotificationListResponse(BaseModel):
     """Schema for paginated notification list response."""
     notifications: List[NotificationResponse]
-    total: int
-    unread_count: int
-    skip: int
+    total: Optional[int] = Field(
+        None, description="Total notifications; only computed for the first page"
+    )
+    unread_count: Optional[int] = Field(
+        None, description="Unread notifications; only computed for the first page"
+    )
+    has_more: bool = False
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page; null on the last page"
+    )
     limit: int
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "notifications": [],
                 "total": 25,
                 "unread_count": 5,
-                "skip": 0,
+                "has_more": True,
+                "next_cursor": "2024-12-10T10:30:00_550e8400-e29b-41d4-a716-446655440099",
                 "limit": 20
             }
         }
+    )
 
 
 class WebSocketMessage(BaseModel):
@@ -59,8 +72,9 @@ class WebSocketMessage(BaseModel):
     type: str = Field(default="notification", description="Message type")
     payload: NotificationResponse
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "type": "notification",
                 "payload": {
@@ -75,3 +89,4 @@ class WebSocketMessage(BaseModel):
                 }
             }
         }
+    )
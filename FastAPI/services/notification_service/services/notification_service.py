@@ -2,18 +2,52 @@
 Notification service implementing business logic.
 Orchestrates notification creation, storage, and delivery.
 """
-from typing import List, Optional, Dict, Any
-from uuid import UUID
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import event
 from sqlalchemy.orm import Session
+import asyncio
 import logging
 
-from ..repositories.notification_repository import NotificationRepository
+from shared.serialization import json_dumps
+
+from ..repositories.notification_repository import NotificationRepository, Cursor
+from ..cache.notification_cache import NotificationCache, FIRST_PAGE_LIMIT
 from ..factory.notification_factory import NotificationFactory
 from ..observer.subject import notification_subject
+from ..observer.websocket_observer import PreparedNotification
 from ..models.notification import Notification
 
 logger = logging.getLogger(__name__)
 
+# Recipients per INSERT/COPY and WebSocket fan-out round in a broadcast
+BROADCAST_BATCH_SIZE = 500
+
+# Session.info key collecting the users whose cached notification data
+# must be dropped once the session's transaction commits
+_PENDING_INVALIDATIONS = "notification_cache_invalidations"
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """
+    Invalidate cached notification data after the write is committed.
+    
+    Repositories only flush; the commit happens later, when the request's
+    session is torn down. Invalidating before that would let a concurrent
+    read re-cache the old committed state for the whole TTL.
+    """
+    user_ids = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if user_ids:
+        NotificationCache().invalidate_users(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    """Rolled-back writes changed nothing, so there is nothing to invalidate."""
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
 
 class NotificationService:
     """
@@ -34,6 +68,11 @@ class NotificationService:
         self.repository = NotificationRepository(db)
         self.factory = NotificationFactory
         self.subject = notification_subject
+        self.cache = NotificationCache()
+    
+    def _invalidate_after_commit(self, *user_ids: UUID) -> None:
+        """Schedule the users' cached data for invalidation when the session commits."""
+        self.db.info.setdefault(_PENDING_INVALIDATIONS, set()).update(user_ids)
     
     # ==================== Create Operations ====================
     
@@ -65,7 +104,9 @@ class NotificationService:
             message=message,
             data=data
         )
-        return self.repository.create(notification)
+        created = self.repository.create(notification)
+        self._invalidate_after_commit(user_id)
+        return created
     
     def create_typed_notification(
         self,
@@ -89,7 +130,9 @@ class NotificationService:
             user_id=user_id,
             data=data
         )
-        return self.repository.create(notification)
+        created = self.repository.create(notification)
+        self._invalidate_after_commit(user_id)
+        return created
     
     async def create_and_broadcast(
         self,
@@ -101,6 +144,10 @@ class NotificationService:
         Create notifications for multiple users and broadcast via WebSocket.
         
         This is the main method for sending notifications from other services.
+        Recipients are processed in batches of BROADCAST_BATCH_SIZE, yielding
+        to the event loop between batches. Transient types (see
+        NotificationFactory.is_persistent) are only delivered to connected
+        users and never stored.
         
         Args:
             notification_type: Type of notification
@@ -108,33 +155,166 @@ class NotificationService:
             data: Additional data for the notification
             
         Returns:
-            List of created notifications
-        """
-        notifications = []
+            List of created notifications (empty for transient types)
+        """
+        persistent = self.factory.is_persistent(notification_type)
+        saved = []
+        for start in range(0, len(user_ids), BROADCAST_BATCH_SIZE):
+            batch = user_ids[start:start + BROADCAST_BATCH_SIZE]
+            if persistent:
+                saved.extend(await self._broadcast_batch(notification_type, batch, data))
+            else:
+                await self._broadcast_transient_batch(notification_type, batch, data)
+            await asyncio.sleep(0)
+        return saved
+    
+    async def _broadcast_batch(
+        self,
+        notification_type: str,
+        user_ids: List[UUID],
+        data: Optional[Dict[str, Any]]
+    ) -> List[Notification]:
+        """Create, save and deliver one batch of a broadcast."""
+        notifications = [
+            self.factory.create_notification(
+                notification_type=notification_type,
+                user_id=user_id,
+                data=data
+            )
+            for user_id in user_ids
+        ]
         
-        for user_id in user_ids:
-            try:
-                # Create notification using factory
-                notification = self.factory.create_notification(
-                    notification_type=notification_type,
-                    user_id=user_id,
-                    data=data
-                )
-                
-                # Save to database
-                saved_notification = self.repository.create(notification)
-                notifications.append(saved_notification)
-                
-                # Broadcast via WebSocket if user is connected
-                await self.subject.notify(
-                    str(user_id),
-                    saved_notification.to_dict()
+        # Save the batch in a single statement; the sync driver and Redis
+        # client run in a worker thread so the event loop keeps serving
+        saved = await asyncio.to_thread(self._save_batch, notifications, user_ids)
+        
+        # Only users with an open WebSocket need a payload at all
+        connected = [
+            notification for notification in saved
+            if self.subject.is_user_connected(str(notification.user_id))
+        ]
+        payloads = self._prepare_payloads(connected)
+        await self._deliver([n.user_id for n in connected], payloads)
+        return saved
+    
+    async def _broadcast_transient_batch(
+        self,
+        notification_type: str,
+        user_ids: List[UUID],
+        data: Optional[Dict[str, Any]]
+    ) -> None:
+        """Deliver one batch of a transient broadcast without touching the database."""
+        connected = [
+            user_id for user_id in user_ids
+            if self.subject.is_user_connected(str(user_id))
+        ]
+        if not connected:
+            return
+        
+        # Factory output depends only on type and data: build it once
+        template = self.factory.create_notification(
+            notification_type=notification_type,
+            user_id=connected[0],
+            data=data
+        )
+        shared = {
+            "type": template.type,
+            "title": template.title,
+            "message": template.message,
+            "data": template.data,
+            "is_read": False,
+            "transient": True,
+        }
+        created_at = datetime.utcnow()
+        owners = [
+            {"id": uuid4(), "user_id": user_id, "created_at": created_at}
+            for user_id in connected
+        ]
+        await self._deliver(connected, self._encode_payloads(shared, owners))
+    
+    async def _deliver(
+        self,
+        user_ids: List[UUID],
+        payloads: List[PreparedNotification]
+    ) -> None:
+        """Send prepared payloads to their users concurrently, logging failures."""
+        results = await asyncio.gather(
+            *(
+                self.subject.notify(str(user_id), payload)
+                for user_id, payload in zip(user_ids, payloads)
+            ),
+            return_exceptions=True
+        )
+        for user_id, result in zip(user_ids, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to broadcast notification to user %s: %s",
+                    user_id, result
                 )
-                
-            except Exception as e:
-                logger.error(f"Failed to create notification for user {user_id}: {e}")
+    
+    def _save_batch(
+        self,
+        notifications: List[Notification],
+        user_ids: List[UUID]
+    ) -> List[Notification]:
+        """Insert a broadcast batch and invalidate the recipients' cached data on commit."""
+        saved = self.repository.create_many(notifications)
+        self._invalidate_after_commit(*user_ids)
+        return saved
+    
+    @classmethod
+    def _prepare_payloads(cls, notifications: List[Notification]) -> List[PreparedNotification]:
+        """
+        Build WebSocket payloads for one broadcast, encoding the shared part once.
+        
+        Factory output depends only on type and data, so everything but
+        id, user_id and created_at is identical across the batch.
+        
+        Args:
+            notifications: Saved notifications from a single broadcast
+            
+        Returns:
+            Payloads carrying their pre-encoded "notification" frame
+        """
+        if not notifications:
+            return []
+        
+        first = notifications[0].to_dict()
+        shared = {key: first[key] for key in ("type", "title", "message", "data", "is_read")}
+        owners = [
+            {
+                "id": notification.id,
+                "user_id": notification.user_id,
+                "created_at": notification.created_at,
+            }
+            for notification in notifications
+        ]
+        return cls._encode_payloads(shared, owners)
+    
+    @staticmethod
+    def _encode_payloads(
+        shared: Dict[str, Any],
+        owners: List[Dict[str, Any]]
+    ) -> List[PreparedNotification]:
+        """
+        Encode the shared fields once and splice them into each per-user frame.
         
-        return notifications
+        Args:
+            shared: Fields identical for every recipient
+            owners: Per-recipient id, user_id and created_at
+            
+        Returns:
+            Payloads carrying their pre-encoded "notification" frame
+        """
+        # '"type":...,"is_read":false}' - the shared fields without the opening brace
+        shared_tail = json_dumps(shared)[1:]
+        
+        payloads = []
+        for own in owners:
+            body = json_dumps(own)[:-1] + b"," + shared_tail
+            frame = b'{"type":"notification","payload":' + body + b"}"
+            payloads.append(PreparedNotification({**own, **shared}, frame.decode()))
+        return payloads
     
     async def broadcast_to_user(
         self,
@@ -171,40 +351,61 @@ class NotificationService:
     def get_user_notifications(
         self,
         user_id: UUID,
-        skip: int = 0,
+        cursor: Optional[Cursor] = None,
         limit: int = 50
-    ) -> List[Notification]:
+    ) -> Tuple[List[Notification], Optional[Cursor]]:
         """
         Get all notifications for a user.
         
         Args:
             user_id: UUID of the user
-            skip: Number of records to skip
+            cursor: (created_at, id) of the last notification already seen
             limit: Maximum number of records
             
         Returns:
-            List of notifications
+            Tuple of (notifications, next_cursor)
         """
-        return self.repository.find_by_user(user_id, skip=skip, limit=limit)
+        return self._get_page(user_id, cursor, limit, unread_only=False)
     
     def get_unread_notifications(
         self,
         user_id: UUID,
-        skip: int = 0,
+        cursor: Optional[Cursor] = None,
         limit: int = 50
-    ) -> List[Notification]:
+    ) -> Tuple[List[Notification], Optional[Cursor]]:
         """
         Get unread notifications for a user.
         
         Args:
             user_id: UUID of the user
-            skip: Number of records to skip
+            cursor: (created_at, id) of the last notification already seen
             limit: Maximum number of records
             
         Returns:
-            List of unread notifications
+            Tuple of (unread notifications, next_cursor)
         """
-        return self.repository.find_unread_by_user(user_id, skip=skip, limit=limit)
+        return self._get_page(user_id, cursor, limit, unread_only=True)
+    
+    def _get_page(
+        self,
+        user_id: UUID,
+        cursor: Optional[Cursor],
+        limit: int,
+        unread_only: bool
+    ) -> Tuple[List[Notification], Optional[Cursor]]:
+        """Load a listing page, serving the first page from cache when possible."""
+        find = (
+            self.repository.find_unread_by_user if unread_only
+            else self.repository.find_by_user
+        )
+        if cursor is not None or limit != FIRST_PAGE_LIMIT:
+            return find(user_id, cursor=cursor, limit=limit)
+        
+        page = self.cache.get_first_page(user_id, unread_only)
+        if page is None:
+            page = find(user_id, cursor=None, limit=limit)
+            self.cache.set_first_page(user_id, unread_only, page)
+        return page
     
     def get_notification_counts(self, user_id: UUID) -> Dict[str, int]:
         """
@@ -216,31 +417,35 @@ class NotificationService:
         Returns:
             Dict with total and unread counts
         """
-        return {
-            "total": self.repository.count_by_user(user_id),
-            "unread": self.repository.count_unread_by_user(user_id)
-        }
+        counts = self.cache.get_counts(user_id)
+        if counts is None:
+            total, unread = self.repository.get_counts(user_id)
+            counts = {"total": total, "unread": unread}
+            self.cache.set_counts(user_id, counts)
+        return counts
     
     def get_notifications_by_type(
         self,
         user_id: UUID,
         notification_type: str,
-        skip: int = 0,
+        cursor: Optional[Cursor] = None,
         limit: int = 50
-    ) -> List[Notification]:
+    ) -> Tuple[List[Notification], Optional[Cursor]]:
         """
         Get notifications of a specific type for a user.
         
         Args:
             user_id: UUID of the user
             notification_type: Type of notification
-            skip: Number of records to skip
+            cursor: (created_at, id) of the last notification already seen
             limit: Maximum number of records
             
         Returns:
-            List of notifications
+            Tuple of (notifications, next_cursor)
         """
-        return self.repository.find_by_type(user_id, notification_type, skip=skip, limit=limit)
+        return self.repository.find_by_type(
+            user_id, notification_type, cursor=cursor, limit=limit
+        )
     
     # ==================== Update Operations ====================
     
@@ -254,7 +459,10 @@ class NotificationService:
         Returns:
             Updated notification if found
         """
-        return self.repository.mark_as_read(notification_id)
+        notification = self.repository.mark_as_read(notification_id)
+        if notification:
+            self._invalidate_after_commit(notification.user_id)
+        return notification
     
     def mark_all_as_read(self, user_id: UUID) -> int:
         """
@@ -266,7 +474,9 @@ class NotificationService:
         Returns:
             Number of notifications marked as read
         """
-        return self.repository.mark_all_as_read(user_id)
+        count = self.repository.mark_all_as_read(user_id)
+        self._invalidate_after_commit(user_id)
+        return count
     
     # ==================== Delete Operations ====================
     
@@ -280,7 +490,11 @@ class NotificationService:
         Returns:
             True if deleted
         """
-        return self.repository.delete(notification_id)
+        owner_id = self.repository.delete(notification_id)
+        if owner_id is None:
+            return False
+        self._invalidate_after_commit(owner_id)
+        return True
     
     def delete_all_user_notifications(self, user_id: UUID) -> int:
         """
@@ -292,7 +506,9 @@ class NotificationService:
         Returns:
             Number of notifications deleted
         """
-        return self.repository.delete_all_by_user(user_id)
+        count = self.repository.delete_all_by_user(user_id)
+        self._invalidate_after_commit(user_id)
+        return count
     
     # ==================== WebSocket Status ====================
     
@@ -315,7 +531,7 @@ class NotificationService:
         Returns:
             Number of connected users
         """
-        return len(self.subject.get_connected_users())
+        return self.subject.get_connected_users_count()
     
     # ==================== Utility ====================
     
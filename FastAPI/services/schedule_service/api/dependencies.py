@@ -0,0 +1,36 @@
+"""
+FastAPI dependencies for the schedule service.
+Provide request-scoped service instances bound to the request's DB session.
+"""
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from shared.database.connection import get_db_session
+from ..services import ScheduleService, EnrollmentService
+
+# Session scoped to the route function: it is committed and closed, handing
+# its pooled connection back, as soon as the route and its response
+# serialization finish, instead of after the response has been sent to the
+# client. Streaming routes read the database while sending, so they must
+# keep the default request scope.
+route_session = Depends(get_db_session, scope="function")
+
+
+def get_schedule_service(db: Session = route_session) -> ScheduleService:
+    """
+    Dependency providing a ScheduleService for the current request.
+
+    FastAPI caches dependencies per request, so the service shares the
+    session handed to the route and is built only for routes that use it.
+
+    Usage:
+        @router.get("/classes/{class_id}")
+        def get_class(service: ScheduleService = Depends(get_schedule_service)):
+            ...
+    """
+    return ScheduleService(db)
+
+
+def get_enrollment_service(db: Session = route_session) -> EnrollmentService:
+    """Dependency providing an EnrollmentService for the current request."""
+    return EnrollmentService(db)
@@ -1,13 +1,21 @@
 """
 FastAPI routes for schedule service.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, List, Optional
 from uuid import UUID
+from datetime import time
+import hashlib
 
 from shared.database.connection import get_db_session
+from shared.serialization import json_dumps
+from shared.cache import SingleFlight
+from shared.pagination import encode_cursor, decode_cursor_param
 from ..services import ScheduleService, EnrollmentService
+from ..cache import get_schedule_cache
+from .dependencies import get_schedule_service, get_enrollment_service, route_session
 from ..schemas import (
     CourseCreate, CourseUpdate, CourseResponse, CourseWithMentorsResponse, MentorInfo,
     CourseMentorAssign,
@@ -19,13 +27,92 @@ from shared.models.enums import UserRole, WeekDay
 
 router = APIRouter()
 
+# Concurrent cache misses for the same listing share one database load
+_listing_flight = SingleFlight()
+
+
+def _reject_offset(
+    skip: Optional[int] = Query(None, include_in_schema=False)
+) -> None:
+    """
+    Reject offset pagination on cursor-paginated listings.
+    
+    skip is no longer honoured; without this check an old client asking
+    for a deep offset would silently get the first page back. skip=0
+    already means "first page" and stays accepted.
+    """
+    if skip:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Offset pagination is not supported; pass the X-Next-Cursor "
+                   "header of the previous page as ?cursor= instead"
+        )
+
+
+def _listing_response(
+    items: List[dict],
+    next_cursor: Optional[str],
+    etag: Optional[str] = None
+) -> ORJSONResponse:
+    """
+    Return already-serialized listing items as-is.
+    
+    Hot listings skip response_model so FastAPI does not re-validate every
+    row on the way out; the items were built from the response schemas.
+    """
+    headers = _etag_headers(etag) if etag else {}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return ORJSONResponse(items, headers=headers)
+
+
+# ==================== Conditional Requests ====================
+
+def _etag_headers(etag: str) -> Dict[str, str]:
+    """Headers for an ETagged listing; no-cache makes browsers revalidate."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def _schedule_etag(request: Request, db: Session, marker: tuple) -> str:
+    """
+    Build the ETag of a class listing from its change marker.
+    
+    Class state comes from attendance sessions, so the active-session marker
+    is mixed in; the query string keeps pages and limits apart.
+    """
+    from services.attendance_service.repositories.session_repository import SessionRepository
+    
+    active = SessionRepository(db).active_fingerprint()
+    raw = repr((marker, active, request.url.query)).encode()
+    return f'"{hashlib.sha1(raw).hexdigest()}"'
+
+
+def _body_etag(items: List[dict], next_cursor: Optional[str]) -> str:
+    """ETag of a listing that is fully determined by its body."""
+    digest = hashlib.blake2b(json_dumps([items, next_cursor]), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already holds the ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags or "*" in tags
+
+
+def _not_modified(etag: str) -> Response:
+    """Empty 304 response; the client reuses its cached listing."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_etag_headers(etag))
+
 
 # ==================== Course Endpoints ====================
 
 @router.post("/courses", response_model=CourseWithMentorsResponse, status_code=status.HTTP_201_CREATED)
 def create_course(
     course_data: CourseCreate,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
     """
     Create a new course with optional mentor assignments.
@@ -35,140 +122,103 @@ def create_course(
     - **description**: Optional course description
     - **mentor_ids**: Optional list of mentor UUIDs to assign
     """
-    try:
-        service = ScheduleService(db)
-        course = service.create_course(
-            code=course_data.code,
-            name=course_data.name,
-            description=course_data.description,
-            mentor_ids=course_data.mentor_ids
-        )
-        
-        # Get mentor info
-        mentor_ids = service.get_mentors_for_course(course.id)
-        mentors = _get_mentor_info(db, mentor_ids)
-        
-        return CourseWithMentorsResponse(
-            id=course.id,
-            code=course.code,
-            name=course.name,
-            description=course.description,
-            mentor_ids=mentor_ids,
-            mentors=mentors,
-            created_at=course.created_at,
-            updated_at=course.updated_at
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    course = service.create_course(
+        code=course_data.code,
+        name=course_data.name,
+        description=course_data.description,
+        mentor_ids=course_data.mentor_ids
+    )
+    
+    return _course_with_mentors(service, course)
 
 
 @router.get("/courses/{course_id}", response_model=CourseWithMentorsResponse)
 def get_course(
     course_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
     """Get a course by ID with assigned mentors."""
-    service = ScheduleService(db)
     course = service.get_course(course_id)
     
     if not course:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
     
-    # Get mentor info
-    mentor_ids = service.get_mentors_for_course(course.id)
-    mentors = _get_mentor_info(db, mentor_ids)
-    
-    return CourseWithMentorsResponse(
-        id=course.id,
-        code=course.code,
-        name=course.name,
-        description=course.description,
-        mentor_ids=mentor_ids,
-        mentors=mentors,
-        created_at=course.created_at,
-        updated_at=course.updated_at
-    )
+    return _course_with_mentors(service, course)
 
 
-@router.get("/courses", response_model=List[CourseWithMentorsResponse])
+@router.get(
+    "/courses",
+    response_model=None,
+    responses={200: {"model": List[CourseWithMentorsResponse]}},
+    dependencies=[Depends(_reject_offset)]
+)
 def get_all_courses(
-    skip: int = Query(0, ge=0),
+    request: Request,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
-    """Get all courses with pagination and mentor info."""
-    service = ScheduleService(db)
-    courses = service.get_all_courses(skip=skip, limit=limit)
-    
-    result = []
-    for course in courses:
-        mentor_ids = service.get_mentors_for_course(course.id)
-        mentors = _get_mentor_info(db, mentor_ids)
-        result.append(CourseWithMentorsResponse(
-            id=course.id,
-            code=course.code,
-            name=course.name,
-            description=course.description,
-            mentor_ids=mentor_ids,
-            mentors=mentors,
-            created_at=course.created_at,
-            updated_at=course.updated_at
-        ))
-    
-    return result
+    """
+    Get all courses with cursor pagination and mentor info.
+    
+    Course pages carry no per-request state, so their ETag is a hash of the
+    body, computed once when the page is cached and reused by every reader.
+    """
+    cache = get_schedule_cache()
+    params = f"{cursor or ''}:{limit}"
+    cached = cache.get_listing("courses", params)
+    if cached is not None and cached.get("etag"):
+        if _etag_matches(request, cached["etag"]):
+            return _not_modified(cached["etag"])
+        return _listing_response(cached["items"], cached["next_cursor"], cached["etag"])
+    
+    courses, next_cursor = service.get_all_courses(
+        cursor=decode_cursor_param(cursor, ScheduleService.CREATED_CURSOR), limit=limit
+    )
+    
+    # One query for the page's mentor assignments; mentor details are memoized
+    mentors_by_course = service.get_mentor_contacts_for_courses([course.id for course in courses])
+    
+    items = [
+        _course_with_mentors(service, course, mentors_by_course[course.id]).model_dump(mode="json")
+        for course in courses
+    ]
+    encoded_cursor = encode_cursor(next_cursor)
+    etag = _body_etag(items, encoded_cursor)
+    cache.set_listing("courses", params, items, encoded_cursor, etag)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    return _listing_response(items, encoded_cursor, etag)
 
 
 @router.put("/courses/{course_id}", response_model=CourseWithMentorsResponse)
 def update_course(
     course_id: UUID,
     course_data: CourseUpdate,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
     """Update a course including mentor assignments."""
-    try:
-        service = ScheduleService(db)
-        
-        # Build update dict (only include provided fields, excluding mentor_ids)
-        update_data = course_data.model_dump(exclude_unset=True, exclude={'mentor_ids'})
-        
-        course = service.update_course(
-            course_id, 
-            mentor_ids=course_data.mentor_ids,
-            **update_data
-        )
-        
-        if not course:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
-        
-        # Get mentor info
-        mentor_ids = service.get_mentors_for_course(course.id)
-        mentors = _get_mentor_info(db, mentor_ids)
-        
-        return CourseWithMentorsResponse(
-            id=course.id,
-            code=course.code,
-            name=course.name,
-            description=course.description,
-            mentor_ids=mentor_ids,
-            mentors=mentors,
-            created_at=course.created_at,
-            updated_at=course.updated_at
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    # Build update dict (only include provided fields, excluding mentor_ids)
+    update_data = course_data.model_dump(exclude_unset=True, exclude={'mentor_ids'})
+    
+    course = service.update_course(
+        course_id, 
+        mentor_ids=course_data.mentor_ids,
+        **update_data
+    )
+    
+    if not course:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
+    
+    return _course_with_mentors(service, course)
 
 
 @router.delete("/courses/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_course(
     course_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
     """Delete a course."""
-    service = ScheduleService(db)
     deleted = service.delete_course(course_id)
     
     if not deleted:
@@ -182,41 +232,35 @@ def delete_course(
 @router.get("/courses/{course_id}/mentors", response_model=List[MentorInfo])
 def get_course_mentors(
     course_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
     """Get all mentors assigned to a course."""
-    service = ScheduleService(db)
-    
     # Verify course exists
     course = service.get_course(course_id)
     if not course:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
     
-    mentor_ids = service.get_mentors_for_course(course_id)
-    return _get_mentor_info(db, mentor_ids)
+    return _mentor_infos(service.get_mentor_contacts_for_courses([course_id])[course_id])
 
 
 @router.post("/courses/{course_id}/mentors", status_code=status.HTTP_201_CREATED)
 def assign_mentor_to_course(
     course_id: UUID,
     data: CourseMentorAssign,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
     """Assign a mentor to a course."""
-    service = ScheduleService(db)
-    
     # Verify course exists
-    course = service.get_course(course_id)
-    if not course:
+    if not service.course_exists(course_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
     
     # Verify mentor exists and is a mentor
     from services.auth_service.repositories.user_repository import UserRepository
-    user_repo = UserRepository(db)
-    mentor = user_repo.find_by_id(data.mentor_id)
-    if not mentor:
+    role = UserRepository(db).find_role(data.mentor_id)
+    if role is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mentor not found")
-    if mentor.role != 'mentor':
+    if role != UserRole.MENTOR.value:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User is not a mentor")
     
     service.assign_mentor_to_course(course_id, data.mentor_id)
@@ -227,11 +271,9 @@ def assign_mentor_to_course(
 def remove_mentor_from_course(
     course_id: UUID,
     mentor_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
     """Remove a mentor from a course."""
-    service = ScheduleService(db)
-    
     # Verify course exists
     course = service.get_course(course_id)
     if not course:
@@ -244,39 +286,66 @@ def remove_mentor_from_course(
     return None
 
 
-# Helper function to get mentor info
-def _get_mentor_info(db: Session, mentor_ids: List[UUID]) -> List[MentorInfo]:
-    """Get mentor info for a list of mentor IDs."""
-    if not mentor_ids:
-        return []
-    
-    from services.auth_service.repositories.user_repository import UserRepository
-    user_repo = UserRepository(db)
+# Helper functions to build course responses with mentor info
+def _mentor_infos(rows: List) -> List[MentorInfo]:
+    """Convert (id, full_name, email) mentor rows to MentorInfo."""
+    return [
+        MentorInfo.model_construct(id=row.id, full_name=row.full_name, email=row.email)
+        for row in rows
+    ]
+
+
+def _course_with_mentors(
+    service: ScheduleService,
+    course,
+    mentor_rows: Optional[List] = None
+) -> CourseWithMentorsResponse:
+    """
+    Convert a course to CourseWithMentorsResponse.
     
-    mentors = []
-    for mentor_id in mentor_ids:
-        user = user_repo.find_by_id(mentor_id)
-        if user:
-            mentors.append(MentorInfo(
-                id=user.id,
-                full_name=user.full_name,
-                email=user.email
-            ))
+    Pass mentor_rows when they were already batch-loaded for a page;
+    otherwise they are fetched here.
     
-    return mentors
+    The values come straight from database rows, so the response is
+    built with model_construct and skips Pydantic validation.
+    """
+    if mentor_rows is None:
+        mentor_rows = service.get_mentor_contacts_for_courses([course.id])[course.id]
+    mentors = _mentor_infos(mentor_rows)
+    return CourseWithMentorsResponse.model_construct(
+        id=course.id,
+        code=course.code,
+        name=course.name,
+        description=course.description,
+        mentor_ids=[mentor.id for mentor in mentors],
+        mentors=mentors,
+        created_at=course.created_at,
+        updated_at=course.updated_at
+    )
 
 
 # Helper function to get class state based on active attendance session
-def _get_class_with_state(db: Session, class_obj) -> ClassResponse:
-    """Convert class object to ClassResponse with state based on attendance session."""
+def _get_class_state(db: Session, class_id: UUID) -> str:
+    """Get a class's state based on its active attendance session."""
     from services.attendance_service.repositories.session_repository import SessionRepository
     
     session_repo = SessionRepository(db)
-    active_session = session_repo.find_active_by_class(class_obj.id)
+    active_session = session_repo.find_active_by_class(class_id)
+    
+    return "active" if active_session else "inactive"
+
+
+def _get_active_class_ids(db: Session, class_ids: List[UUID]) -> set:
+    """Get the IDs of classes with an active attendance session, in one query."""
+    from services.attendance_service.repositories.session_repository import SessionRepository
     
-    state = "inactive"
-    if active_session:
-        state = "active"
+    return SessionRepository(db).find_active_class_ids(class_ids)
+
+
+def _get_class_with_state(db: Session, class_obj, state: Optional[str] = None) -> ClassResponse:
+    """Convert class object to ClassResponse with state based on attendance session."""
+    if state is None:
+        state = _get_class_state(db, class_obj.id)
     
     return ClassResponse(
         id=class_obj.id,
@@ -292,9 +361,110 @@ def _get_class_with_state(db: Session, class_obj) -> ClassResponse:
     )
 
 
-def _get_classes_with_state(db: Session, classes: List) -> List[ClassResponse]:
-    """Convert list of class objects to ClassResponse with state."""
-    return [_get_class_with_state(db, c) for c in classes]
+def _class_dicts(db: Session, classes: List) -> List[dict]:
+    """
+    Build ClassResponse-shaped dicts straight from class columns.
+    
+    Skips per-row model validation; orjson encodes the UUID, time and
+    datetime values natively.
+    """
+    active = _get_active_class_ids(db, [c.id for c in classes])
+    return [
+        {
+            "id": c.id,
+            "course_id": c.course_id,
+            "mentor_id": c.mentor_id,
+            "name": c.name,
+            "room_number": c.room_number,
+            "day_of_week": c.day_of_week,
+            "schedule_time": c.schedule_time,
+            "state": "active" if c.id in active else "inactive",
+            "created_at": c.created_at,
+            "updated_at": c.updated_at,
+        }
+        for c in classes
+    ]
+
+
+def _serialize_classes(classes: List) -> List[dict]:
+    """Serialize class objects for the listing cache (state is never cached)."""
+    return [
+        ClassResponse.model_validate(c).model_dump(mode="json", exclude={"state"})
+        for c in classes
+    ]
+
+
+def _cached_classes_with_state(db: Session, items: List[dict]) -> List[dict]:
+    """Add a fresh attendance state to serialized class items."""
+    class_ids = [UUID(item["id"]) for item in items]
+    active = _get_active_class_ids(db, class_ids)
+    return [
+        {**item, "state": "active" if class_id in active else "inactive"}
+        for item, class_id in zip(items, class_ids)
+    ]
+
+
+def _get_listing(kind: str, params: str, load) -> dict:
+    """
+    Get a serialized class listing through the schedule cache (Cache-Aside).
+    
+    Concurrent misses for the same listing are single-flighted: one request
+    loads and caches it, the others wait for and reuse its result.
+    
+    Args:
+        kind: Listing name used in the cache key
+        params: Query parameters and change marker identifying the listing
+        load: Callable returning (classes, next_cursor) on a cache miss
+        
+    Returns:
+        Dict with "items" (class dicts without state) and "next_cursor"
+    """
+    cache = get_schedule_cache()
+    cached = cache.get_listing(kind, params)
+    if cached is None:
+        def load_and_cache() -> dict:
+            classes, next_cursor = load()
+            listing = {
+                "items": _serialize_classes(classes),
+                "next_cursor": encode_cursor(next_cursor),
+            }
+            cache.set_listing(kind, params, listing["items"], listing["next_cursor"])
+            return listing
+        
+        # Items are plain dicts, so waiting requests can share the result
+        cached = _listing_flight.do(f"{kind}:{params}", load_and_cache)
+    return cached
+
+
+def _get_cached_class_listing(
+    db: Session,
+    kind: str,
+    params: str,
+    marker: tuple,
+    load,
+    etag: Optional[str] = None
+) -> ORJSONResponse:
+    """
+    Serve a class listing from the schedule cache with fresh attendance state.
+    
+    The cached body is keyed by the change marker its ETag was built from.
+    A reader that loaded the listing before a write committed can still
+    cache it after the writer's invalidation, but only under the old
+    marker, so it is never served with the new ETag.
+    
+    Args:
+        db: Database session
+        kind: Listing name used in the cache key
+        params: Query parameters identifying the listing
+        marker: Change marker of the listing's classes
+        load: Callable returning (classes, next_cursor) on a cache miss
+        etag: ETag to send with the listing
+    """
+    version = hashlib.sha1(repr(marker).encode()).hexdigest()
+    listing = _get_listing(kind, f"{params}:{version}", load)
+    return _listing_response(
+        _cached_classes_with_state(db, listing["items"]), listing["next_cursor"], etag
+    )
 
 
 # ==================== Class Endpoints ====================
@@ -302,7 +472,8 @@ def _get_classes_with_state(db: Session, classes: List) -> List[ClassResponse]:
 @router.post("/classes", response_model=ClassResponse, status_code=status.HTTP_201_CREATED)
 def create_class(
     class_data: ClassCreate,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
     """
     Create a new class.
@@ -314,82 +485,80 @@ def create_class(
     - **day_of_week**: Day of the week
     - **schedule_time**: Class time
     """
-    try:
-        service = ScheduleService(db)
-        class_obj = service.create_class(
-            course_id=class_data.course_id,
-            mentor_id=class_data.mentor_id,
-            name=class_data.name,
-            room_number=class_data.room_number,
-            day_of_week=class_data.day_of_week,
-            schedule_time=class_data.schedule_time
-        )
-        return _get_class_with_state(db, class_obj)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    class_obj = service.create_class(
+        course_id=class_data.course_id,
+        mentor_id=class_data.mentor_id,
+        name=class_data.name,
+        room_number=class_data.room_number,
+        day_of_week=class_data.day_of_week,
+        schedule_time=class_data.schedule_time
+    )
+    return _get_class_with_state(db, class_obj)
 
 
 @router.get("/classes/{class_id}", response_model=ClassResponse)
 def get_class(
     class_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
     """Get a class by ID."""
-    service = ScheduleService(db)
-    class_obj = service.get_class(class_id)
-    
-    if not class_obj:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found")
+    cache = get_schedule_cache()
+    item = cache.get_class(class_id)
+    if item is None:
+        class_obj = service.get_class(class_id)
+        if not class_obj:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found")
+        item = _serialize_classes([class_obj])[0]
+        cache.set_class(class_id, item)
     
-    return _get_class_with_state(db, class_obj)
+    return _cached_classes_with_state(db, [item])[0]
 
 
-@router.get("/classes", response_model=List[ClassResponse])
+@router.get(
+    "/classes",
+    response_model=None,
+    responses={200: {"model": List[ClassResponse]}},
+    dependencies=[Depends(_reject_offset)]
+)
 def get_all_classes(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
-    """Get all classes with pagination."""
-    service = ScheduleService(db)
-    classes = service.get_all_classes(skip=skip, limit=limit)
-    return _get_classes_with_state(db, classes)
+    """Get all classes with cursor pagination."""
+    classes, next_cursor = service.get_all_classes(
+        cursor=decode_cursor_param(cursor, ScheduleService.CREATED_CURSOR), limit=limit
+    )
+    return _listing_response(_class_dicts(db, classes), encode_cursor(next_cursor))
 
 
 @router.put("/classes/{class_id}", response_model=ClassResponse)
 def update_class(
     class_id: UUID,
     class_data: ClassUpdate,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
     """Update a class."""
-    try:
-        service = ScheduleService(db)
-        
-        # Build update dict (only include provided fields)
-        update_data = class_data.model_dump(exclude_unset=True)
-        
-        class_obj = service.update_class(class_id, **update_data)
-        
-        if not class_obj:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found")
-        
-        return _get_class_with_state(db, class_obj)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    # Build update dict (only include provided fields)
+    update_data = class_data.model_dump(exclude_unset=True)
+    
+    class_obj = service.update_class(class_id, **update_data)
+    
+    if not class_obj:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found")
+    
+    return _get_class_with_state(db, class_obj)
 
 
 @router.delete("/classes/{class_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_class(
     class_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
     """Delete a class."""
-    service = ScheduleService(db)
     deleted = service.delete_class(class_id)
     
     if not deleted:
@@ -401,12 +570,12 @@ def delete_class(
 @router.post("/classes/check-conflicts")
 def check_class_conflicts(
     room_number: str = Query(..., description="Room number"),
-    day_of_week: str = Query(..., description="Day of the week"),
-    schedule_time: str = Query(..., description="Schedule time (HH:MM)"),
+    day_of_week: WeekDay = Query(..., description="Day of the week"),
+    schedule_time: time = Query(..., description="Schedule time (HH:MM)"),
     mentor_id: UUID = Query(None, description="Mentor UUID (optional)"),
     duration_minutes: int = Query(90, description="Class duration in minutes"),
     exclude_class_id: UUID = Query(None, description="Class ID to exclude (for updates)"),
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service)
 ):
     """
     Check for scheduling conflicts before creating/updating a class.
@@ -415,22 +584,10 @@ def check_class_conflicts(
     - Room: Another class in the same room at overlapping time
     - Mentor: The mentor has another class at overlapping time
     """
-    from datetime import datetime
-    
-    try:
-        # Parse time string
-        time_obj = datetime.strptime(schedule_time, "%H:%M").time()
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, 
-            detail="Invalid time format. Use HH:MM"
-        )
-    
-    service = ScheduleService(db)
     conflicts = service.check_class_conflicts(
         room_number=room_number,
-        day_of_week=day_of_week,
-        schedule_time=time_obj,
+        day_of_week=day_of_week.value,
+        schedule_time=schedule_time,
         mentor_id=mentor_id,
         duration_minutes=duration_minutes,
         exclude_class_id=exclude_class_id
@@ -443,7 +600,8 @@ def check_class_conflicts(
 def create_class_with_validation(
     class_data: ClassCreate,
     duration_minutes: int = Query(90, description="Class duration in minutes"),
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
     """
     Create a new class with conflict validation.
@@ -453,96 +611,183 @@ def create_class_with_validation(
     - class: The created class (if successful)
     - conflicts: Conflict details (if any)
     """
-    try:
-        service = ScheduleService(db)
-        result = service.create_class_with_validation(
-            course_id=class_data.course_id,
-            mentor_id=class_data.mentor_id,
-            name=class_data.name,
-            room_number=class_data.room_number,
-            day_of_week=class_data.day_of_week,
-            schedule_time=class_data.schedule_time,
-            duration_minutes=duration_minutes
-        )
-        
-        if result['success']:
-            return {
-                'success': True,
-                'class': _get_class_with_state(db, result['class']),
-                'conflicts': None
-            }
-        else:
-            return {
-                'success': False,
-                'class': None,
-                'conflicts': result['conflicts']
-            }
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    result = service.create_class_with_validation(
+        course_id=class_data.course_id,
+        mentor_id=class_data.mentor_id,
+        name=class_data.name,
+        room_number=class_data.room_number,
+        day_of_week=class_data.day_of_week,
+        schedule_time=class_data.schedule_time,
+        duration_minutes=duration_minutes
+    )
+    
+    if result['success']:
+        return {
+            'success': True,
+            'class': _get_class_with_state(db, result['class']),
+            'conflicts': None
+        }
+    else:
+        return {
+            'success': False,
+            'class': None,
+            'conflicts': result['conflicts']
+        }
 
 
 # ==================== Schedule Endpoints ====================
 
-@router.get("/schedule/student/{student_id}", response_model=List[ClassResponse])
+@router.get(
+    "/schedule/student/{student_id}",
+    response_model=None,
+    responses={200: {"model": List[ClassResponse]}},
+    dependencies=[Depends(_reject_offset)]
+)
 def get_student_schedule(
     student_id: UUID,
-    skip: int = Query(0, ge=0),
+    request: Request,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
     """Get schedule for a specific student."""
-    service = ScheduleService(db)
-    classes = service.get_schedule_for_student(student_id, skip=skip, limit=limit)
-    return _get_classes_with_state(db, classes)
+    etag = _schedule_etag(request, db, service.get_schedule_fingerprint(student_id=student_id))
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    classes, next_cursor = service.get_schedule_for_student(
+        student_id, cursor=decode_cursor_param(cursor, ScheduleService.SCHEDULE_CURSOR), limit=limit
+    )
+    return _listing_response(
+        _class_dicts(db, classes), encode_cursor(next_cursor), etag
+    )
 
 
-@router.get("/schedule/mentor/{mentor_id}", response_model=List[ClassResponse])
+@router.get(
+    "/schedule/mentor/{mentor_id}",
+    response_model=None,
+    responses={200: {"model": List[ClassResponse]}},
+    dependencies=[Depends(_reject_offset)]
+)
 def get_mentor_schedule(
     mentor_id: UUID,
-    skip: int = Query(0, ge=0),
+    request: Request,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
     """Get schedule for a specific mentor."""
-    service = ScheduleService(db)
-    classes = service.get_schedule_for_mentor(mentor_id, skip=skip, limit=limit)
-    return _get_classes_with_state(db, classes)
+    etag = _schedule_etag(request, db, service.get_schedule_fingerprint(mentor_id=mentor_id))
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    classes, next_cursor = service.get_schedule_for_mentor(
+        mentor_id, cursor=decode_cursor_param(cursor, ScheduleService.SCHEDULE_CURSOR), limit=limit
+    )
+    return _listing_response(
+        _class_dicts(db, classes), encode_cursor(next_cursor), etag
+    )
 
 
-@router.get("/schedule/full", response_model=List[ClassResponse])
+@router.get(
+    "/schedule/full",
+    response_model=None,
+    responses={200: {"model": List[ClassResponse]}},
+    dependencies=[Depends(_reject_offset)]
+)
 def get_full_schedule(
-    skip: int = Query(0, ge=0),
+    request: Request,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db_session)
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
-    """Get full schedule (all classes)."""
+    """Get full schedule (all classes), ordered by day and time."""
+    page_cursor = decode_cursor_param(cursor, ScheduleService.SCHEDULE_CURSOR)
+    marker = service.get_schedule_fingerprint()
+    etag = _schedule_etag(request, db, marker)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    return _get_cached_class_listing(
+        db, "full", f"{cursor or ''}:{limit}", marker,
+        lambda: service.get_full_schedule(cursor=page_cursor, limit=limit),
+        etag
+    )
+
+
+@router.get(
+    "/schedule/full/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+def stream_full_schedule(db: Session = Depends(get_db_session)):
+    """
+    Stream the full schedule as NDJSON (one ClassResponse per line).
+    
+    Rows are read through a server-side cursor and encoded batch by batch,
+    so memory stays flat however many classes there are. Use the paginated
+    /schedule/full for interactive views.
+    """
     service = ScheduleService(db)
-    classes = service.get_full_schedule(skip=skip, limit=limit)
-    return _get_classes_with_state(db, classes)
+    
+    def generate():
+        for batch in service.iter_full_schedule():
+            yield b"".join(json_dumps(item) + b"\n" for item in _class_dicts(db, batch))
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
-@router.get("/schedule/day/{day}", response_model=List[ClassResponse])
+@router.get(
+    "/schedule/day/{day}",
+    response_model=None,
+    responses={200: {"model": List[ClassResponse]}}
+)
 def get_schedule_by_day(
     day: WeekDay,
-    db: Session = Depends(get_db_session)
+    request: Request,
+    limit: int = Query(500, ge=1, le=500),
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
-    """Get all classes for a specific day."""
-    service = ScheduleService(db)
-    classes = service.get_classes_by_day(day)
-    return _get_classes_with_state(db, classes)
+    """Get the classes for a specific day, ordered by time (at most limit)."""
+    marker = service.get_schedule_fingerprint(day=day.value)
+    etag = _schedule_etag(request, db, marker)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    return _get_cached_class_listing(
+        db, "day", f"{day.value}:{limit}", marker,
+        lambda: (service.get_classes_by_day(day.value, limit=limit), None),
+        etag
+    )
 
 
-@router.get("/schedule/room/{room_number}", response_model=List[ClassResponse])
+@router.get(
+    "/schedule/room/{room_number}",
+    response_model=None,
+    responses={200: {"model": List[ClassResponse]}}
+)
 def get_schedule_by_room(
     room_number: str,
-    db: Session = Depends(get_db_session)
+    request: Request,
+    limit: int = Query(500, ge=1, le=500),
+    service: ScheduleService = Depends(get_schedule_service),
+    db: Session = route_session
 ):
-    """Get all classes in a specific room."""
-    service = ScheduleService(db)
-    classes = service.get_classes_by_room(room_number)
-    return _get_classes_with_state(db, classes)
+    """Get the classes in a specific room, ordered by day and time (at most limit)."""
+    marker = service.get_schedule_fingerprint(room_number=room_number)
+    etag = _schedule_etag(request, db, marker)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    return _get_cached_class_listing(
+        db, "room", f"{room_number}:{limit}", marker,
+        lambda: (service.get_classes_by_room(room_number, limit=limit), None),
+        etag
+    )
 
 
 # ==================== Enrollment Endpoints ====================
@@ -550,7 +795,7 @@ def get_schedule_by_room(
 @router.post("/enrollments", response_model=EnrollmentResponse, status_code=status.HTTP_201_CREATED)
 def enroll_student(
     enrollment_data: EnrollmentCreate,
-    db: Session = Depends(get_db_session)
+    service: EnrollmentService = Depends(get_enrollment_service)
 ):
     """
     Enroll a student in a class.
@@ -558,27 +803,34 @@ def enroll_student(
     - **student_id**: UUID of the student
     - **class_id**: UUID of the class
     """
-    try:
-        service = EnrollmentService(db)
-        enrollment = service.enroll_student(
-            student_id=enrollment_data.student_id,
-            class_id=enrollment_data.class_id
-        )
-        return enrollment
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    enrollment = service.enroll_student(
+        student_id=enrollment_data.student_id,
+        class_id=enrollment_data.class_id
+    )
+    return enrollment
+
+
+@router.post("/enrollments/bulk", response_model=List[EnrollmentResponse], status_code=status.HTTP_201_CREATED)
+def bulk_enroll_students(
+    items: List[EnrollmentCreate] = Body(..., min_length=1, max_length=1000),
+    service: EnrollmentService = Depends(get_enrollment_service)
+):
+    """
+    Enroll many students in one request and one transaction.
+    
+    Pairs that are already enrolled are skipped; only newly created
+    enrollments are returned.
+    """
+    return service.bulk_enroll([(item.student_id, item.class_id) for item in items])
 
 
 @router.delete("/enrollments/{student_id}/{class_id}", status_code=status.HTTP_204_NO_CONTENT)
 def unenroll_student(
     student_id: UUID,
     class_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: EnrollmentService = Depends(get_enrollment_service)
 ):
     """Unenroll a student from a class."""
-    service = EnrollmentService(db)
     deleted = service.unenroll_student(student_id, class_id)
     
     if not deleted:
@@ -590,10 +842,9 @@ def unenroll_student(
 @router.get("/enrollments/student/{student_id}", response_model=List[EnrollmentResponse])
 def get_student_enrollments(
     student_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: EnrollmentService = Depends(get_enrollment_service)
 ):
     """Get all enrollments for a student."""
-    service = EnrollmentService(db)
     enrollments = service.get_student_enrollments(student_id)
     return enrollments
 
@@ -601,10 +852,9 @@ def get_student_enrollments(
 @router.get("/enrollments/class/{class_id}", response_model=List[EnrollmentWithStudentResponse])
 def get_class_enrollments(
     class_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: EnrollmentService = Depends(get_enrollment_service)
 ):
     """Get all enrollments for a class with student details."""
-    service = EnrollmentService(db)
     enrollments = service.get_class_enrollments_with_students(class_id)
     return enrollments
 
@@ -612,9 +862,8 @@ def get_class_enrollments(
 @router.get("/enrollments/class/{class_id}/count", response_model=int)
 def get_class_enrollment_count(
     class_id: UUID,
-    db: Session = Depends(get_db_session)
+    service: EnrollmentService = Depends(get_enrollment_service)
 ):
     """Get the number of students enrolled in a class."""
-    service = EnrollmentService(db)
     count = service.get_enrolled_students_count(class_id)
     return count
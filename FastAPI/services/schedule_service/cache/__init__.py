@@ -1,6 +1,6 @@
 """
 Schedule service cache layer.
 """
-from .schedule_cache import ScheduleCache
+from .schedule_cache import ScheduleCache, get_schedule_cache
 
-__all__ = ['ScheduleCache']
+__all__ = ['ScheduleCache', 'get_schedule_cache']
@@ -1,10 +1,10 @@
 """
 Schedule cache implementing Cache-Aside pattern.
 """
-from typing import Optional, List, Any
-import json
+from typing import Optional, Iterable, List, Any
 from uuid import UUID
 from shared.cache.cache_manager import CacheManager
+from shared.serialization import json_dumps, json_loads
 
 
 class ScheduleCache:
@@ -16,10 +16,27 @@ class ScheduleCache:
         self.cache = CacheManager.get_instance()
         self.ttl = 300  # 5 minutes default TTL
     
+    @property
+    def _listing_index(self) -> str:
+        """Index set of all cached listing and class keys."""
+        return self._make_key("index", "list")
+    
     def _make_key(self, prefix: str, identifier: str) -> str:
         """Generate cache key."""
         return f"schedule:{prefix}:{identifier}"
     
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Encode a value for Redis (orjson bytes, UUID/datetime handled natively)."""
+        return json_dumps(value)
+    
+    @staticmethod
+    def _decode(cached: Optional[str]) -> Optional[Any]:
+        """Decode a cached value; None for a miss."""
+        if cached:
+            return json_loads(cached)
+        return None
+    
     def get_student_schedule(self, student_id: UUID) -> Optional[List[dict]]:
         """
         Get cached schedule for a student.
@@ -31,10 +48,7 @@ class ScheduleCache:
             Cached schedule or None
         """
         key = self._make_key("student", str(student_id))
-        cached = self.cache.get(key)
-        if cached:
-            return json.loads(cached)
-        return None
+        return self._decode(self.cache.get(key))
     
     def set_student_schedule(self, student_id: UUID, schedule: List[dict]) -> None:
         """
@@ -45,7 +59,7 @@ class ScheduleCache:
             schedule: Schedule data to cache
         """
         key = self._make_key("student", str(student_id))
-        self.cache.set(key, json.dumps(schedule, default=str), ttl=self.ttl)
+        self.cache.set(key, self._encode(schedule), ttl=self.ttl)
     
     def get_mentor_schedule(self, mentor_id: UUID) -> Optional[List[dict]]:
         """
@@ -58,10 +72,7 @@ class ScheduleCache:
             Cached schedule or None
         """
         key = self._make_key("mentor", str(mentor_id))
-        cached = self.cache.get(key)
-        if cached:
-            return json.loads(cached)
-        return None
+        return self._decode(self.cache.get(key))
     
     def set_mentor_schedule(self, mentor_id: UUID, schedule: List[dict]) -> None:
         """
@@ -72,7 +83,7 @@ class ScheduleCache:
             schedule: Schedule data to cache
         """
         key = self._make_key("mentor", str(mentor_id))
-        self.cache.set(key, json.dumps(schedule, default=str), ttl=self.ttl)
+        self.cache.set(key, self._encode(schedule), ttl=self.ttl)
     
     def get_full_schedule(self) -> Optional[List[dict]]:
         """
@@ -82,10 +93,7 @@ class ScheduleCache:
             Cached full schedule or None
         """
         key = self._make_key("full", "all")
-        cached = self.cache.get(key)
-        if cached:
-            return json.loads(cached)
-        return None
+        return self._decode(self.cache.get(key))
     
     def set_full_schedule(self, schedule: List[dict]) -> None:
         """
@@ -95,7 +103,7 @@ class ScheduleCache:
             schedule: Full schedule data to cache
         """
         key = self._make_key("full", "all")
-        self.cache.set(key, json.dumps(schedule, default=str), ttl=self.ttl)
+        self.cache.set(key, self._encode(schedule), ttl=self.ttl)
     
     def get_class(self, class_id: UUID) -> Optional[dict]:
         """
@@ -108,10 +116,7 @@ class ScheduleCache:
             Cached class or None
         """
         key = self._make_key("class", str(class_id))
-        cached = self.cache.get(key)
-        if cached:
-            return json.loads(cached)
-        return None
+        return self._decode(self.cache.get(key))
     
     def set_class(self, class_id: UUID, class_data: dict) -> None:
         """
@@ -122,7 +127,8 @@ class ScheduleCache:
             class_data: Class data to cache
         """
         key = self._make_key("class", str(class_id))
-        self.cache.set(key, json.dumps(class_data, default=str), ttl=self.ttl)
+        # Indexed with the listings so every class/course write clears it too
+        self.cache.set_indexed(key, self._encode(class_data), self._listing_index, ttl=self.ttl)
     
     def invalidate_student_schedule(self, student_id: UUID) -> None:
         """
@@ -162,3 +168,117 @@ class ScheduleCache:
     def invalidate_all_schedules(self) -> None:
         """Invalidate all schedule caches."""
         self.cache.invalidate("schedule:*")
+    
+    # ==================== Listing Responses ====================
+    
+    def get_listing(self, kind: str, params: str) -> Optional[dict]:
+        """
+        Get a cached listing response.
+        
+        Args:
+            kind: Listing name (courses, full, day, room)
+            params: Query parameters identifying the page
+            
+        Returns:
+            Dict with "items", "next_cursor" and "etag", or None
+        """
+        return self._decode(self.cache.get(self._make_key(f"list:{kind}", params)))
+    
+    def set_listing(
+        self,
+        kind: str,
+        params: str,
+        items: List[dict],
+        next_cursor: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> None:
+        """
+        Cache a listing response.
+        
+        Args:
+            kind: Listing name (courses, full, day, room)
+            params: Query parameters identifying the page
+            items: Serialized response items
+            next_cursor: Cursor for the following page, if any
+            etag: ETag of the response, stored so readers need not rehash it
+        """
+        key = self._make_key(f"list:{kind}", params)
+        payload = {"items": items, "next_cursor": next_cursor, "etag": etag}
+        self.cache.set_indexed(key, self._encode(payload), self._listing_index, ttl=self.ttl)
+    
+    def invalidate_listings(self) -> None:
+        """
+        Invalidate every cached course and class listing and class entry.
+        
+        These keys are tracked in an index set, so this touches only
+        them instead of SCANning the whole keyspace on every write.
+        """
+        self.cache.invalidate_index(self._listing_index)
+    
+    # ==================== Enrollment Counts ====================
+    
+    def get_enrollment_count(self, class_id: UUID) -> Optional[int]:
+        """
+        Get the cached number of students enrolled in a class.
+        
+        Args:
+            class_id: UUID of the class
+            
+        Returns:
+            Cached count or None
+        """
+        cached = self.cache.get(self._make_key("enrollment_count", str(class_id)))
+        if cached is not None:
+            return int(cached)
+        return None
+    
+    def set_enrollment_count(self, class_id: UUID, count: int) -> None:
+        """
+        Cache the number of students enrolled in a class.
+        
+        Args:
+            class_id: UUID of the class
+            count: Number of enrolled students
+        """
+        key = self._make_key("enrollment_count", str(class_id))
+        self.cache.set(key, str(count), ttl=self.ttl)
+    
+    def invalidate_enrollment_count(self, class_id: UUID) -> None:
+        """
+        Invalidate the cached enrollment count for a class.
+        
+        Args:
+            class_id: UUID of the class
+        """
+        self.cache.delete(self._make_key("enrollment_count", str(class_id)))
+    
+    def invalidate_enrollment_counts(self, class_ids: Iterable[UUID]) -> None:
+        """
+        Invalidate the cached enrollment counts of several classes in one round trip.
+        
+        Args:
+            class_ids: UUIDs of the classes
+        """
+        keys = [self._make_key("enrollment_count", str(class_id)) for class_id in class_ids]
+        if keys:
+            self.cache.delete(*keys)
+
+
+# Singleton instance
+_schedule_cache: Optional[ScheduleCache] = None
+
+
+def get_schedule_cache() -> ScheduleCache:
+    """
+    Get the process-wide ScheduleCache.
+    
+    The wrapper holds no per-request state, so services and routes share
+    one instance instead of building a new one for every request.
+    
+    Returns:
+        ScheduleCache: The schedule cache instance
+    """
+    global _schedule_cache
+    if _schedule_cache is None:
+        _schedule_cache = ScheduleCache()
+    return _schedule_cache
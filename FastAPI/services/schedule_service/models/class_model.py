@@ -1,11 +1,17 @@
 """
 Class model for schedule service.
 """
-from sqlalchemy import Column, String, Time, ForeignKey
+from sqlalchemy import Column, Enum, String, Time, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 from shared.database.base import Base, TimestampMixin
+from shared.models.enums import WeekDay
+
+# Native Postgres enum: 4 bytes per value instead of a varchar, and it
+# sorts in declaration order, so (day_of_week, schedule_time) keys order
+# classes Monday to Sunday. Values are plain strings ("monday", ...).
+week_day = Enum(*(day.value for day in WeekDay), name="week_day")
 
 
 class Class(Base, TimestampMixin):
@@ -14,14 +20,32 @@ class Class(Base, TimestampMixin):
     """
     __tablename__ = "classes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id", ondelete="CASCADE"), nullable=False, index=True)
-    mentor_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
+    mentor_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     name = Column(String(100), nullable=False)
     room_number = Column(String(50), nullable=False)
-    day_of_week = Column(String(20), nullable=False)  # monday, tuesday, etc.
+    day_of_week = Column(week_day, nullable=False)  # monday, tuesday, etc.
     schedule_time = Column(Time, nullable=False)
 
+    __table_args__ = (
+        # Keyset pagination: class listings page by (created_at, id),
+        # schedules by (day_of_week, schedule_time, id)
+        Index("ix_classes_created_id", "created_at", "id"),
+        Index("ix_classes_mentor_day_time_id", "mentor_id", "day_of_week", "schedule_time", "id"),
+        # The full schedule pages through ix_classes_day_time_id, and by-day
+        # and by-room listings use an equality seek plus an ordered scan.
+        # Conflict checks filter (room_number, day_of_week) and
+        # (mentor_id, day_of_week), which are prefixes of ix_classes_room
+        # and ix_classes_mentor_day_time_id; the latter also serves
+        # mentor_id lookups, so mentor_id has no index of its own
+        Index("ix_classes_day_time_id", "day_of_week", "schedule_time", "id"),
+        Index("ix_classes_room", "room_number", "day_of_week", "schedule_time"),
+        # Per-course listings, and the course_id lookups of ON DELETE CASCADE,
+        # through its prefix (course_id has no index of its own)
+        Index("ix_classes_course_day_time", "course_id", "day_of_week", "schedule_time"),
+    )
+
     # Relationships
     course = relationship("Course", back_populates="classes")
     enrollments = relationship("Enrollment", back_populates="class_", cascade="all, delete-orphan")
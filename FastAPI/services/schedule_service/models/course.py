@@ -1,7 +1,7 @@
 """
 Course model for schedule service.
 """
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, String, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -19,6 +19,11 @@ class Course(Base, TimestampMixin):
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
 
+    # Keyset pagination: course listings page by (created_at, id)
+    __table_args__ = (
+        Index("ix_courses_created_id", "created_at", "id"),
+    )
+
     # Relationships
     classes = relationship("Class", back_populates="course", cascade="all, delete-orphan")
     
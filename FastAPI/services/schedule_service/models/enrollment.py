@@ -1,10 +1,9 @@
 """
 Enrollment model for schedule service.
 """
-from sqlalchemy import Column, ForeignKey, PrimaryKeyConstraint, DateTime
+from sqlalchemy import Column, ForeignKey, Index, PrimaryKeyConstraint, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
 from shared.database.base import Base
 
 
@@ -14,13 +13,21 @@ class Enrollment(Base):
     """
     __tablename__ = "enrollments"
 
-    student_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    class_id = Column(UUID(as_uuid=True), ForeignKey("classes.id", ondelete="CASCADE"), nullable=False, index=True)
-    enrolled_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    student_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    class_id = Column(UUID(as_uuid=True), ForeignKey("classes.id", ondelete="CASCADE"), nullable=False)
+    # Filled in by the database, so bulk INSERTs send no per-row timestamp
+    # and every app server stamps enrollments from the same clock
+    enrolled_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    # Composite primary key
+    # Composite primary key. It leads with student_id, so it also serves
+    # per-student lookups (student schedules, enrollment lists) and
+    # student_id needs no index of its own
     __table_args__ = (
         PrimaryKeyConstraint('student_id', 'class_id'),
+        # Its mirror image serves per-class lookups (rosters, enrollment
+        # counts, ON DELETE CASCADE) and the class-side join to users from
+        # the index alone, so class_id has no index of its own either
+        Index('ix_enrollments_class_student', 'class_id', 'student_id'),
     )
 
     # Relationships
@@ -1,13 +1,52 @@
 """
 Base repository implementing the Repository Pattern with SQLAlchemy ORM.
 """
-from typing import TypeVar, Generic, List, Optional, Type
+from typing import TypeVar, Generic, List, Optional, Set, Type, Tuple, Callable, Any, Iterable
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, insert, lambda_stmt, select, tuple_, update
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.exc import SQLAlchemyError
+from shared.config.server_config import get_server_config
 
 T = TypeVar('T')
 
+# Keyset cursor: sort-key values of the last row on the previous page
+Cursor = Tuple[Any, ...]
+
+
+def load_options(*options) -> tuple:
+    """
+    Loader options for a repository query.
+    
+    With STRICT_LOADING enabled, every relationship not loaded by the given
+    options raises on access instead of silently issuing a query per row.
+    Fix the failing query's options rather than turning the flag off.
+    
+    Args:
+        options: Eager-loading options the query needs (e.g. joinedload)
+        
+    Returns:
+        Options to pass to Query.options()
+    """
+    if get_server_config().strict_loading:
+        return options + (raiseload("*"),)
+    return options
+
+
+def strict_loading(stmt: StatementLambdaElement) -> StatementLambdaElement:
+    """
+    lambda_stmt counterpart of load_options(): add raiseload('*') to a
+    cached statement when STRICT_LOADING is enabled.
+    """
+    if get_server_config().strict_loading:
+        stmt += lambda s: s.options(raiseload("*"))
+    return stmt
+
+
+# Listing queries are built with lambda_stmt: the statement for each query
+# shape is constructed and compiled once, later calls only rebind params.
+
 
 class BaseRepository(Generic[T]):
     """
@@ -47,50 +86,138 @@ class BaseRepository(Generic[T]):
             self.db.rollback()
             raise e
     
+    def insert(self, **values) -> T:
+        """
+        Create a record with a single INSERT ... RETURNING round-trip.
+        
+        The returned row (including generated id and timestamps) populates
+        the entity directly, so no refresh SELECT is needed. The entity is
+        detached before commit to keep those values from being expired, so
+        only its column attributes are usable afterwards.
+        
+        Args:
+            values: Column values for the new record
+            
+        Returns:
+            Created entity with generated ID
+        """
+        try:
+            entity = self.db.scalars(
+                insert(self.model).values(**values).returning(self.model)
+            ).one()
+            self.db.expunge(entity)
+            self.db.commit()
+            return entity
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+    
     def find_by_id(self, id: UUID) -> Optional[T]:
         """
         Find a record by its ID.
         
+        Session.get() checks the identity map first, so a record already
+        loaded in this session (e.g. by a check earlier in the request) is
+        returned without another SELECT.
+        
         Args:
             id: UUID of the record
             
         Returns:
             Entity if found, None otherwise
         """
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        return self.db.get(self.model, id)
     
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[T]:
+    def find_all(self, skip: int = 0, limit: int = 100, *options) -> List[T]:
         """
         Get all records with pagination.
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            options: Eager-loading options for the relationships the caller
+                will read (e.g. selectinload(Class.enrollments)); any other
+                relationship access raises under STRICT_LOADING
             
         Returns:
             List of entities
         """
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        return (
+            self.db.query(self.model)
+            .options(*load_options(*options))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+    
+    def find_page(self, cursor: Optional[Cursor] = None, limit: int = 100) -> Tuple[List[T], Optional[Cursor]]:
+        """
+        Get one page of records ordered by (created_at, id).
+        
+        Uses keyset pagination: the cursor is the (created_at, id) of the
+        last record already seen, so deep pages cost the same as the first.
+        
+        Args:
+            cursor: (created_at, id) of the last record on the previous page
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (entities, next_cursor); next_cursor is None on the last page
+        """
+        model = self.model
+        stmt = strict_loading(lambda_stmt(lambda: select(model)))
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            stmt += lambda s: s.where(
+                tuple_(model.created_at, model.id) > tuple_(cursor_created_at, cursor_id)
+            )
+        fetch = limit + 1
+        stmt += lambda s: s.order_by(model.created_at, model.id).limit(fetch)
+        
+        rows = self.db.scalars(stmt).all()
+        return self._split_page(rows, limit, lambda row: (row.created_at, row.id))
+    
+    @staticmethod
+    def _split_page(
+        rows: List[T],
+        limit: int,
+        key: Callable[[T], Cursor]
+    ) -> Tuple[List[T], Optional[Cursor]]:
+        """Trim a limit + 1 result to one page and derive the next cursor."""
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, key(rows[-1])
+        return rows, None
     
     def update(self, id: UUID, **kwargs) -> Optional[T]:
         """
-        Update a record by ID.
+        Update a record by ID with a single UPDATE ... RETURNING round-trip.
+        
+        Nothing is loaded before the write, and the returned row (with the
+        new updated_at) populates the entity, so no refresh SELECT is
+        needed. Like insert(), the entity is detached before commit.
         
         Args:
             id: UUID of the record to update
-            **kwargs: Fields to update
+            **kwargs: Fields to update; keys that are not columns are ignored
             
         Returns:
             Updated entity if found, None otherwise
         """
+        columns = self.model.__table__.c
+        values = {key: value for key, value in kwargs.items() if key in columns}
+        if not values:
+            return self.find_by_id(id)
         try:
-            entity = self.find_by_id(id)
-            if entity:
-                for key, value in kwargs.items():
-                    if hasattr(entity, key):
-                        setattr(entity, key, value)
-                self.db.commit()
-                self.db.refresh(entity)
+            entity = self.db.scalars(
+                update(self.model)
+                .where(self.model.id == id)
+                .values(**values)
+                .returning(self.model)
+            ).one_or_none()
+            if entity is not None:
+                self.db.expunge(entity)
+            self.db.commit()
             return entity
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -119,16 +246,19 @@ class BaseRepository(Generic[T]):
     
     def count(self) -> int:
         """
-        Count total records.
+        Count total records with a plain SELECT count(*).
+        
+        Query.count() would wrap the full entity SELECT in a subquery.
         
         Returns:
             Total number of records
         """
-        return self.db.query(self.model).count()
+        return self.db.scalar(select(func.count()).select_from(self.model))
     
     def exists(self, id: UUID) -> bool:
         """
-        Check if a record exists by ID.
+        Check if a record exists by ID with a SELECT EXISTS, without
+        loading the row.
         
         Args:
             id: UUID of the record
@@ -136,4 +266,19 @@ class BaseRepository(Generic[T]):
         Returns:
             True if exists, False otherwise
         """
-        return self.db.query(self.model).filter(self.model.id == id).first() is not None
+        return self.db.scalar(select(exists().where(self.model.id == id)))
+    
+    def find_existing_ids(self, ids: Iterable[UUID]) -> Set[UUID]:
+        """
+        Find which of the given IDs exist, in one query.
+        
+        Args:
+            ids: UUIDs to look up
+            
+        Returns:
+            The subset of ids that have a record
+        """
+        ids = list(ids)
+        if not ids:
+            return set()
+        return set(self.db.scalars(select(self.model.id).where(self.model.id.in_(ids))))
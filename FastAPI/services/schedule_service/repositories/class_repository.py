@@ -1,12 +1,16 @@
 """
 Class repository for data access.
 """
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import exists, func, insert, lambda_stmt, literal, select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from ..models.class_model import Class
+from ..models.course import Course
 from ..models.enrollment import Enrollment
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, Cursor, load_options, strict_loading
 
 
 class ClassRepository(BaseRepository[Class]):
@@ -17,34 +21,135 @@ class ClassRepository(BaseRepository[Class]):
     def __init__(self, db: Session):
         super().__init__(Class, db)
     
-    def find_by_mentor(self, mentor_id: UUID, skip: int = 0, limit: int = 100) -> List[Class]:
+    def find_by_mentor(
+        self,
+        mentor_id: UUID,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Class], Optional[Cursor]]:
         """
-        Get all classes assigned to a specific mentor.
+        Get one page of classes assigned to a specific mentor.
+        
+        Pages are ordered by (day_of_week, schedule_time, id); the cursor
+        holds those values for the last class on the previous page.
         """
-        return (
-            self.db.query(self.model)
-            .options(joinedload(self.model.course))
-            .filter(self.model.mentor_id == mentor_id)
-            .order_by(self.model.day_of_week, self.model.schedule_time)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        stmt = strict_loading(lambda_stmt(
+            lambda: select(Class).where(Class.mentor_id == mentor_id)
+        ))
+        return self._schedule_page(stmt, cursor, limit)
+    
+    def find_schedule_page(
+        self,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Class], Optional[Cursor]]:
+        """
+        Get one page of all classes in schedule order.
+        
+        Pages are ordered by (day_of_week, schedule_time, id), which
+        ix_classes_day_time_id serves directly: each page is an index range
+        scan from the cursor, however deep it is.
+        """
+        stmt = strict_loading(lambda_stmt(lambda: select(Class)))
+        return self._schedule_page(stmt, cursor, limit)
+    
+    def find_by_student(
+        self,
+        student_id: UUID,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Class], Optional[Cursor]]:
+        """
+        Get one page of classes a student is enrolled in.
+        
+        A single query: the enrollments primary key (student_id, class_id)
+        yields the student's class ids, which join to classes by their
+        primary key. No relationships are loaded.
+        
+        Pages are ordered by (day_of_week, schedule_time, id); the cursor
+        holds those values for the last class on the previous page.
+        """
+        stmt = strict_loading(lambda_stmt(
+            lambda: select(Class)
+            .join(Enrollment, Class.id == Enrollment.class_id)
+            .where(Enrollment.student_id == student_id)
+        ))
+        return self._schedule_page(stmt, cursor, limit)
+    
+    def _schedule_page(
+        self,
+        stmt: StatementLambdaElement,
+        cursor: Optional[Cursor],
+        limit: int
+    ) -> Tuple[List[Class], Optional[Cursor]]:
+        """Apply the (day_of_week, schedule_time, id) keyset to a class query."""
+        if cursor is not None:
+            cursor_day, cursor_time, cursor_id = cursor
+            stmt += lambda s: s.where(
+                tuple_(Class.day_of_week, Class.schedule_time, Class.id)
+                > tuple_(cursor_day, cursor_time, cursor_id)
+            )
+        fetch = limit + 1
+        stmt += lambda s: s.order_by(
+            Class.day_of_week, Class.schedule_time, Class.id
+        ).limit(fetch)
+        
+        rows = self.db.scalars(stmt).all()
+        return self._split_page(
+            rows, limit, lambda row: (row.day_of_week, row.schedule_time, row.id)
         )
     
-    def find_by_student(self, student_id: UUID, skip: int = 0, limit: int = 100) -> List[Class]:
+    def iter_all(self, batch_size: int = 500) -> Iterator[List[Class]]:
         """
-        Get all classes a student is enrolled in.
+        Iterate over every class in (created_at, id) order, batch by batch.
+        
+        yield_per streams rows through a server-side cursor, so only one
+        batch of ORM objects is held in memory at a time.
+        
+        Args:
+            batch_size: Rows fetched and yielded per batch
         """
-        return (
-            self.db.query(self.model)
-            .options(joinedload(self.model.course))
+        stmt = (
+            select(Class)
+            .options(*load_options())
+            .order_by(Class.created_at, Class.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.scalars(stmt).partitions()
+    
+    def fingerprint(self, *criteria) -> Tuple:
+        """
+        Cheap change marker for a class listing: (max(updated_at), count).
+        
+        Any insert, update or delete within the filtered set changes at
+        least one of the two values.
+        
+        Args:
+            criteria: Filters selecting the listing's classes
+        """
+        stmt = select(func.max(self.model.updated_at), func.count()).select_from(self.model)
+        if criteria:
+            stmt = stmt.where(*criteria)
+        return tuple(self.db.execute(stmt).one())
+    
+    def student_fingerprint(self, student_id: UUID) -> Tuple:
+        """
+        Change marker for a student's schedule.
+        
+        Adds the latest enrolled_at so swapping one enrollment for another
+        changes the marker even when the class count stays the same.
+        """
+        stmt = (
+            select(
+                func.max(self.model.updated_at),
+                func.count(),
+                func.max(Enrollment.enrolled_at)
+            )
+            .select_from(self.model)
             .join(Enrollment, self.model.id == Enrollment.class_id)
-            .filter(Enrollment.student_id == student_id)
-            .order_by(self.model.day_of_week, self.model.schedule_time)
-            .offset(skip)
-            .limit(limit)
-            .all()
+            .where(Enrollment.student_id == student_id)
         )
+        return tuple(self.db.execute(stmt).one())
     
     def find_by_course(self, course_id: UUID) -> List[Class]:
         """
@@ -52,44 +157,48 @@ class ClassRepository(BaseRepository[Class]):
         """
         return (
             self.db.query(self.model)
+            .options(*load_options())
             .filter(self.model.course_id == course_id)
             .order_by(self.model.day_of_week, self.model.schedule_time)
             .all()
         )
     
-    def find_by_day(self, day: str) -> List[Class]:
+    def find_by_day(self, day: str, limit: int = 500) -> List[Class]:
         """
-        Get all classes scheduled for a specific day.
+        Get classes scheduled for a specific day, in time order.
+        
+        The ORDER BY is a prefix of ix_classes_day_time_id, so this is an index range
+        scan that stops after limit rows.
         """
-        return (
-            self.db.query(self.model)
-            .options(joinedload(self.model.course))
-            .filter(self.model.day_of_week == day)
-            .order_by(self.model.schedule_time)
-            .all()
-        )
+        stmt = strict_loading(lambda_stmt(
+            lambda: select(Class).where(Class.day_of_week == day)
+        ))
+        stmt += lambda s: s.order_by(Class.day_of_week, Class.schedule_time).limit(limit)
+        return self.db.scalars(stmt).all()
     
-    def find_by_room(self, room_number: str) -> List[Class]:
+    def find_by_room(self, room_number: str, limit: int = 500) -> List[Class]:
         """
-        Get all classes in a specific room.
+        Get classes in a specific room, ordered by day and time (ix_classes_room).
         """
-        return (
-            self.db.query(self.model)
-            .filter(self.model.room_number == room_number)
-            .order_by(self.model.day_of_week, self.model.schedule_time)
-            .all()
-        )
+        stmt = strict_loading(lambda_stmt(
+            lambda: select(Class).where(Class.room_number == room_number)
+        ))
+        stmt += lambda s: s.order_by(Class.day_of_week, Class.schedule_time).limit(limit)
+        return self.db.scalars(stmt).all()
     
     def find_with_details(self, class_id: UUID) -> Optional[Class]:
         """
         Get a class with all related data (course, enrollments).
+        
+        The many-to-one course is joined; enrollments come from a second
+        IN query so the class row is not repeated once per enrollment.
         """
         return (
             self.db.query(self.model)
-            .options(
+            .options(*load_options(
                 joinedload(self.model.course),
-                joinedload(self.model.enrollments)
-            )
+                selectinload(self.model.enrollments)
+            ))
             .filter(self.model.id == class_id)
             .first()
         )
@@ -105,47 +214,10 @@ class ClassRepository(BaseRepository[Class]):
         """
         Find classes that conflict with the given room, day, and time.
         """
-        from datetime import datetime, timedelta
-        
-        # Calculate time range
-        if isinstance(schedule_time, str):
-            start_time = datetime.strptime(schedule_time, "%H:%M").time()
-        else:
-            start_time = schedule_time
-        
-        # Create datetime for calculation
-        base_date = datetime(2000, 1, 1)
-        start_dt = datetime.combine(base_date, start_time)
-        end_dt = start_dt + timedelta(minutes=duration_minutes)
-        end_time = end_dt.time()
-        
-        query = (
-            self.db.query(self.model)
-            .options(joinedload(self.model.course))
-            .filter(
-                self.model.room_number == room_number,
-                self.model.day_of_week == day_of_week
-            )
+        return self._find_overlapping(
+            (self.model.room_number == room_number, self.model.day_of_week == day_of_week),
+            schedule_time, duration_minutes, exclude_class_id
         )
-        
-        if exclude_class_id:
-            query = query.filter(self.model.id != exclude_class_id)
-        
-        # Get all classes in that room on that day and filter by time overlap
-        classes = query.all()
-        conflicts = []
-        
-        for cls in classes:
-            cls_start = cls.schedule_time
-            cls_start_dt = datetime.combine(base_date, cls_start)
-            cls_end_dt = cls_start_dt + timedelta(minutes=duration_minutes)
-            cls_end = cls_end_dt.time()
-            
-            # Check for overlap
-            if not (end_time <= cls_start or start_time >= cls_end):
-                conflicts.append(cls)
-        
-        return conflicts
     
     def find_conflicts_by_mentor(
         self, 
@@ -158,40 +230,141 @@ class ClassRepository(BaseRepository[Class]):
         """
         Find classes that conflict with the given mentor, day, and time.
         """
-        from datetime import datetime, timedelta
+        return self._find_overlapping(
+            (self.model.mentor_id == mentor_id, self.model.day_of_week == day_of_week),
+            schedule_time, duration_minutes, exclude_class_id
+        )
+    
+    def _find_overlapping(
+        self,
+        criteria: tuple,
+        schedule_time,
+        duration_minutes: int,
+        exclude_class_id: Optional[UUID]
+    ) -> List[Class]:
+        """
+        Find classes matching criteria whose time slot overlaps the given one.
+        
+        Every class is taken to last duration_minutes, so two slots overlap
+        exactly when their start times are less than duration_minutes apart.
+        That turns the overlap test into a schedule_time range the database
+        can answer from ix_classes_room / ix_classes_mentor_day_time_id.
+        The window is clipped to the day; day_of_week matching is exact.
+        """
+        return (
+            self.db.query(self.model)
+            .options(*load_options(joinedload(self.model.course)))
+            .filter(*self._overlap_conditions(
+                criteria, schedule_time, duration_minutes, exclude_class_id
+            ))
+            .order_by(self.model.schedule_time)
+            .all()
+        )
+    
+    def _overlap_conditions(
+        self,
+        criteria: tuple,
+        schedule_time,
+        duration_minutes: int,
+        exclude_class_id: Optional[UUID] = None
+    ) -> list:
+        """Build the WHERE conditions used by _find_overlapping."""
+        from datetime import datetime, time, timedelta
         
         if isinstance(schedule_time, str):
-            start_time = datetime.strptime(schedule_time, "%H:%M").time()
-        else:
-            start_time = schedule_time
+            schedule_time = time.fromisoformat(schedule_time)
         
         base_date = datetime(2000, 1, 1)
-        start_dt = datetime.combine(base_date, start_time)
-        end_dt = start_dt + timedelta(minutes=duration_minutes)
-        end_time = end_dt.time()
-        
-        query = (
-            self.db.query(self.model)
-            .options(joinedload(self.model.course))
-            .filter(
-                self.model.mentor_id == mentor_id,
-                self.model.day_of_week == day_of_week
-            )
-        )
+        start_dt = datetime.combine(base_date, schedule_time)
+        duration = timedelta(minutes=duration_minutes)
+        earliest = start_dt - duration
+        latest = start_dt + duration
         
+        conditions = list(criteria)
+        if earliest.date() == base_date.date():
+            conditions.append(self.model.schedule_time > earliest.time())
+        if latest.date() == base_date.date():
+            conditions.append(self.model.schedule_time < latest.time())
         if exclude_class_id:
-            query = query.filter(self.model.id != exclude_class_id)
+            conditions.append(self.model.id != exclude_class_id)
+        return conditions
+    
+    def _lock_slots(self, day_of_week: str, room_number: str, mentor_id: Optional[UUID]) -> None:
+        """
+        Serialize conflict-checked writes to the same room or mentor day.
+        
+        Takes a transaction-scoped advisory lock per (room, day) and
+        (mentor, day), in a fixed order so two writers cannot deadlock.
+        Under READ COMMITTED, two concurrent NOT EXISTS checks would
+        otherwise both miss each other's uncommitted row and both insert.
+        Other dialects (the sqlite test setup) serialize writes already.
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        keys = [f"classes:room:{room_number}:{day_of_week}"]
+        if mentor_id:
+            keys.append(f"classes:mentor:{mentor_id}:{day_of_week}")
+        for key in sorted(keys):
+            self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(key))))
+    
+    def insert_without_conflicts(self, duration_minutes: int, **values) -> Optional[Class]:
+        """
+        Create a class only if its course exists and its slot is free.
         
-        classes = query.all()
-        conflicts = []
+        Locks the room's and mentor's day (see _lock_slots), then runs one
+        INSERT ... SELECT ... WHERE EXISTS (course) AND NOT EXISTS (room or
+        mentor overlap) RETURNING statement, so the checks and the insert
+        share a round-trip. The locks make this race-free against other
+        calls of this method; create_class() and update_class() do not
+        check conflicts and take no locks.
         
-        for cls in classes:
-            cls_start = cls.schedule_time
-            cls_start_dt = datetime.combine(base_date, cls_start)
-            cls_end_dt = cls_start_dt + timedelta(minutes=duration_minutes)
-            cls_end = cls_end_dt.time()
+        Args:
+            duration_minutes: Duration used for the overlap test
+            values: Column values for the new class
             
-            if not (end_time <= cls_start or start_time >= cls_end):
-                conflicts.append(cls)
+        Returns:
+            Created class (detached, like insert()), or None when the course
+            is missing or the slot conflicts; re-run the conflict queries to
+            find out which
+        """
+        schedule_time = values["schedule_time"]
+        day_of_week = values["day_of_week"]
+        guards = [
+            exists().where(Course.id == values["course_id"]),
+            ~exists().where(*self._overlap_conditions(
+                (self.model.room_number == values["room_number"],
+                 self.model.day_of_week == day_of_week),
+                schedule_time, duration_minutes
+            )),
+        ]
+        if values.get("mentor_id"):
+            guards.append(~exists().where(*self._overlap_conditions(
+                (self.model.mentor_id == values["mentor_id"],
+                 self.model.day_of_week == day_of_week),
+                schedule_time, duration_minutes
+            )))
         
-        return conflicts
+        names = list(values)
+        stmt = (
+            insert(self.model)
+            .from_select(
+                names,
+                select(*(
+                    literal(values[name], type_=self.model.__table__.c[name].type)
+                    for name in names
+                )).where(*guards)
+            )
+            .returning(self.model)
+        )
+        try:
+            self._lock_slots(day_of_week, values["room_number"], values.get("mentor_id"))
+            entity = self.db.scalars(stmt).one_or_none()
+            if entity is None:
+                self.db.rollback()
+                return None
+            self.db.expunge(entity)
+            self.db.commit()
+            return entity
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
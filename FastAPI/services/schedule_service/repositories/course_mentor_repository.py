@@ -1,10 +1,11 @@
 """
 CourseMentor repository for managing course-mentor assignments.
 """
-from typing import List, Optional
+from typing import Any, List, Optional, Dict
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
+from services.auth_service.repositories.user_repository import UserRepository
 from ..models.course_mentor import CourseMentor
 
 
@@ -64,6 +65,31 @@ class CourseMentorRepository:
         ).all()
         return [r[0] for r in results]
     
+    def get_mentor_contacts_for_courses(self, course_ids: List[UUID]) -> Dict[UUID, List[Any]]:
+        """
+        Get (id, full_name, email) of the mentors of several courses.
+        
+        Reads the assignments of the whole page in one query; mentor
+        details come from UserRepository.find_contacts, which serves
+        recently seen mentors from memory and fetches the rest in one query.
+        """
+        mentors = {course_id: [] for course_id in course_ids}
+        if not course_ids:
+            return mentors
+        assignments = (
+            self.db.query(CourseMentor.course_id, CourseMentor.mentor_id)
+            .filter(CourseMentor.course_id.in_(course_ids))
+            .all()
+        )
+        contacts = UserRepository(self.db).find_contacts(
+            list({row.mentor_id for row in assignments})
+        )
+        for row in assignments:
+            contact = contacts.get(row.mentor_id)
+            if contact is not None:
+                mentors[row.course_id].append(contact)
+        return mentors
+    
     def get_courses_for_mentor(self, mentor_id: UUID) -> List[UUID]:
         """
         Get all course IDs a mentor is assigned to.
@@ -76,18 +102,30 @@ class CourseMentorRepository:
     def set_mentors_for_course(self, course_id: UUID, mentor_ids: List[UUID]) -> List[CourseMentor]:
         """
         Set the complete list of mentors for a course (replaces existing).
+        
+        Runs one DELETE and one multi-row INSERT ... RETURNING in a single
+        transaction, instead of adding and flushing a CourseMentor per
+        mentor. The returned assignments are detached, like
+        BaseRepository.insert() results.
         """
         # Remove all existing assignments
         self.db.query(CourseMentor).filter(
             CourseMentor.course_id == course_id
         ).delete()
         
-        # Add new assignments
+        # Add new assignments (duplicates would violate the primary key)
         assignments = []
-        for mentor_id in mentor_ids:
-            assignment = CourseMentor(course_id=course_id, mentor_id=mentor_id)
-            self.db.add(assignment)
-            assignments.append(assignment)
+        if mentor_ids:
+            assignments = list(self.db.scalars(
+                insert(CourseMentor)
+                .values([
+                    {"course_id": course_id, "mentor_id": mentor_id}
+                    for mentor_id in dict.fromkeys(mentor_ids)
+                ])
+                .returning(CourseMentor)
+            ))
+            for assignment in assignments:
+                self.db.expunge(assignment)
         
         self.db.commit()
         return assignments
@@ -1,11 +1,21 @@
 """
 Enrollment repository for data access.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import exists, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from ..models.class_model import Class
 from ..models.enrollment import Enrollment
+from .base_repository import load_options
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
 
 
 class EnrollmentRepository:
@@ -18,27 +28,83 @@ class EnrollmentRepository:
         self.db = db
         self.model = Enrollment
     
-    def create(self, student_id: UUID, class_id: UUID) -> Enrollment:
+    def create_if_absent(self, student_id: UUID, class_id: UUID) -> Optional[Enrollment]:
         """
-        Create a new enrollment.
+        Enroll a student with one guarded INSERT ... SELECT round-trip.
+        
+        The row is inserted only if the class exists, and ON CONFLICT DO
+        NOTHING skips it if the student is already enrolled, so no
+        separate existence checks are needed.
         
         Args:
             student_id: UUID of the student
             class_id: UUID of the class
             
         Returns:
-            Created enrollment
-        """
+            Created enrollment (detached), or None if the class does not
+            exist or the student is already enrolled
+        """
+        upsert = _UPSERT_INSERTS[self.db.get_bind().dialect.name]
+        stmt = (
+            upsert(self.model)
+            .from_select(
+                ["student_id", "class_id"],
+                select(
+                    literal(student_id, type_=self.model.student_id.type),
+                    literal(class_id, type_=self.model.class_id.type)
+                ).where(exists().where(Class.id == class_id))
+            )
+            .on_conflict_do_nothing(index_elements=["student_id", "class_id"])
+            .returning(self.model)
+        )
         try:
-            enrollment = Enrollment(student_id=student_id, class_id=class_id)
-            self.db.add(enrollment)
+            enrollment = self.db.scalars(stmt).one_or_none()
+            if enrollment is None:
+                self.db.rollback()
+                return None
+            self.db.expunge(enrollment)
             self.db.commit()
-            self.db.refresh(enrollment)
             return enrollment
         except SQLAlchemyError as e:
             self.db.rollback()
             raise e
     
+    def create_many(self, pairs: List[Tuple[UUID, UUID]]) -> List[Dict[str, Any]]:
+        """
+        Create many enrollments in one INSERT ... ON CONFLICT DO NOTHING.
+        
+        Pairs that are already enrolled are skipped by the database instead
+        of being checked one by one.
+        
+        Args:
+            pairs: (student_id, class_id) pairs to enroll
+            
+        Returns:
+            Enrollment dicts for the rows actually inserted
+        """
+        if not pairs:
+            return []
+        
+        upsert = _UPSERT_INSERTS[self.db.get_bind().dialect.name]
+        stmt = (
+            upsert(self.model)
+            .values([
+                {"student_id": student_id, "class_id": class_id}
+                for student_id, class_id in pairs
+            ])
+            .on_conflict_do_nothing(index_elements=["student_id", "class_id"])
+            .returning(
+                self.model.student_id, self.model.class_id, self.model.enrolled_at
+            )
+        )
+        try:
+            created = [dict(row) for row in self.db.execute(stmt).mappings()]
+            self.db.commit()
+            return created
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+    
     def find_by_student_and_class(self, student_id: UUID, class_id: UUID) -> Optional[Enrollment]:
         """
         Find an enrollment by student and class.
@@ -69,9 +135,11 @@ class EnrollmentRepository:
         Returns:
             List of enrollments
         """
+        # Enrollment responses carry only the enrollment's own columns, so
+        # the class is not joined in; with STRICT_LOADING any traversal raises
         return (
             self.db.query(self.model)
-            .options(joinedload(self.model.class_))
+            .options(*load_options())
             .filter(self.model.student_id == student_id)
             .all()
         )
@@ -88,6 +156,7 @@ class EnrollmentRepository:
         """
         return (
             self.db.query(self.model)
+            .options(*load_options())
             .filter(self.model.class_id == class_id)
             .all()
         )
@@ -116,7 +185,8 @@ class EnrollmentRepository:
     
     def exists(self, student_id: UUID, class_id: UUID) -> bool:
         """
-        Check if an enrollment exists.
+        Check if an enrollment exists with a SELECT EXISTS on the primary
+        key, without loading the row.
         
         Args:
             student_id: UUID of the student
@@ -125,7 +195,10 @@ class EnrollmentRepository:
         Returns:
             True if exists, False otherwise
         """
-        return self.find_by_student_and_class(student_id, class_id) is not None
+        return self.db.scalar(select(exists().where(
+            self.model.student_id == student_id,
+            self.model.class_id == class_id
+        )))
     
     def count_students_in_class(self, class_id: UUID) -> int:
         """
@@ -137,7 +210,14 @@ class EnrollmentRepository:
         Returns:
             Number of enrolled students
         """
-        return self.db.query(self.model).filter(self.model.class_id == class_id).count()
+        # Plain COUNT(*) on the class_id index; Query.count() would wrap the
+        # full entity select in a subquery
+        stmt = (
+            select(func.count())
+            .select_from(self.model)
+            .where(self.model.class_id == class_id)
+        )
+        return self.db.execute(stmt).scalar_one()
     
     def count_classes_for_student(self, student_id: UUID) -> int:
         """
@@ -149,4 +229,9 @@ class EnrollmentRepository:
         Returns:
             Number of enrolled classes
         """
-        return self.db.query(self.model).filter(self.model.student_id == student_id).count()
+        stmt = (
+            select(func.count())
+            .select_from(self.model)
+            .where(self.model.student_id == student_id)
+        )
+        return self.db.execute(stmt).scalar_one()
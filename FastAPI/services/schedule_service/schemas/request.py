@@ -6,6 +6,8 @@ from typing import Optional, List
 from uuid import UUID
 from datetime import time
 
+from shared.models.enums import WeekDay
+
 
 class CourseCreate(BaseModel):
     """Schema for creating a course"""
@@ -60,10 +62,11 @@ class ClassCreate(BaseModel):
     mentor_id: Optional[UUID] = Field(None, description="Mentor UUID")
     name: str = Field(..., min_length=3, max_length=100, description="Class name")
     room_number: str = Field(..., min_length=1, max_length=50, description="Room number")
-    day_of_week: str = Field(..., description="Day of the week (monday, tuesday, etc.)")
+    day_of_week: WeekDay = Field(..., description="Day of the week (monday, tuesday, etc.)")
     schedule_time: time = Field(..., description="Class time")
 
     class Config:
+        use_enum_values = True
         json_schema_extra = {
             "example": {
                 "course_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -82,10 +85,11 @@ class ClassUpdate(BaseModel):
     mentor_id: Optional[UUID] = None
     name: Optional[str] = Field(None, min_length=3, max_length=100)
     room_number: Optional[str] = Field(None, min_length=1, max_length=50)
-    day_of_week: Optional[str] = None
+    day_of_week: Optional[WeekDay] = None
     schedule_time: Optional[time] = None
 
     class Config:
+        use_enum_values = True
         json_schema_extra = {
             "example": {
                 "room_number": "B202",
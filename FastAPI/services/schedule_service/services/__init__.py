@@ -3,5 +3,6 @@ Schedule service business logic layer.
 """
 from .schedule_service import ScheduleService
 from .enrollment_service import EnrollmentService
+from .exceptions import ScheduleValidationError
 
-__all__ = ['ScheduleService', 'EnrollmentService']
+__all__ = ['ScheduleService', 'EnrollmentService', 'ScheduleValidationError']
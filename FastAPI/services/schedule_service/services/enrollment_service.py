@@ -1,11 +1,13 @@
 """
 Enrollment service for managing student enrollments.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 from ..repositories import EnrollmentRepository, ClassRepository
 from ..models import Enrollment
+from ..cache import ScheduleCache, get_schedule_cache
+from .exceptions import ScheduleValidationError
 from shared.models.user import User
 
 
@@ -14,10 +16,11 @@ class EnrollmentService:
     Service for managing student enrollments in classes.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, cache: Optional[ScheduleCache] = None):
         self.db = db
         self.enrollment_repo = EnrollmentRepository(db)
         self.class_repo = ClassRepository(db)
+        self.cache = cache or get_schedule_cache()
     
     def enroll_student(self, student_id: UUID, class_id: UUID) -> Enrollment:
         """
@@ -31,18 +34,17 @@ class EnrollmentService:
             Created enrollment
             
         Raises:
-            ValueError: If class doesn't exist or student already enrolled
-        """
-        # Verify class exists
-        if not self.class_repo.exists(class_id):
-            raise ValueError(f"Class with ID {class_id} does not exist")
-        
-        # Check if already enrolled
-        if self.enrollment_repo.exists(student_id, class_id):
-            raise ValueError(f"Student is already enrolled in this class")
+            ScheduleValidationError: If class doesn't exist or student already enrolled
+        """
+        enrollment = self.enrollment_repo.create_if_absent(student_id, class_id)
+        if enrollment is None:
+            # Nothing was inserted; find out why only on this error path
+            if not self.class_repo.exists(class_id):
+                raise ScheduleValidationError(f"Class with ID {class_id} does not exist")
+            raise ScheduleValidationError(f"Student is already enrolled in this class")
         
-        # Create enrollment
-        return self.enrollment_repo.create(student_id, class_id)
+        self.cache.invalidate_enrollment_count(class_id)
+        return enrollment
     
     def unenroll_student(self, student_id: UUID, class_id: UUID) -> bool:
         """
@@ -55,7 +57,10 @@ class EnrollmentService:
         Returns:
             True if unenrolled, False if not found
         """
-        return self.enrollment_repo.delete(student_id, class_id)
+        deleted = self.enrollment_repo.delete(student_id, class_id)
+        if deleted:
+            self.cache.invalidate_enrollment_count(class_id)
+        return deleted
     
     def get_student_enrollments(self, student_id: UUID) -> List[Enrollment]:
         """
@@ -76,28 +81,34 @@ class EnrollmentService:
         Returns:
             List of enrollment dicts with student_name and student_readable_id
         """
-        enrollments = self.enrollment_repo.find_by_class(class_id)
-        result = []
+        # Student details are joined in, instead of one lookup per enrollment
+        rows = (
+            self.db.query(Enrollment, User.full_name, User.student_id)
+            .outerjoin(User, User.id == Enrollment.student_id)
+            .filter(Enrollment.class_id == class_id)
+            .all()
+        )
         
-        for enrollment in enrollments:
-            # Get student details
-            student = self.db.query(User).filter(User.id == enrollment.student_id).first()
-            
-            result.append({
+        return [
+            {
                 "student_id": enrollment.student_id,
-                "student_name": student.full_name if student else None,
-                "student_readable_id": student.student_id if student else None,
+                "student_name": full_name,
+                "student_readable_id": readable_id,
                 "class_id": enrollment.class_id,
                 "enrolled_at": enrollment.enrolled_at
-            })
-        
-        return result
+            }
+            for enrollment, full_name, readable_id in rows
+        ]
     
     def get_enrolled_students_count(self, class_id: UUID) -> int:
         """
         Get the number of students enrolled in a class.
         """
-        return self.enrollment_repo.count_students_in_class(class_id)
+        count = self.cache.get_enrollment_count(class_id)
+        if count is None:
+            count = self.enrollment_repo.count_students_in_class(class_id)
+            self.cache.set_enrollment_count(class_id, count)
+        return count
     
     def get_student_classes_count(self, student_id: UUID) -> int:
         """
@@ -111,26 +122,55 @@ class EnrollmentService:
         """
         return self.enrollment_repo.exists(student_id, class_id)
     
-    def bulk_enroll_students(self, student_ids: List[UUID], class_id: UUID) -> List[Enrollment]:
+    def bulk_enroll(self, pairs: List[Tuple[UUID, UUID]]) -> List[Dict[str, Any]]:
         """
-        Enroll multiple students in a class.
+        Enroll many (student, class) pairs in a single transaction.
+        
+        Classes and students are validated with one IN query each, then all
+        rows go in as one INSERT ... ON CONFLICT DO NOTHING, so pairs that
+        are already enrolled (or repeated in the request) are skipped.
         
         Args:
-            student_ids: List of student UUIDs
-            class_id: UUID of the class
+            pairs: (student_id, class_id) pairs to enroll
             
         Returns:
-            List of created enrollments
+            Enrollment dicts for the newly created enrollments
+            
+        Raises:
+            ScheduleValidationError: If any class or student doesn't exist
         """
-        # Verify class exists
-        if not self.class_repo.exists(class_id):
-            raise ValueError(f"Class with ID {class_id} does not exist")
+        pairs = list(dict.fromkeys(pairs))
+        class_ids = {class_id for _, class_id in pairs}
+        student_ids = {student_id for student_id, _ in pairs}
+        
+        missing_classes = class_ids - self.class_repo.find_existing_ids(class_ids)
+        if missing_classes:
+            raise ScheduleValidationError(
+                f"Classes do not exist: {', '.join(sorted(map(str, missing_classes)))}"
+            )
         
-        enrollments = []
-        for student_id in student_ids:
-            # Skip if already enrolled
-            if not self.enrollment_repo.exists(student_id, class_id):
-                enrollment = self.enrollment_repo.create(student_id, class_id)
-                enrollments.append(enrollment)
+        found_students = {
+            row[0] for row in self.db.query(User.id).filter(User.id.in_(student_ids))
+        } if student_ids else set()
+        missing_students = student_ids - found_students
+        if missing_students:
+            raise ScheduleValidationError(
+                f"Students do not exist: {', '.join(sorted(map(str, missing_students)))}"
+            )
         
+        enrollments = self.enrollment_repo.create_many(pairs)
+        self.cache.invalidate_enrollment_counts({e["class_id"] for e in enrollments})
         return enrollments
+    
+    def bulk_enroll_students(self, student_ids: List[UUID], class_id: UUID) -> List[Dict[str, Any]]:
+        """
+        Enroll multiple students in a class.
+        
+        Args:
+            student_ids: List of student UUIDs
+            class_id: UUID of the class
+            
+        Returns:
+            Enrollment dicts for the newly created enrollments
+        """
+        return self.bulk_enroll([(student_id, class_id) for student_id in student_ids])
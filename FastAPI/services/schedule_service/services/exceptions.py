@@ -0,0 +1,13 @@
+"""
+Schedule service exceptions.
+"""
+
+
+class ScheduleValidationError(ValueError):
+    """
+    Exception raised when a schedule request breaks a business rule
+    (unknown course or class, duplicate code or enrollment, bad cursor).
+    
+    Subclasses ValueError so callers that already catch ValueError keep
+    working; the app maps only this type to a 400 response.
+    """
@@ -2,12 +2,17 @@
 Schedule service implementing business logic.
 Includes filtering methods (simplified from Strategy pattern).
 """
-from typing import List, Optional
+from datetime import time
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 from ..repositories import CourseRepository, ClassRepository
+from ..repositories.base_repository import Cursor
 from ..repositories.course_mentor_repository import CourseMentorRepository
+from ..cache import ScheduleCache, get_schedule_cache
 from ..models import Course, Class
+from shared.pagination import CREATED_CURSOR
+from .exceptions import ScheduleValidationError
 
 
 class ScheduleService:
@@ -16,11 +21,17 @@ class ScheduleService:
     Includes role-based filtering methods.
     """
     
-    def __init__(self, db: Session):
+    # Cursor field parsers: courses/classes page by (created_at, id),
+    # student and mentor schedules by (day_of_week, schedule_time, id)
+    CREATED_CURSOR = CREATED_CURSOR
+    SCHEDULE_CURSOR = (str, time.fromisoformat, UUID)
+    
+    def __init__(self, db: Session, cache: Optional[ScheduleCache] = None):
         self.db = db
         self.course_repo = CourseRepository(db)
         self.class_repo = ClassRepository(db)
         self.course_mentor_repo = CourseMentorRepository(db)
+        self.cache = cache or get_schedule_cache()
     
     # ==================== Course Management ====================
     
@@ -45,24 +56,28 @@ class ScheduleService:
         """
         # Check if code already exists
         if self.course_repo.code_exists(code):
-            raise ValueError(f"Course code '{code}' already exists")
+            raise ScheduleValidationError(f"Course code '{code}' already exists")
         
-        course = Course(code=code, name=name, description=description)
-        created_course = self.course_repo.create(course)
+        created_course = self.course_repo.insert(code=code, name=name, description=description)
         
         # Assign mentors if provided
         if mentor_ids:
             self.course_mentor_repo.set_mentors_for_course(created_course.id, mentor_ids)
         
+        self.cache.invalidate_listings()
         return created_course
     
     def get_course(self, course_id: UUID) -> Optional[Course]:
         """Get course by ID."""
         return self.course_repo.find_by_id(course_id)
     
-    def get_all_courses(self, skip: int = 0, limit: int = 100) -> List[Course]:
-        """Get all courses with pagination."""
-        return self.course_repo.find_all(skip=skip, limit=limit)
+    def get_all_courses(
+        self,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Course], Optional[Cursor]]:
+        """Get one page of courses and the cursor for the next page."""
+        return self.course_repo.find_page(cursor=cursor, limit=limit)
     
     def update_course(self, course_id: UUID, mentor_ids: Optional[List[UUID]] = None, **kwargs) -> Optional[Course]:
         """
@@ -80,13 +95,15 @@ class ScheduleService:
         if 'code' in kwargs:
             existing = self.course_repo.find_by_code(kwargs['code'])
             if existing and existing.id != course_id:
-                raise ValueError(f"Course code '{kwargs['code']}' already exists")
+                raise ScheduleValidationError(f"Course code '{kwargs['code']}' already exists")
         
         # Update mentor assignments if provided
         if mentor_ids is not None:
             self.course_mentor_repo.set_mentors_for_course(course_id, mentor_ids)
         
-        return self.course_repo.update(course_id, **kwargs)
+        course = self.course_repo.update(course_id, **kwargs)
+        self.cache.invalidate_listings()
+        return course
     
     def delete_course(self, course_id: UUID) -> bool:
         """
@@ -98,14 +115,25 @@ class ScheduleService:
         Returns:
             True if deleted
         """
-        return self.course_repo.delete(course_id)
+        deleted = self.course_repo.delete(course_id)
+        if deleted:
+            self.cache.invalidate_listings()
+        return deleted
     
     # ==================== Course Mentor Management ====================
     
+    def course_exists(self, course_id: UUID) -> bool:
+        """Check if a course exists without loading it."""
+        return self.course_repo.exists(course_id)
+    
     def get_mentors_for_course(self, course_id: UUID) -> List[UUID]:
         """Get all mentor IDs assigned to a course."""
         return self.course_mentor_repo.get_mentors_for_course(course_id)
     
+    def get_mentor_contacts_for_courses(self, course_ids: List[UUID]) -> Dict[UUID, List]:
+        """Get (id, full_name, email) rows of the mentors of several courses."""
+        return self.course_mentor_repo.get_mentor_contacts_for_courses(course_ids)
+    
     def get_courses_for_mentor(self, mentor_id: UUID) -> List[UUID]:
         """Get all course IDs a mentor is assigned to."""
         return self.course_mentor_repo.get_courses_for_mentor(mentor_id)
@@ -113,11 +141,15 @@ class ScheduleService:
     def assign_mentor_to_course(self, course_id: UUID, mentor_id: UUID) -> bool:
         """Assign a mentor to a course."""
         self.course_mentor_repo.assign_mentor(course_id, mentor_id)
+        self.cache.invalidate_listings()
         return True
     
     def remove_mentor_from_course(self, course_id: UUID, mentor_id: UUID) -> bool:
         """Remove a mentor from a course."""
-        return self.course_mentor_repo.remove_mentor(course_id, mentor_id)
+        removed = self.course_mentor_repo.remove_mentor(course_id, mentor_id)
+        if removed:
+            self.cache.invalidate_listings()
+        return removed
     
     def is_mentor_assigned_to_course(self, course_id: UUID, mentor_id: UUID) -> bool:
         """Check if a mentor is assigned to a course."""
@@ -150,9 +182,9 @@ class ScheduleService:
         """
         # Verify course exists
         if not self.course_repo.exists(course_id):
-            raise ValueError(f"Course with ID {course_id} does not exist")
+            raise ScheduleValidationError(f"Course with ID {course_id} does not exist")
         
-        class_obj = Class(
+        created_class = self.class_repo.insert(
             course_id=course_id,
             mentor_id=mentor_id,
             name=name,
@@ -160,16 +192,20 @@ class ScheduleService:
             day_of_week=day_of_week,
             schedule_time=schedule_time
         )
-        
-        return self.class_repo.create(class_obj)
+        self.cache.invalidate_listings()
+        return created_class
     
     def get_class(self, class_id: UUID) -> Optional[Class]:
         """Get class by ID."""
         return self.class_repo.find_by_id(class_id)
     
-    def get_all_classes(self, skip: int = 0, limit: int = 100) -> List[Class]:
-        """Get all classes with pagination."""
-        return self.class_repo.find_all(skip=skip, limit=limit)
+    def get_all_classes(
+        self,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Class], Optional[Cursor]]:
+        """Get one page of classes and the cursor for the next page."""
+        return self.class_repo.find_page(cursor=cursor, limit=limit)
     
     def update_class(self, class_id: UUID, **kwargs) -> Optional[Class]:
         """
@@ -182,7 +218,10 @@ class ScheduleService:
         Returns:
             Updated class
         """
-        return self.class_repo.update(class_id, **kwargs)
+        class_obj = self.class_repo.update(class_id, **kwargs)
+        if class_obj:
+            self.cache.invalidate_listings()
+        return class_obj
     
     def delete_class(self, class_id: UUID) -> bool:
         """
@@ -194,61 +233,119 @@ class ScheduleService:
         Returns:
             True if deleted
         """
-        return self.class_repo.delete(class_id)
+        deleted = self.class_repo.delete(class_id)
+        if deleted:
+            self.cache.invalidate_listings()
+            self.cache.invalidate_enrollment_count(class_id)
+        return deleted
     
     # ==================== Schedule Filtering ====================
     
-    def get_schedule_for_student(self, student_id: UUID, skip: int = 0, limit: int = 100) -> List[Class]:
+    def get_schedule_for_student(
+        self,
+        student_id: UUID,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Class], Optional[Cursor]]:
         """
         Get schedule for a specific student (only enrolled classes).
         """
-        return self.class_repo.find_by_student(student_id, skip=skip, limit=limit)
+        return self.class_repo.find_by_student(student_id, cursor=cursor, limit=limit)
     
-    def get_schedule_for_mentor(self, mentor_id: UUID, skip: int = 0, limit: int = 100) -> List[Class]:
+    def get_schedule_for_mentor(
+        self,
+        mentor_id: UUID,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Class], Optional[Cursor]]:
         """
         Get schedule for a specific mentor (only assigned classes).
         """
-        return self.class_repo.find_by_mentor(mentor_id, skip=skip, limit=limit)
+        return self.class_repo.find_by_mentor(mentor_id, cursor=cursor, limit=limit)
     
-    def get_full_schedule(self, skip: int = 0, limit: int = 100) -> List[Class]:
+    def get_full_schedule(
+        self,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> Tuple[List[Class], Optional[Cursor]]:
         """
         Get full schedule (all classes) - for admins/supervisors.
         """
-        return self.class_repo.find_all(skip=skip, limit=limit)
+        return self.class_repo.find_schedule_page(cursor=cursor, limit=limit)
+    
+    def iter_full_schedule(self, batch_size: int = 500) -> Iterator[List[Class]]:
+        """
+        Stream the full schedule in batches, for exports too large to page.
+        """
+        return self.class_repo.iter_all(batch_size=batch_size)
     
     def get_schedule_by_role(
         self,
         user_id: UUID,
         role: str,
-        skip: int = 0,
+        cursor: Optional[Cursor] = None,
         limit: int = 100
-    ) -> List[Class]:
+    ) -> Tuple[List[Class], Optional[Cursor]]:
         """
         Get schedule based on user role.
         """
         if role == 'student':
-            return self.get_schedule_for_student(user_id, skip, limit)
+            return self.get_schedule_for_student(user_id, cursor, limit)
         elif role == 'mentor':
-            return self.get_schedule_for_mentor(user_id, skip, limit)
+            return self.get_schedule_for_mentor(user_id, cursor, limit)
         elif role == 'admin':
-            return self.get_full_schedule(skip, limit)
+            return self.get_full_schedule(cursor, limit)
         else:
-            raise ValueError(f"Invalid role: {role}")
+            raise ScheduleValidationError(f"Invalid role: {role}")
     
     # ==================== Additional Queries ====================
     
-    def get_classes_by_day(self, day: str) -> List[Class]:
-        """Get all classes for a specific day."""
-        return self.class_repo.find_by_day(day)
+    def get_classes_by_day(self, day: str, limit: int = 500) -> List[Class]:
+        """Get up to limit classes for a specific day."""
+        return self.class_repo.find_by_day(day, limit=limit)
     
-    def get_classes_by_room(self, room_number: str) -> List[Class]:
-        """Get all classes in a specific room."""
-        return self.class_repo.find_by_room(room_number)
+    def get_classes_by_room(self, room_number: str, limit: int = 500) -> List[Class]:
+        """Get up to limit classes in a specific room."""
+        return self.class_repo.find_by_room(room_number, limit=limit)
     
     def get_classes_by_course(self, course_id: UUID) -> List[Class]:
         """Get all classes for a specific course."""
         return self.class_repo.find_by_course(course_id)
     
+    def get_schedule_fingerprint(
+        self,
+        day: Optional[str] = None,
+        room_number: Optional[str] = None,
+        mentor_id: Optional[UUID] = None,
+        student_id: Optional[UUID] = None
+    ) -> tuple:
+        """
+        Get a cheap change marker for a class listing (used for HTTP ETags).
+        
+        Runs one aggregate query instead of loading the listing; with no
+        filter the marker covers the full schedule.
+        
+        Args:
+            day: Day filter of a by-day listing
+            room_number: Room filter of a by-room listing
+            mentor_id: Mentor of a mentor schedule
+            student_id: Student of a student schedule
+            
+        Returns:
+            Tuple that changes whenever the listing's classes change
+        """
+        if student_id is not None:
+            return self.class_repo.student_fingerprint(student_id)
+        
+        criteria = []
+        if day is not None:
+            criteria.append(Class.day_of_week == day)
+        if room_number is not None:
+            criteria.append(Class.room_number == room_number)
+        if mentor_id is not None:
+            criteria.append(Class.mentor_id == mentor_id)
+        return self.class_repo.fingerprint(*criteria)
+    
     # ==================== Conflict Checking ====================
     
     def check_class_conflicts(
@@ -334,35 +431,39 @@ class ScheduleService:
         """
         Create a class with conflict validation.
         
+        The conflict check and the insert are one statement; the conflict
+        queries only run to explain a rejected insert.
+        
         Returns:
             dict with 'success', 'class' (if created), and 'conflicts' (if any)
         """
-        # Check for conflicts first
-        conflicts = self.check_class_conflicts(
+        class_obj = self.class_repo.insert_without_conflicts(
+            duration_minutes,
+            course_id=course_id,
+            mentor_id=mentor_id,
+            name=name,
             room_number=room_number,
             day_of_week=day_of_week,
-            schedule_time=schedule_time,
-            mentor_id=mentor_id,
-            duration_minutes=duration_minutes
+            schedule_time=schedule_time
         )
         
-        if conflicts['has_conflicts']:
+        if class_obj is None:
+            conflicts = self.check_class_conflicts(
+                room_number=room_number,
+                day_of_week=day_of_week,
+                schedule_time=schedule_time,
+                mentor_id=mentor_id,
+                duration_minutes=duration_minutes
+            )
+            if not conflicts['has_conflicts']:
+                raise ScheduleValidationError(f"Course with ID {course_id} does not exist")
             return {
                 'success': False,
                 'class': None,
                 'conflicts': conflicts
             }
         
-        # No conflicts, create the class
-        class_obj = self.create_class(
-            course_id=course_id,
-            name=name,
-            room_number=room_number,
-            day_of_week=day_of_week,
-            schedule_time=schedule_time,
-            mentor_id=mentor_id
-        )
-        
+        self.cache.invalidate_listings()
         return {
             'success': True,
             'class': class_obj,
@@ -118,28 +118,23 @@ class StatsService:
             Enrollment.class_id == class_id
         ).scalar() or 0
         
-        # Get all sessions for this class
-        sessions = self.db.query(AttendanceSession).filter(
+        # Count sessions and present/late records in SQL rather than
+        # loading every session's records
+        total_sessions = self.db.query(func.count(AttendanceSession.id)).filter(
             AttendanceSession.class_id == class_id
-        ).all()
-        
-        total_sessions = len(sessions)
+        ).scalar() or 0
         
         # Calculate average attendance rate across all sessions
         if total_sessions > 0 and total_enrolled > 0:
-            total_present = 0
-            total_expected = 0
-            
-            for session in sessions:
-                records = self.db.query(AttendanceRecord).filter(
-                    AttendanceRecord.session_id == session.id
-                ).all()
-                
-                present_count = sum(1 for r in records if r.status in ['present', 'late'])
-                total_present += present_count
-                total_expected += total_enrolled
+            total_present = self.db.query(func.count(AttendanceRecord.id)).join(
+                AttendanceSession, AttendanceRecord.session_id == AttendanceSession.id
+            ).filter(
+                AttendanceSession.class_id == class_id,
+                AttendanceRecord.status.in_(['present', 'late'])
+            ).scalar() or 0
+            total_expected = total_sessions * total_enrolled
             
-            average_attendance_rate = (total_present / total_expected * 100) if total_expected > 0 else 0.0
+            average_attendance_rate = total_present / total_expected * 100
         else:
             average_attendance_rate = 0.0
         
@@ -2,5 +2,6 @@
 Shared cache module implementing Singleton pattern.
 """
 from .cache_manager import CacheManager
+from .single_flight import SingleFlight
 
-__all__ = ['CacheManager']
+__all__ = ['CacheManager', 'SingleFlight']
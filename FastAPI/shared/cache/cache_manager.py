@@ -102,12 +102,12 @@ class CacheManager:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
 
-    def delete(self, key: str) -> bool:
+    def delete(self, *keys: str) -> bool:
         """
-        Delete value from cache.
+        Delete one or more values from cache in a single round trip.
         
         Args:
-            key: Cache key
+            keys: Cache keys
             
         Returns:
             True if deleted, False otherwise
@@ -115,10 +115,10 @@ class CacheManager:
         if not self._redis_client:
             return False
         try:
-            self._redis_client.delete(key)
+            self._redis_client.delete(*keys)
             return True
         except Exception as e:
-            logger.error(f"Cache delete error for key {key}: {e}")
+            logger.error(f"Cache delete error for keys {keys}: {e}")
             return False
 
     def invalidate(self, pattern: str) -> int:
@@ -134,14 +134,78 @@ class CacheManager:
         if not self._redis_client:
             return 0
         try:
-            keys = self._redis_client.keys(pattern)
-            if keys:
-                return self._redis_client.delete(*keys)
-            return 0
+            # SCAN walks the keyspace incrementally; KEYS would block Redis
+            deleted = 0
+            batch = []
+            for key in self._redis_client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += self._redis_client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self._redis_client.delete(*batch)
+            return deleted
         except Exception as e:
             logger.error(f"Cache invalidate error for pattern {pattern}: {e}")
             return 0
 
+    def set_indexed(self, key: str, value: str, index_key: str, ttl: int = 300) -> bool:
+        """
+        Set value in cache and record its key in an index set, in one round trip.
+        
+        The index lets a group of keys be invalidated without scanning the
+        keyspace (see invalidate_index). Its TTL is refreshed on every add,
+        so it expires together with its newest member.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            index_key: Set holding the keys of the group
+            ttl: Time to live in seconds (default 5 minutes)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._redis_client:
+            return False
+        try:
+            pipe = self._redis_client.pipeline(transaction=False)
+            pipe.setex(key, ttl, value)
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache set error for key {key}: {e}")
+            return False
+
+    def invalidate_index(self, index_key: str) -> int:
+        """
+        Invalidate every key recorded in an index set.
+        
+        Only the members read here are removed from the index, so a key
+        added concurrently stays indexed for the next invalidation.
+        
+        Args:
+            index_key: Set holding the keys of the group
+            
+        Returns:
+            Number of keys deleted
+        """
+        if not self._redis_client:
+            return 0
+        try:
+            keys = list(self._redis_client.smembers(index_key))
+            if not keys:
+                return 0
+            pipe = self._redis_client.pipeline()
+            pipe.delete(*keys)
+            pipe.srem(index_key, *keys)
+            return pipe.execute()[0]
+        except Exception as e:
+            logger.error(f"Cache invalidate error for index {index_key}: {e}")
+            return 0
+
     def exists(self, key: str) -> bool:
         """
         Check if key exists in cache.
@@ -2,9 +2,9 @@
 Cache decorators implementing Cache-Aside pattern.
 """
 import functools
-import json
 import asyncio
 from typing import Any, Callable, Optional
+from shared.serialization import json_dumps_str, json_loads
 from .cache_manager import CacheManager
 import logging
 
@@ -38,7 +38,7 @@ def cache_result(key_prefix: str, ttl: int = 300, key_func: Optional[Callable] =
                 cached_result = cache.get(cache_key)
                 if cached_result is not None:
                     logger.debug(f"Cache hit for key: {cache_key}")
-                    return json.loads(cached_result)
+                    return json_loads(cached_result)
             except Exception as e:
                 logger.warning(f"Cache get error for key {cache_key}: {e}")
             
@@ -48,7 +48,7 @@ def cache_result(key_prefix: str, ttl: int = 300, key_func: Optional[Callable] =
             
             # Store result in cache
             try:
-                cache.set(cache_key, json.dumps(result, default=str), ttl=ttl)
+                cache.set(cache_key, json_dumps_str(result), ttl=ttl)
                 logger.debug(f"Cached result for key: {cache_key}")
             except Exception as e:
                 logger.warning(f"Cache set error for key {cache_key}: {e}")
@@ -72,7 +72,7 @@ def cache_result(key_prefix: str, ttl: int = 300, key_func: Optional[Callable] =
                 cached_result = cache.get(cache_key)
                 if cached_result is not None:
                     logger.debug(f"Cache hit for key: {cache_key}")
-                    return json.loads(cached_result)
+                    return json_loads(cached_result)
             except Exception as e:
                 logger.warning(f"Cache get error for key {cache_key}: {e}")
             
@@ -82,7 +82,7 @@ def cache_result(key_prefix: str, ttl: int = 300, key_func: Optional[Callable] =
             
             # Store result in cache
             try:
-                cache.set(cache_key, json.dumps(result, default=str), ttl=ttl)
+                cache.set(cache_key, json_dumps_str(result), ttl=ttl)
                 logger.debug(f"Cached result for key: {cache_key}")
             except Exception as e:
                 logger.warning(f"Cache set error for key {cache_key}: {e}")
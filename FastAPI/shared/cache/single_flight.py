@@ -0,0 +1,73 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one execution of the
+loader instead of each hitting the database (thundering-herd protection
+for cache misses). Sync route handlers run in the threadpool, so this is
+thread-based rather than asyncio-based.
+"""
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class _Call:
+    """An in-flight execution that followers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into a single execution.
+
+    Usage:
+        flight = SingleFlight()
+        items = flight.do("schedule:day:monday", load_monday)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once per key at a time; concurrent callers get its result.
+
+        Only callers that overlap with a running execution share it; the
+        next call after it finishes runs fn again (pair with a cache).
+
+        Args:
+            key: Identity of the work
+            fn: Loader to run if no execution for key is in flight
+
+        Returns:
+            Result of fn
+
+        Raises:
+            Whatever fn raised, in the leader and in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -25,6 +25,7 @@ class ServerConfig(BaseSettings):
         cookie_secure: Whether cookies should only be sent over HTTPS
         cookie_samesite: SameSite cookie attribute (lax, strict, none)
         cookie_domain: Optional domain for cross-subdomain cookies
+        strict_loading: Raise on unplanned ORM lazy loads (development/testing only)
     """
     server_mode: ServerMode = ServerMode.USER
     server_port: int = 8000
@@ -38,6 +39,9 @@ class ServerConfig(BaseSettings):
     remember_me_max_age: int = 2592000  # 30 days
     user_cookie_max_age: int = 1800  # 30 minutes (same as access token)
     
+    # Query loading
+    strict_loading: bool = False  # Never enable in production
+    
     @field_validator('server_mode', mode='before')
     @classmethod
     def normalize_server_mode(cls, v):
@@ -1,17 +1,66 @@
 import os
-from typing import Optional
-from sqlalchemy import create_engine, Engine
-from sqlalchemy.orm import sessionmaker, Session
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+from sqlalchemy import create_engine, event, Engine
+from sqlalchemy.orm import ORMExecuteState, raiseload, sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
 from dotenv import load_dotenv
 import logging
 
+from shared.config.server_config import get_server_config
+from shared.serialization import json_dumps_str, json_loads
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
+def _use_pgbouncer() -> bool:
+    """
+    Set DB_PGBOUNCER=true when DATABASE_URL points at PgBouncer in
+    transaction pooling mode (usually port 6432). The bouncer multiplexes
+    Postgres backends, so the app-side pool stays small. Sessions hold no
+    connection-level state (SET, LISTEN, advisory locks) across
+    transactions, and psycopg2 never creates server-side prepared
+    statements, so transaction pooling is safe.
+    """
+    return os.getenv('DB_PGBOUNCER', 'false').lower() == 'true'
+
+
+def get_pool_limits() -> Tuple[int, int]:
+    """
+    Get the engine's (pool_size, max_overflow) from the environment.
+    
+    At most pool_size + max_overflow sessions can hold a connection at
+    once; the request threadpool is sized from this (see main.lifespan).
+    """
+    pgbouncer = _use_pgbouncer()
+    return (
+        int(os.getenv('DB_POOL_SIZE', '5' if pgbouncer else '20')),
+        int(os.getenv('DB_MAX_OVERFLOW', '5' if pgbouncer else '20')),
+    )
+
+
+def _raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """
+    STRICT_LOADING hook: add raiseload('*') to every top-level ORM SELECT.
+    
+    Relationships the query does not load through its own options then
+    raise on access instead of lazily issuing one query per row, so an
+    N+1 fails loudly in development and tests wherever the query was
+    built. Loads issued by the ORM itself (eager relationship loads,
+    refreshes) are left alone.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.is_column_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
 class DatabaseConnection:
     """
     Singleton class for managing database connection.
@@ -35,12 +84,26 @@ class DatabaseConnection:
             if not database_url:
                 raise ValueError("DATABASE_URL environment variable is not set")
 
+            pgbouncer = _use_pgbouncer()
+            pool_size, max_overflow = get_pool_limits()
+
             # Create SQLAlchemy engine
             self._engine = create_engine(
                 database_url,
                 echo=os.getenv('DB_ECHO', 'false').lower() == 'true',  # Enable SQL logging if needed
+                poolclass=QueuePool,
+                pool_size=pool_size,        # Connections kept open
+                max_overflow=max_overflow,  # Extra connections under burst load
+                pool_timeout=int(os.getenv('DB_POOL_TIMEOUT', '30')),  # Seconds to wait for a free connection
+                pool_recycle=int(os.getenv('DB_POOL_RECYCLE', '1800')),  # Recycle connections every 30 minutes
                 pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=300,    # Recycle connections every 5 minutes
+                # UUID(as_uuid=True) columns need no codec setup: the psycopg2
+                # dialect registers the driver's native uuid adapter on connect,
+                # so uuid.UUID values pass straight through without Python-side
+                # bind/result processing.
+                # JSON/JSONB columns are encoded and decoded with orjson
+                json_serializer=json_dumps_str,
+                json_deserializer=json_loads,
             )
 
             # Create session factory
@@ -50,7 +113,15 @@ class DatabaseConnection:
                 autoflush=False
             )
 
-            logger.info("Database connection initialized successfully")
+            if get_server_config().strict_loading:
+                event.listen(self._session_factory, "do_orm_execute", _raise_on_lazy_load)
+                logger.warning("STRICT_LOADING is enabled: unplanned lazy loads will raise")
+
+            logger.info(
+                "Database connection initialized successfully (%s%s)",
+                self._engine.pool.status(),
+                ", via PgBouncer" if pgbouncer else ""
+            )
 
         except Exception as e:
             logger.error(f"Failed to initialize database connection: {e}")
@@ -85,17 +156,43 @@ def get_db_session() -> Session:
     """
     Dependency function to get database session.
     Use this with FastAPI's Depends() for dependency injection.
+
+    Each request gets its own plain Session rather than one from a
+    scoped_session registry: sync dependencies and routes run on whichever
+    threadpool worker is free, so a thread-local scope could hand one
+    request's session to another. A new Session is cheap, and it only
+    checks a connection out of the engine's pool on first use.
     """
-    db_connection = DatabaseConnection()
-    session = db_connection.create_session()
+    session = DatabaseConnection().create_session()
     try:
-        # Ensure we start with a clean transaction state
+        yield session
+        session.commit()
+    except SQLAlchemyError as e:
         session.rollback()
+        logger.error(f"Database session error: {e}")
+        raise
+    finally:
+        session.close()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Context manager for a short-lived session outside of request dependencies
+    (e.g. WebSocket handlers, background tasks).
+    Commits on success, rolls back on error, and always returns the
+    connection to the shared engine's pool.
+    """
+    session = DatabaseConnection().create_session()
+    try:
         yield session
         session.commit()
     except SQLAlchemyError as e:
         session.rollback()
         logger.error(f"Database session error: {e}")
         raise
+    except Exception:
+        session.rollback()
+        raise
     finally:
         session.close()
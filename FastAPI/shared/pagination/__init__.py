@@ -0,0 +1,11 @@
+"""
+Shared pagination module (opaque keyset cursors for API listings).
+"""
+from .cursor import CREATED_CURSOR, encode_cursor, decode_cursor, decode_cursor_param
+
+__all__ = [
+    'CREATED_CURSOR',
+    'encode_cursor',
+    'decode_cursor',
+    'decode_cursor_param'
+]
@@ -0,0 +1,75 @@
+"""
+Keyset pagination cursor codec.
+
+A cursor holds the sort-key values of the last row of a page. Clients get
+it as an opaque URL-safe string (X-Next-Cursor header or next_cursor
+field) and send it back as ?cursor= to fetch the following page.
+"""
+from datetime import date, datetime, time
+from typing import Any, Callable, Optional, Tuple
+from uuid import UUID
+import base64
+
+from fastapi import HTTPException, status
+
+Cursor = Tuple[Any, ...]
+
+# Field parsers of listings paged by (created_at, id)
+CREATED_CURSOR: Tuple[Callable[[str], Any], ...] = (datetime.fromisoformat, UUID)
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(cursor: Optional[Cursor]) -> Optional[str]:
+    """
+    Encode a keyset cursor as an opaque string for API clients.
+    
+    Args:
+        cursor: Sort-key values of the last row, or None
+        
+    Returns:
+        URL-safe cursor string, or None when there is no next page
+    """
+    if cursor is None:
+        return None
+    raw = _SEPARATOR.join(
+        value.isoformat() if isinstance(value, (date, time)) else str(value)
+        for value in cursor
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(token: Optional[str], parsers: tuple) -> Optional[Cursor]:
+    """
+    Decode a cursor string produced by encode_cursor.
+    
+    Args:
+        token: Cursor string or None
+        parsers: One parser per sort-key field (e.g. CREATED_CURSOR)
+        
+    Returns:
+        Tuple of sort-key values, or None for the first page
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not token:
+        return None
+    try:
+        parts = base64.urlsafe_b64decode(token.encode()).decode().split(_SEPARATOR)
+        if len(parts) != len(parsers):
+            raise ValueError
+        return tuple(parse(part) for parse, part in zip(parsers, parts))
+    except ValueError:
+        raise ValueError("Invalid pagination cursor")
+
+
+def decode_cursor_param(token: Optional[str], parsers: tuple) -> Optional[Cursor]:
+    """Decode a pagination cursor query parameter, mapping errors to 400."""
+    try:
+        return decode_cursor(token, parsers)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
@@ -0,0 +1,14 @@
+"""
+Shared serialization module (orjson for JSON, optional msgpack for binary frames).
+"""
+from .json_codec import json_dumps, json_dumps_str, json_loads
+from .msgpack_codec import MSGPACK_AVAILABLE, msgpack_dumps, msgpack_loads
+
+__all__ = [
+    'json_dumps',
+    'json_dumps_str',
+    'json_loads',
+    'MSGPACK_AVAILABLE',
+    'msgpack_dumps',
+    'msgpack_loads'
+]
@@ -0,0 +1,57 @@
+"""
+JSON codec using orjson.
+
+orjson serializes UUID, datetime, date and time natively, so callers can
+hand it model values directly instead of converting each field with
+str()/isoformat() first.
+"""
+from typing import Any, Union
+import orjson
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson does not handle natively (e.g. Decimal)."""
+    return str(obj)
+
+
+# Accept non-string dict keys (e.g. ints) the way stdlib json does
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+def json_dumps_str(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string (for WebSocket text frames and Redis).
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(obj, default=_default, option=_OPTIONS).decode()
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON bytes or string.
+    
+    Args:
+        data: JSON document
+        
+    Returns:
+        Deserialized object
+    """
+    return orjson.loads(data)
@@ -0,0 +1,51 @@
+"""
+MessagePack codec for binary WebSocket frames.
+
+msgpack is optional: when it is not installed, MSGPACK_AVAILABLE is False
+and callers should stay on the JSON codec.
+"""
+from datetime import date, datetime, time
+from typing import Any
+from uuid import UUID
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Encode types msgpack lacks using the same text forms as the JSON codec."""
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to MessagePack bytes.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        MessagePack encoded bytes
+    """
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """
+    Deserialize MessagePack bytes.
+    
+    Args:
+        data: MessagePack document
+        
+    Returns:
+        Deserialized object
+    """
+    return msgpack.unpackb(data, raw=False)
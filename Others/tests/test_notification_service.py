@@ -11,6 +11,9 @@ fastapi_dir = str(Path(__file__).parent.parent.parent / "FastAPI")
 if fastapi_dir not in sys.path:
     sys.path.insert(0, fastapi_dir)
 
+import csv
+import io
+import json
 import pytest
 from uuid import uuid4, UUID
 from datetime import datetime
@@ -20,11 +23,18 @@ from sqlalchemy.orm import Session
 # Import components to test
 from services.notification_service.models.notification import Notification
 from services.notification_service.factory.notification_factory import NotificationFactory
-from services.notification_service.repositories.notification_repository import NotificationRepository
-from services.notification_service.services.notification_service import NotificationService
+from services.notification_service.repositories.notification_repository import NotificationRepository, COPY_THRESHOLD
+from services.notification_service.services.notification_service import (
+    NotificationService, BROADCAST_BATCH_SIZE, _invalidate_committed_users
+)
+from services.notification_service.schemas.request import BroadcastNotification
+from shared.pagination import CREATED_CURSOR, encode_cursor, decode_cursor
+from services.notification_service.cache.notification_cache import NotificationCache
 from services.notification_service.observer.subject import NotificationSubject
 from services.notification_service.observer.observer import INotificationObserver
-from services.notification_service.observer.websocket_observer import WebSocketObserver
+from services.notification_service.observer.websocket_observer import (
+    WebSocketObserver, PreparedNotification, SEND_QUEUE_SIZE
+)
 
 
 # ==================== Fixtures ====================
@@ -198,6 +208,13 @@ class TestNotificationFactory:
         assert "attendance_confirmed" in types
         assert "schedule_updated" in types
     
+    def test_is_persistent(self):
+        """Test live class toasts are transient and everything else is stored."""
+        assert NotificationFactory.is_persistent(NotificationFactory.CLASS_STARTED) is False
+        assert NotificationFactory.is_persistent(NotificationFactory.CLASS_ENDED) is False
+        assert NotificationFactory.is_persistent(NotificationFactory.CLASS_CANCELLED) is True
+        assert NotificationFactory.is_persistent(NotificationFactory.ATTENDANCE_CONFIRMED) is True
+    
     def test_notification_with_empty_data(self, sample_user_id):
         """Test creating notification with empty data."""
         notification = NotificationFactory.create_notification(
@@ -227,12 +244,66 @@ class TestNotificationRepository:
         mock_db_session.add.assert_called_once_with(sample_notification)
         mock_db_session.flush.assert_called_once()
     
+    def test_create_many_uses_single_returning_insert(self, notification_repository, sample_user_id, mock_db_session):
+        """Test bulk creation issues one INSERT ... RETURNING without per-row refresh."""
+        notifications = [
+            Notification(user_id=sample_user_id, type="test", title=f"Test {i}", message="Test")
+            for i in range(3)
+        ]
+        mock_db_session.get_bind.return_value.dialect.insert_executemany_returning = True
+        mock_db_session.scalars = MagicMock()
+        mock_db_session.scalars.return_value.all.return_value = notifications
+        
+        result = notification_repository.create_many(notifications)
+        
+        assert result == notifications
+        mock_db_session.scalars.assert_called_once()
+        assert len(mock_db_session.scalars.call_args.args[1]) == 3
+        mock_db_session.refresh.assert_not_called()
+    
+    def test_create_many_streams_large_batches_with_copy(self, notification_repository, mock_db_session):
+        """Test broadcasts above the COPY threshold are streamed with COPY FROM STDIN."""
+        notifications = [
+            Notification(user_id=uuid4(), type="test", title="Test, \"quoted\"", message="Test",
+                         data={"room": "101"})
+            for _ in range(COPY_THRESHOLD + 1)
+        ]
+        mock_db_session.get_bind.return_value.dialect.driver = "psycopg2"
+        mock_db_session.connection = MagicMock()
+        cursor = mock_db_session.connection.return_value.connection.cursor.return_value.__enter__.return_value
+        
+        result = notification_repository.create_many(notifications)
+        
+        assert result == notifications
+        assert all(n.id is not None and n.created_at is not None for n in result)
+        sql, buffer = cursor.copy_expert.call_args.args
+        assert sql.startswith("COPY notifications")
+        rows = list(csv.reader(io.StringIO(buffer.getvalue())))
+        assert len(rows) == COPY_THRESHOLD + 1
+        assert rows[0][3] == 'Test, "quoted"'
+        assert json.loads(rows[0][5]) == {"room": "101"}
+    
+    def test_copy_encodes_shared_data_once(self, notification_repository, mock_db_session, monkeypatch):
+        """Test rows sharing one data dict serialize it a single time."""
+        from services.notification_service.repositories import notification_repository as repo_module
+        shared_data = {"room": "101"}
+        notifications = [
+            Notification(user_id=uuid4(), type="test", title="Test", message="Test", data=shared_data)
+            for _ in range(COPY_THRESHOLD + 1)
+        ]
+        mock_db_session.get_bind.return_value.dialect.driver = "psycopg2"
+        mock_db_session.connection = MagicMock()
+        encode = MagicMock(side_effect=repo_module.json_dumps_str)
+        monkeypatch.setattr(repo_module, "json_dumps_str", encode)
+        
+        notification_repository.create_many(notifications)
+        
+        encode.assert_called_once_with(shared_data)
+    
     def test_find_by_id(self, notification_repository, sample_notification, mock_db_session):
         """Test finding notification by ID."""
-        # Setup mock query chain
-        mock_query = MagicMock()
-        mock_query.filter.return_value.first.return_value = sample_notification
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.scalars = MagicMock()
+        mock_db_session.scalars.return_value.first.return_value = sample_notification
         
         result = notification_repository.find_by_id(sample_notification.id)
         
@@ -245,20 +316,50 @@ class TestNotificationRepository:
             Notification(id=uuid4(), user_id=sample_user_id, type="test2", title="Test2", message="Test2"),
         ]
         
-        # Setup mock query chain
-        mock_query = MagicMock()
-        mock_query.filter.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = notifications
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.scalars = MagicMock()
+        mock_db_session.scalars.return_value.all.return_value = notifications
         
-        result = notification_repository.find_by_user(sample_user_id)
+        result, next_cursor = notification_repository.find_by_user(sample_user_id)
         
         assert len(result) == 2
+        assert next_cursor is None
+        mock_db_session.scalars.assert_called_once()
+    
+    def test_find_by_user_returns_next_cursor(self, notification_repository, sample_user_id, mock_db_session):
+        """Test keyset pagination returns the last row as cursor when more rows exist."""
+        notifications = [
+            Notification(id=uuid4(), user_id=sample_user_id, type="test", title="Test", message="Test",
+                         created_at=datetime(2024, 12, 10, 10, 30 - i))
+            for i in range(3)
+        ]
+        
+        mock_db_session.scalars = MagicMock()
+        mock_db_session.scalars.return_value.all.return_value = notifications
+        
+        cursor = (datetime(2024, 12, 10, 11, 0), uuid4())
+        result, next_cursor = notification_repository.find_by_user(sample_user_id, cursor=cursor, limit=2)
+        
+        assert result == notifications[:2]
+        assert next_cursor == (notifications[1].created_at, notifications[1].id)
+        # Seeks past the cursor instead of using OFFSET
+        sql = str(mock_db_session.scalars.call_args.args[0])
+        assert "OFFSET" not in sql
+        assert "(notifications.created_at, notifications.id) <" in sql
+    
+    def test_cursor_round_trip(self):
+        """Test pagination cursors survive encode/decode."""
+        cursor = (datetime(2024, 12, 10, 10, 30, 0, 123456), uuid4())
+        
+        token = encode_cursor(cursor)
+        
+        assert decode_cursor(token, CREATED_CURSOR) == cursor
+        assert decode_cursor(None, CREATED_CURSOR) is None
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", CREATED_CURSOR)
     
     def test_count_by_user(self, notification_repository, sample_user_id, mock_db_session):
         """Test counting notifications by user."""
-        mock_query = MagicMock()
-        mock_query.filter.return_value.count.return_value = 5
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.scalar = MagicMock(return_value=5)
         
         result = notification_repository.count_by_user(sample_user_id)
         
@@ -266,9 +367,7 @@ class TestNotificationRepository:
     
     def test_count_unread_by_user(self, notification_repository, sample_user_id, mock_db_session):
         """Test counting unread notifications by user."""
-        mock_query = MagicMock()
-        mock_query.filter.return_value.count.return_value = 3
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.scalar = MagicMock(return_value=3)
         
         result = notification_repository.count_unread_by_user(sample_user_id)
         
@@ -276,37 +375,60 @@ class TestNotificationRepository:
     
     def test_mark_as_read(self, notification_repository, sample_notification, mock_db_session):
         """Test marking notification as read."""
-        sample_notification.is_read = False
+        sample_notification.is_read = True
         
-        # Setup mock to return the notification
-        mock_query = MagicMock()
-        mock_query.filter.return_value.first.return_value = sample_notification
-        mock_db_session.query.return_value = mock_query
+        # UPDATE ... RETURNING yields the updated row
+        mock_db_session.scalars = MagicMock()
+        mock_db_session.scalars.return_value.one_or_none.return_value = sample_notification
         
         result = notification_repository.mark_as_read(sample_notification.id)
         
         assert result.is_read == True
+        mock_db_session.scalars.assert_called_once()
+        mock_db_session.query.assert_not_called()
+    
+    def test_mark_as_read_already_read(self, notification_repository, sample_notification, mock_db_session):
+        """Test marking an already-read notification falls back to a lookup."""
+        sample_notification.is_read = True
+        mock_db_session.scalars = MagicMock()
+        mock_db_session.scalars.return_value.one_or_none.return_value = None
+        mock_db_session.scalars.return_value.first.return_value = sample_notification
+        
+        result = notification_repository.mark_as_read(sample_notification.id)
+        
+        assert result is sample_notification
     
     def test_delete_notification(self, notification_repository, sample_notification, mock_db_session):
         """Test deleting a notification."""
-        mock_query = MagicMock()
-        mock_query.filter.return_value.first.return_value = sample_notification
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute = MagicMock()
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = sample_notification.user_id
         
         result = notification_repository.delete(sample_notification.id)
         
-        assert result == True
-        mock_db_session.delete.assert_called_once_with(sample_notification)
+        assert result == sample_notification.user_id
+        # Single DELETE ... RETURNING, no SELECT first
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.query.assert_not_called()
     
     def test_delete_nonexistent_notification(self, notification_repository, mock_db_session):
         """Test deleting a notification that doesn't exist."""
-        mock_query = MagicMock()
-        mock_query.filter.return_value.first.return_value = None
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute = MagicMock()
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = None
         
         result = notification_repository.delete(uuid4())
         
-        assert result == False
+        assert result is None
+    
+    def test_bulk_operations_skip_session_synchronization(self, notification_repository, sample_user_id, mock_db_session):
+        """Test bulk update/delete do not scan the identity map."""
+        query = mock_db_session.query.return_value.filter.return_value
+        query.update.return_value = 3
+        query.delete.return_value = 2
+        
+        assert notification_repository.mark_all_as_read(sample_user_id) == 3
+        assert notification_repository.delete_all_by_user(sample_user_id) == 2
+        query.update.assert_called_once_with({"is_read": True}, synchronize_session=False)
+        query.delete.assert_called_once_with(synchronize_session=False)
 
 
 # ==================== Observer Pattern Tests ====================
@@ -415,6 +537,27 @@ class TestNotificationSubject:
         # Cleanup
         subject.detach(observer1)
         subject.detach(observer2)
+    
+    def test_connected_users_count_across_shards(self):
+        """Test counting connected users whose IDs land in different shards."""
+        subject = NotificationSubject()
+        initial_count = subject.get_connected_users_count()
+        
+        observers = []
+        for user_id in ("00" + str(uuid4())[2:], "ff" + str(uuid4())[2:], "not-a-uuid"):
+            observer = MagicMock(spec=INotificationObserver)
+            observer.get_user_id.return_value = user_id
+            observer.is_active.return_value = True
+            subject.attach(observer)
+            observers.append(observer)
+        
+        assert subject.get_connected_users_count() == initial_count + 3
+        assert set(o.get_user_id() for o in observers) <= set(subject.iter_connected_users())
+        
+        # Cleanup
+        for observer in observers:
+            subject.detach(observer)
+        assert subject.get_connected_users_count() == initial_count
 
 
 # ==================== WebSocket Observer Tests ====================
@@ -449,26 +592,86 @@ class TestWebSocketObserver:
     async def test_update_sends_message(self):
         """Test that update sends message via WebSocket."""
         mock_websocket = MagicMock()
-        mock_websocket.send_json = AsyncMock()
+        mock_websocket.send_text = AsyncMock()
         
         observer = WebSocketObserver(mock_websocket, "test-user")
         notification = {"id": "123", "type": "test", "message": "Hello"}
         
         result = await observer.update(notification)
+        await observer.drain()
         
         assert result == True
-        mock_websocket.send_json.assert_called_once()
+        mock_websocket.send_text.assert_called_once()
         
         # Verify message format
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["type"] == "notification"
         assert call_args["payload"] == notification
     
+    @pytest.mark.asyncio
+    async def test_update_sends_msgpack_when_binary(self):
+        """Test that binary observers send msgpack frames."""
+        msgpack = pytest.importorskip("msgpack")
+        mock_websocket = MagicMock()
+        mock_websocket.send_bytes = AsyncMock()
+        
+        observer = WebSocketObserver(mock_websocket, "test-user", binary=True)
+        notification = {"id": uuid4(), "type": "test", "created_at": datetime.utcnow()}
+        
+        result = await observer.update(notification)
+        await observer.drain()
+        
+        assert result == True
+        message = msgpack.unpackb(mock_websocket.send_bytes.call_args[0][0], raw=False)
+        assert message["type"] == "notification"
+        assert message["payload"]["id"] == str(notification["id"])
+        assert message["payload"]["created_at"] == notification["created_at"].isoformat()
+    
+    @pytest.mark.asyncio
+    async def test_update_sends_prepared_frame_verbatim(self):
+        """Test that pre-encoded broadcast frames are sent without re-serializing."""
+        mock_websocket = AsyncMock()
+        observer = WebSocketObserver(mock_websocket, "user-123")
+        frame = '{"type":"notification","payload":{"id":"1"}}'
+        
+        result = await observer.update(PreparedNotification({"id": "1"}, frame))
+        await observer.drain()
+        
+        assert result == True
+        mock_websocket.send_text.assert_called_once_with(frame)
+    
+    @pytest.mark.asyncio
+    async def test_update_coalesces_burst_into_batch(self):
+        """Test that notifications arriving during a send go out as one batch frame."""
+        import asyncio
+        release = asyncio.Event()
+        sent = []
+        
+        async def slow_send(text):
+            sent.append(json.loads(text))
+            if len(sent) == 1:
+                await release.wait()
+        
+        mock_websocket = MagicMock()
+        mock_websocket.send_text = AsyncMock(side_effect=slow_send)
+        observer = WebSocketObserver(mock_websocket, "test-user")
+        
+        assert await observer.update({"id": "1"}) == True
+        await asyncio.sleep(0)
+        assert await observer.update({"id": "2"}) == True
+        assert await observer.update({"id": "3"}) == True
+        release.set()
+        await observer.drain()
+        
+        assert len(sent) == 2
+        assert sent[0] == {"type": "notification", "payload": {"id": "1"}}
+        assert sent[1] == {"type": "notification_batch", "payload": [{"id": "2"}, {"id": "3"}]}
+    
     @pytest.mark.asyncio
     async def test_update_fails_when_inactive(self):
         """Test that update fails when observer is inactive."""
         mock_websocket = MagicMock()
-        mock_websocket.send_json = AsyncMock()
+        mock_websocket.send_text = AsyncMock()
         
         observer = WebSocketObserver(mock_websocket, "test-user")
         observer.deactivate()
@@ -476,20 +679,58 @@ class TestWebSocketObserver:
         result = await observer.update({"test": "data"})
         
         assert result == False
-        mock_websocket.send_json.assert_not_called()
+        mock_websocket.send_text.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_update_handles_exception(self):
         """Test that update handles WebSocket exceptions."""
         mock_websocket = MagicMock()
-        mock_websocket.send_json = AsyncMock(side_effect=Exception("Connection closed"))
+        mock_websocket.send_text = AsyncMock(side_effect=Exception("Connection closed"))
         
         observer = WebSocketObserver(mock_websocket, "test-user")
         
-        result = await observer.update({"test": "data"})
+        assert await observer.update({"test": "data"}) == True  # queued
+        await observer.drain()
         
-        assert result == False
         assert observer.is_active() == False  # Should be deactivated after error
+        assert await observer.update({"test": "data"}) == False
+    
+    @pytest.mark.asyncio
+    async def test_update_does_not_wait_for_slow_client(self):
+        """Test publishers return immediately and a client that falls too far behind is dropped."""
+        import asyncio
+        release = asyncio.Event()
+        
+        async def stalled_send(text):
+            await release.wait()
+        
+        mock_websocket = MagicMock()
+        mock_websocket.send_text = AsyncMock(side_effect=stalled_send)
+        observer = WebSocketObserver(mock_websocket, "test-user")
+        
+        assert await observer.update({"id": "0"}) == True
+        await asyncio.sleep(0)  # writer picks up the first message and stalls
+        for i in range(SEND_QUEUE_SIZE):
+            assert await observer.update({"id": str(i + 1)}) == True
+        
+        assert await observer.update({"id": "overflow"}) == False
+        assert observer.is_active() == False
+        await observer.drain()
+    
+    @pytest.mark.asyncio
+    async def test_send_message_keeps_order_with_notifications(self):
+        """Test custom messages and notifications share one ordered queue."""
+        mock_websocket = MagicMock()
+        mock_websocket.send_text = AsyncMock()
+        observer = WebSocketObserver(mock_websocket, "test-user")
+        
+        await observer.send_message("connected", {})
+        await observer.update({"id": "1"})
+        await observer.send_message("unread_count", {"unread": 1})
+        await observer.drain()
+        
+        types = [json.loads(c.args[0])["type"] for c in mock_websocket.send_text.call_args_list]
+        assert types == ["connected", "notification", "unread_count"]
 
 
 # ==================== Service Tests ====================
@@ -525,14 +766,59 @@ class TestNotificationService:
     
     def test_get_notification_counts(self, notification_service, sample_user_id, mock_db_session):
         """Test getting notification counts."""
-        mock_query = MagicMock()
-        mock_query.filter.return_value.count.return_value = 10
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute = MagicMock()
+        mock_db_session.execute.return_value.one.return_value = (10, 4)
         
         counts = notification_service.get_notification_counts(sample_user_id)
         
-        assert "total" in counts
-        assert "unread" in counts
+        assert counts == {"total": 10, "unread": 4}
+        mock_db_session.execute.assert_called_once()
+    
+    def test_get_notification_counts_served_from_cache(self, notification_service, sample_user_id, mock_db_session):
+        """Test cached counts skip the database."""
+        notification_service.cache = MagicMock()
+        notification_service.cache.get_counts.return_value = {"total": 3, "unread": 1}
+        
+        counts = notification_service.get_notification_counts(sample_user_id)
+        
+        assert counts == {"total": 3, "unread": 1}
+        mock_db_session.execute.assert_not_called()
+    
+    def test_first_page_cache_round_trip(self, sample_user_id):
+        """Test cached first pages rebuild equivalent notifications."""
+        cache = NotificationCache()
+        store = {}
+        cache.cache = MagicMock()
+        cache.cache.set.side_effect = lambda key, value, ttl: store.__setitem__(key, value)
+        cache.cache.get.side_effect = store.get
+        notification = Notification(
+            id=uuid4(), user_id=sample_user_id, type="test", title="Test",
+            message="Test", data={"room": "101"}, is_read=False,
+            created_at=datetime(2024, 12, 10, 10, 30)
+        )
+        next_cursor = (notification.created_at, notification.id)
+        
+        cache.set_first_page(sample_user_id, False, ([notification], next_cursor))
+        notifications, cached_cursor = cache.get_first_page(sample_user_id, False)
+        
+        assert notifications[0].to_dict() == notification.to_dict()
+        assert cached_cursor == next_cursor
+        assert cache.get_first_page(sample_user_id, True) is None
+    
+    def test_delete_notification_invalidates_owner_cache(self, notification_service, sample_notification, mock_db_session):
+        """Test deleting a notification invalidates its owner's cached data once committed."""
+        mock_db_session.info = {}
+        mock_db_session.execute = MagicMock()
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = sample_notification.user_id
+        
+        with patch("services.notification_service.services.notification_service.NotificationCache") as cache_cls:
+            assert notification_service.delete_notification(sample_notification.id) is True
+            cache_cls.return_value.invalidate_users.assert_not_called()
+            
+            _invalidate_committed_users(mock_db_session)
+        
+        cache_cls.return_value.invalidate_users.assert_called_once_with({sample_notification.user_id})
+        assert mock_db_session.info == {}
     
     def test_mark_as_read(self, notification_service, mock_db_session):
         """Test marking notification as read."""
@@ -543,12 +829,11 @@ class TestNotificationService:
             type="test",
             title="Test",
             message="Test",
-            is_read=False
+            is_read=True
         )
         
-        mock_query = MagicMock()
-        mock_query.filter.return_value.first.return_value = mock_notification
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.scalars = MagicMock()
+        mock_db_session.scalars.return_value.one_or_none.return_value = mock_notification
         
         result = notification_service.mark_as_read(notification_id)
         
@@ -615,18 +900,126 @@ class TestNotificationFlow:
         """Test the complete create and broadcast flow."""
         service = NotificationService(mock_db_session)
         user_ids = [uuid4(), uuid4()]
+        service.repository.create_many = MagicMock(side_effect=lambda notifications: notifications)
+        service.subject = MagicMock()
+        service.subject.notify = AsyncMock(return_value=1)
+        
+        notifications = await service.create_and_broadcast(
+            notification_type=NotificationFactory.SCHEDULE_UPDATED,
+            user_ids=user_ids,
+            data={"class_name": "Test Class", "room": "101"}
+        )
         
-        # This tests the flow without actual WebSocket connections
-        # In real scenario, users would be connected via WebSocket
+        # Should create notifications for both users in one batch
+        service.repository.create_many.assert_called_once()
+        assert [n.user_id for n in notifications] == user_ids
+        assert service.subject.notify.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_create_and_broadcast_prepares_frames_for_connected_users_only(self, mock_db_session):
+        """Test broadcast skips offline users and pre-encodes each frame."""
+        service = NotificationService(mock_db_session)
+        online, offline = uuid4(), uuid4()
+        service.repository.create_many = MagicMock(side_effect=lambda notifications: [
+            Notification(id=uuid4(), user_id=n.user_id, type=n.type, title=n.title, message=n.message,
+                         data=n.data, is_read=False, created_at=datetime(2024, 12, 10, 10, 30))
+            for n in notifications
+        ])
+        service.subject = MagicMock()
+        service.subject.is_user_connected.side_effect = lambda user_id: user_id == str(online)
+        service.subject.notify = AsyncMock(return_value=1)
         
         notifications = await service.create_and_broadcast(
-            notification_type=NotificationFactory.CLASS_STARTED,
+            notification_type=NotificationFactory.SCHEDULE_UPDATED,
+            user_ids=[online, offline],
+            data={"class_name": "Test Class", "room": "101"}
+        )
+        
+        assert len(notifications) == 2
+        service.subject.notify.assert_awaited_once()
+        user_id, payload = service.subject.notify.await_args.args
+        assert user_id == str(online)
+        frame = json.loads(payload.frame)
+        assert frame["type"] == "notification"
+        assert frame["payload"]["user_id"] == str(online)
+        assert frame["payload"]["title"] == notifications[0].title
+    
+    @pytest.mark.asyncio
+    async def test_create_and_broadcast_survives_delivery_failure(self, mock_db_session):
+        """Test that a failed WebSocket delivery does not drop saved notifications."""
+        service = NotificationService(mock_db_session)
+        user_ids = [uuid4(), uuid4()]
+        service.repository.create_many = MagicMock(side_effect=lambda notifications: notifications)
+        service.subject = MagicMock()
+        service.subject.notify = AsyncMock(side_effect=[RuntimeError("socket closed"), 1])
+        
+        notifications = await service.create_and_broadcast(
+            notification_type=NotificationFactory.SCHEDULE_UPDATED,
+            user_ids=user_ids,
+            data={"class_name": "Test Class", "room": "101"}
+        )
+        
+        assert len(notifications) == 2
+    
+    @pytest.mark.asyncio
+    async def test_create_and_broadcast_processes_recipients_in_batches(self, mock_db_session):
+        """Test large broadcasts are saved and delivered one batch at a time."""
+        service = NotificationService(mock_db_session)
+        user_ids = [uuid4() for _ in range(BROADCAST_BATCH_SIZE * 2 + 1)]
+        service.repository.create_many = MagicMock(side_effect=lambda notifications: notifications)
+        service.cache = MagicMock()
+        service.subject = MagicMock()
+        service.subject.notify = AsyncMock(return_value=1)
+        
+        notifications = await service.create_and_broadcast(
+            notification_type=NotificationFactory.SCHEDULE_UPDATED,
             user_ids=user_ids,
             data={"class_name": "Test Class", "room": "101"}
         )
         
-        # Should create notifications for both users
-        assert mock_db_session.add.call_count == 2
+        batch_sizes = [len(call.args[0]) for call in service.repository.create_many.call_args_list]
+        assert batch_sizes == [BROADCAST_BATCH_SIZE, BROADCAST_BATCH_SIZE, 1]
+        assert [n.user_id for n in notifications] == user_ids
+        assert service.subject.notify.await_count == len(user_ids)
+    
+    @pytest.mark.asyncio
+    async def test_create_and_broadcast_transient_type_skips_database(self, mock_db_session):
+        """Test transient toasts reach connected users without being stored."""
+        service = NotificationService(mock_db_session)
+        online, offline = uuid4(), uuid4()
+        service.repository.create_many = MagicMock()
+        service.cache = MagicMock()
+        service.subject = MagicMock()
+        service.subject.is_user_connected.side_effect = lambda user_id: user_id == str(online)
+        service.subject.notify = AsyncMock(return_value=1)
+        
+        notifications = await service.create_and_broadcast(
+            notification_type=NotificationFactory.CLASS_STARTED,
+            user_ids=[online, offline],
+            data={"class_name": "Test Class", "room": "101"}
+        )
+        
+        assert notifications == []
+        service.repository.create_many.assert_not_called()
+        service.cache.invalidate_users.assert_not_called()
+        service.subject.notify.assert_awaited_once()
+        user_id, payload = service.subject.notify.await_args.args
+        assert user_id == str(online)
+        frame = json.loads(payload.frame)
+        assert frame["payload"]["transient"] is True
+        assert frame["payload"]["user_id"] == str(online)
+        assert frame["payload"]["message"] == "Test Class has started in Room 101"
+    
+    def test_broadcast_request_bounds_recipients(self):
+        """Test broadcast requests need between 1 and 10,000 recipients."""
+        from pydantic import ValidationError
+        fields = {"type": "system_announcement", "title": "Title", "message": "Message"}
+        
+        with pytest.raises(ValidationError):
+            BroadcastNotification(user_ids=[], **fields)
+        with pytest.raises(ValidationError):
+            BroadcastNotification(user_ids=[uuid4() for _ in range(10_001)], **fields)
+        assert len(BroadcastNotification(user_ids=[uuid4()], **fields).user_ids) == 1
     
     def test_notification_type_consistency(self):
         """Test that factory types match expected values."""
@@ -650,5 +1043,126 @@ class TestNotificationFlow:
             assert expected in actual_types, f"Missing type: {expected}"
 
 
+# ==================== Query Count Tests ====================
+#
+# Regression guard for the query budget of the notification endpoints:
+# every SQL statement the API emits against an in-memory database is
+# recorded via the before_cursor_execute event, and each test asserts an
+# upper bound. Listings also run with raiseload('*'), so an accidental
+# lazy load fails loudly instead of adding N queries.
+
+@pytest.fixture
+def sqlite_engine():
+    """In-memory database shared across threads (TestClient, to_thread)."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+    from shared.database.base import Base
+    from shared.models.user import User
+    
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine, tables=[User.__table__, Notification.__table__])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def query_counter(sqlite_engine):
+    """Record every SQL statement executed on the engine."""
+    from sqlalchemy import event
+    
+    statements = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(sqlite_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(sqlite_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def api_client(sqlite_engine):
+    """Notification API bound to the in-memory database."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy.orm import sessionmaker
+    from shared.database.connection import get_db_session
+    from services.notification_service.api.routes import router
+    
+    SessionLocal = sessionmaker(bind=sqlite_engine)
+    
+    def override_get_db_session():
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+    
+    app = FastAPI()
+    app.include_router(router, prefix="/api/notifications")
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    
+    with patch.object(NotificationCache, "get_counts", return_value=None), \
+         patch.object(NotificationCache, "get_first_page", return_value=None):
+        yield TestClient(app), SessionLocal
+
+
+class TestNotificationQueryCounts:
+    """Upper bounds on SQL statements per notification endpoint."""
+    
+    def test_list_endpoint_query_budget(self, api_client, query_counter, sample_user_id):
+        """Listing a page costs one SELECT plus one fused count."""
+        client, SessionLocal = api_client
+        with SessionLocal() as session:
+            NotificationRepository(session).create_many([
+                Notification(user_id=sample_user_id, type="test", title=f"Test {i}", message="Test")
+                for i in range(60)
+            ])
+            session.commit()
+        query_counter.clear()
+        
+        response = client.get(f"/api/notifications/user/{sample_user_id}", params={"limit": 50})
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["notifications"]) == 50
+        assert body["total"] == 60
+        assert body["has_more"] is True
+        assert len(query_counter) <= 2, query_counter
+        
+        # Following the cursor costs a single SELECT (no count)
+        query_counter.clear()
+        response = client.get(
+            f"/api/notifications/user/{sample_user_id}",
+            params={"limit": 50, "cursor": body["next_cursor"]}
+        )
+        
+        assert len(response.json()["notifications"]) == 10
+        assert len(query_counter) <= 1, query_counter
+    
+    def test_broadcast_endpoint_query_budget(self, api_client, query_counter):
+        """Broadcasting to 100 users inserts every row in one statement."""
+        client, _ = api_client
+        user_ids = [str(uuid4()) for _ in range(100)]
+        query_counter.clear()
+        
+        response = client.post("/api/notifications/broadcast", json={
+            "user_ids": user_ids,
+            "type": NotificationFactory.SCHEDULE_UPDATED,
+            "title": "Schedule Updated",
+            "message": "Your class schedule has been updated",
+            "data": {"class_name": "Test Class"}
+        })
+        
+        assert response.status_code == 201
+        assert len(response.json()) == 100
+        assert len(query_counter) <= 2, query_counter
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
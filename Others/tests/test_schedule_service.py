@@ -4,7 +4,10 @@ This tests all functionality step by step.
 
 Run this after:
 1. Creating tables: python create_tables.py
-2. Starting server: uvicorn main:app --reload
+2. Starting server: STRICT_LOADING=true uvicorn main:app --reload
+
+With STRICT_LOADING, any query that reintroduces a lazy load (N+1) makes
+its endpoint fail with a 500 instead of passing silently.
 """
 import requests
 import json
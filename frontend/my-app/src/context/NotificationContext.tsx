@@ -110,10 +110,18 @@ export function NotificationProvider({ children }: { children: ReactNode }) {
         socket.onmessage = (event) => {
             try {
                 const data = JSON.parse(event.data);
-                if (data.type === 'notification') {
-                    const newNotification = data.payload as Notification;
-                    setNotifications((prev) => [newNotification, ...prev]);
-                    setUnreadCount((prev) => prev + 1);
+                // Bursts arrive coalesced as a single notification_batch frame
+                const incoming: Notification[] =
+                    data.type === 'notification' ? [data.payload as Notification]
+                    : data.type === 'notification_batch' ? (data.payload as Notification[])
+                    : [];
+
+                for (const newNotification of incoming) {
+                    // Transient toasts are not stored, so keep them out of the list
+                    if (!newNotification.transient) {
+                        setNotifications((prev) => [newNotification, ...prev]);
+                        setUnreadCount((prev) => prev + 1);
+                    }
 
                     // Show toast notification
                     toast({
@@ -31,8 +31,15 @@ export function useNotifications(): UseNotificationsReturn {
     onMessage: (message) => {
       if (message.type === 'notification') {
         const newNotification = message.payload as Notification;
+        // Transient toasts are not stored, so keep them out of the list
+        if (newNotification.transient) return;
         setNotifications((prev) => [newNotification, ...prev]);
         setUnreadCount((prev) => prev + 1);
+      } else if (message.type === 'notification_batch') {
+        // Oldest first in the batch; newest ends up at the top of the list
+        const batch = (message.payload as Notification[]).filter((n) => !n.transient);
+        setNotifications((prev) => [...batch.slice().reverse(), ...prev]);
+        setUnreadCount((prev) => prev + batch.length);
       }
     },
   });
@@ -46,7 +53,7 @@ export function useNotifications(): UseNotificationsReturn {
     try {
       const response = await notificationApi.getByUser(user.id);
       setNotifications(response.data.notifications);
-      setUnreadCount(response.data.unread_count);
+      setUnreadCount(response.data.unread_count ?? 0);
     } catch (err) {
       setError('Failed to fetch notifications');
       console.error('Fetch notifications error:', err);
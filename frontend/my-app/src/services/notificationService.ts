@@ -13,6 +13,8 @@ export interface Notification {
   data?: Record<string, unknown>;
   is_read: boolean;
   created_at: string;
+  // Live toast delivered over WebSocket only; not stored on the server
+  transient?: boolean;
 }
 
 export interface NotificationCreate {
@@ -33,9 +35,11 @@ export interface BroadcastNotification {
 
 export interface NotificationListResponse {
   notifications: Notification[];
-  total: number;
-  unread_count: number;
-  skip: number;
+  // Only present on the first page
+  total: number | null;
+  unread_count: number | null;
+  has_more: boolean;
+  next_cursor: string | null;
   limit: number;
 }
 
@@ -47,15 +51,17 @@ export interface NotificationCounts {
 // Notification API
 export const notificationApi = {
   // Get notifications for a user
-  getByUser: (userId: string, skip = 0, limit = 50) =>
+  // Pass the previous page's next_cursor to fetch the following page
+  getByUser: (userId: string, cursor?: string, limit = 50) =>
     api.get<NotificationListResponse>(`/api/notifications/user/${userId}`, {
-      params: { skip, limit },
+      params: { cursor, limit },
     }),
 
   // Get unread notifications
-  getUnread: (userId: string, skip = 0, limit = 50) =>
+  // The next page cursor is returned in the X-Next-Cursor response header
+  getUnread: (userId: string, cursor?: string, limit = 50) =>
     api.get<Notification[]>(`/api/notifications/user/${userId}/unread`, {
-      params: { skip, limit },
+      params: { cursor, limit },
     }),
 
   // Get notification counts
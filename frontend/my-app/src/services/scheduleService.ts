@@ -89,9 +89,10 @@ export interface CreateWithValidationResult {
 }
 
 // Course API
+// List endpoints page by cursor; the next one is in the X-Next-Cursor header
 export const courseApi = {
-  getAll: (skip = 0, limit = 100) =>
-    api.get<Course[]>('/api/schedule/courses', { params: { skip, limit } }),
+  getAll: (cursor?: string, limit = 100) =>
+    api.get<Course[]>('/api/schedule/courses', { params: { cursor, limit } }),
 
   getById: (id: string) =>
     api.get<Course>(`/api/schedule/courses/${id}`),
@@ -118,8 +119,8 @@ export const courseApi = {
 
 // Class API
 export const classApi = {
-  getAll: (skip = 0, limit = 100) =>
-    api.get<Class[]>('/api/schedule/classes', { params: { skip, limit } }),
+  getAll: (cursor?: string, limit = 100) =>
+    api.get<Class[]>('/api/schedule/classes', { params: { cursor, limit } }),
 
   getById: (id: string) =>
     api.get<Class>(`/api/schedule/classes/${id}`),
@@ -150,14 +151,14 @@ export const classApi = {
     }),
 
   // Schedule filtering
-  getByStudent: (studentId: string, skip = 0, limit = 100) =>
-    api.get<Class[]>(`/api/schedule/schedule/student/${studentId}`, { params: { skip, limit } }),
+  getByStudent: (studentId: string, cursor?: string, limit = 100) =>
+    api.get<Class[]>(`/api/schedule/schedule/student/${studentId}`, { params: { cursor, limit } }),
 
-  getByMentor: (mentorId: string, skip = 0, limit = 100) =>
-    api.get<Class[]>(`/api/schedule/schedule/mentor/${mentorId}`, { params: { skip, limit } }),
+  getByMentor: (mentorId: string, cursor?: string, limit = 100) =>
+    api.get<Class[]>(`/api/schedule/schedule/mentor/${mentorId}`, { params: { cursor, limit } }),
 
-  getFullSchedule: (skip = 0, limit = 100) =>
-    api.get<Class[]>('/api/schedule/schedule/full', { params: { skip, limit } }),
+  getFullSchedule: (cursor?: string, limit = 100) =>
+    api.get<Class[]>('/api/schedule/schedule/full', { params: { cursor, limit } }),
 
   getByDay: (day: string) =>
     api.get<Class[]>(`/api/schedule/schedule/day/${day}`),
@@ -171,6 +172,10 @@ export const enrollmentApi = {
   enroll: (data: EnrollmentCreate) =>
     api.post<Enrollment>('/api/schedule/enrollments', data),
 
+  // Already-enrolled pairs are skipped; returns only the new enrollments
+  enrollMany: (items: EnrollmentCreate[]) =>
+    api.post<Enrollment[]>('/api/schedule/enrollments/bulk', items),
+
   unenroll: (studentId: string, classId: string) =>
     api.delete(`/api/schedule/enrollments/${studentId}/${classId}`),
 